@@ -0,0 +1,3 @@
+from .cube import Aggregate, Histogram, ResultCube
+
+__all__ = ["Aggregate", "Histogram", "ResultCube"]
@@ -0,0 +1,279 @@
+"""
+Materialized aggregates of results, by event, division and age group.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Iterable
+
+import pyrox.models as models
+from pyrox.io.reader import ResultsReader, ResultsTable
+from pyrox.io.writer import SPLITS, TIME_COLUMNS, flatten_splits
+
+# the width of histogram bins, in seconds; quantiles are exact to within a bin
+BIN_SECONDS = 5
+
+# the suffix of the file in which a cube is stored, next to its results file
+_SUFFIX = ".cube.json"
+
+# the label of a missing event, division or age group, as in results files
+_UNKNOWN = "unknown"
+
+# (event name, division name, age group)
+_Key = tuple[str, str, str]
+
+
+class Histogram:
+    """A sparse histogram of durations, in fixed-width bins."""
+
+    def __init__(self, bins: dict[int, int] | None = None) -> None:
+        # the number of durations in each bin, by bin index
+        self.bins: dict[int, int] = bins if bins is not None else {}
+
+    def __len__(self) -> int:
+        return sum(self.bins.values())
+
+    def add(self, seconds: int) -> None:
+        """
+        Add a duration.
+        :param seconds: The duration, in seconds
+        """
+        b = seconds // BIN_SECONDS
+        self.bins[b] = self.bins.get(b, 0) + 1
+
+    def merge(self, other: Histogram) -> None:
+        """
+        Add every duration in another histogram.
+        :param other: The other histogram
+        """
+        for b, n in other.bins.items():
+            self.bins[b] = self.bins.get(b, 0) + n
+
+    def quantile(self, q: float) -> timedelta | None:
+        """
+        Estimate a quantile, interpolating within its bin.
+        :param q: The quantile, in [0, 1]
+        :return: The estimate, or None if the histogram is empty
+        """
+        total = len(self)
+        if total == 0:
+            return None
+
+        target = q * total
+        seen = 0
+        for b in sorted(self.bins):
+            n = self.bins[b]
+            if seen + n >= target:
+                return timedelta(seconds=(b + (target - seen) / n) * BIN_SECONDS)
+            seen += n
+        return timedelta(seconds=(max(self.bins) + 1) * BIN_SECONDS)
+
+
+class Aggregate:
+    """Aggregates over a set of results."""
+
+    def __init__(self) -> None:
+        # the number of finishers; DNFs are not listed in rankings, so never counted
+        self.finishers = 0
+        # the number of finishers with splits
+        self.with_splits = 0
+        # finish times
+        self.finish = Histogram()
+        # split times of the finishers with splits, by split column
+        self.splits = {name: Histogram() for name in SPLITS}
+
+    def median(self) -> timedelta | None:
+        """Get the median finish time."""
+        return self.finish.quantile(0.5)
+
+    def percentile(self, split: str, p: float) -> timedelta | None:
+        """
+        Get a percentile of a split.
+        :param split: The split column, e.g. 'run_1' or 'sled_push'
+        :param p: The percentile, in [0, 100]
+        :return: The estimate, or None if no finisher has splits
+        """
+        return self.splits[split].quantile(p / 100)
+
+    def merge(self, other: Aggregate) -> None:
+        """
+        Add every result aggregated in another aggregate.
+        :param other: The other aggregate
+        """
+        self.finishers += other.finishers
+        self.with_splits += other.with_splits
+        self.finish.merge(other.finish)
+        for name in SPLITS:
+            self.splits[name].merge(other.splits[name])
+
+    def _add(self, finish: int, splits: list[int] | None) -> None:
+        """Add a result's finish time and, if known, its splits, in seconds."""
+        self.finishers += 1
+        self.finish.add(finish)
+        if splits is not None:
+            self.with_splits += 1
+            for name, seconds in zip(SPLITS, splits):
+                self.splits[name].add(seconds)
+
+    def _to_json(self) -> dict[str, Any]:
+        return {
+            "finishers": self.finishers,
+            "with_splits": self.with_splits,
+            "finish": self.finish.bins,
+            "splits": {name: h.bins for name, h in self.splits.items()},
+        }
+
+    @staticmethod
+    def _from_json(data: dict[str, Any]) -> Aggregate:
+        a = Aggregate()
+        a.finishers = data["finishers"]
+        a.with_splits = data["with_splits"]
+        a.finish = Histogram({int(b): n for b, n in data["finish"].items()})
+        for name, bins in data["splits"].items():
+            a.splits[name] = Histogram({int(b): n for b, n in bins.items()})
+        return a
+
+
+class ResultCube:
+    """
+    Aggregates of results for every event × division × age group, answering
+    slice queries without reading results back.
+    """
+
+    def __init__(self) -> None:
+        # the aggregate of each cell
+        self.cells: dict[_Key, Aggregate] = {}
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def add(
+        self,
+        event: str | None,
+        division: models.DivisionName | None,
+        result: models.Result,
+    ) -> None:
+        """
+        Add a result.
+        :param event: The name of the event
+        :param division: The name of the division
+        :param result: The result
+        """
+        splits = flatten_splits(result.splits) if result.splits is not None else None
+        self._cell(
+            event if event is not None else _UNKNOWN,
+            str(division) if division is not None else _UNKNOWN,
+            str(result.age_group) if result.age_group is not None else _UNKNOWN,
+        )._add(int(result.time.total_seconds()), splits)
+
+    def add_table(self, table: ResultsTable) -> None:
+        """
+        Add the results in a table read with `ResultsReader.read_table`.
+        :param table: A table with the columns in `TIME_COLUMNS`
+        """
+        columns = [table[name] for name in TIME_COLUMNS]
+        events, divisions, age_groups, finish, has_splits = columns[:5]
+        splits = columns[5:]
+        for i in range(len(table)):
+            self._cell(events[i], divisions[i], age_groups[i])._add(
+                int(finish[i]),
+                [int(s[i]) for s in splits] if has_splits[i] else None,
+            )
+
+    def merge(self, other: ResultCube) -> None:
+        """
+        Add every result aggregated in another cube.
+        :param other: The other cube
+        """
+        for key, cell in other.cells.items():
+            self._cell(*key).merge(cell)
+
+    def slice(
+        self,
+        events: Iterable[str] | None = None,
+        divisions: Iterable[models.DivisionName] | None = None,
+        age_groups: Iterable[models.AgeGroup] | None = None,
+    ) -> Aggregate:
+        """
+        Aggregate the cells in a slice of the cube.
+        :param events: Include only these events, or every event if None
+        :param divisions: Include only these divisions, or every division if None
+        :param age_groups: Include only these age groups, or every age group if None
+        :return: The aggregate over the slice
+        """
+        wanted = [
+            {str(x) for x in values} if values is not None else None
+            for values in (events, divisions, age_groups)
+        ]
+        total = Aggregate()
+        for key, cell in self.cells.items():
+            if all(w is None or k in w for k, w in zip(key, wanted)):
+                total.merge(cell)
+        return total
+
+    def save(self, path: Path) -> None:
+        """
+        Write the cube to a file, replacing it atomically.
+        :param path: The path to the cube file
+        """
+        data = [[*key, cell._to_json()] for key, cell in self.cells.items()]
+        tmp = path.with_name(f"{path.name}.tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        tmp.replace(path)
+
+    @staticmethod
+    def load(path: Path) -> ResultCube:
+        """
+        Read a cube from a file.
+        :param path: The path to the cube file
+        :return: The cube
+        """
+        cube = ResultCube()
+        for event, division, age_group, cell in json.loads(path.read_text()):
+            cube.cells[(event, division, age_group)] = Aggregate._from_json(cell)
+        return cube
+
+    @staticmethod
+    def build(results: Path) -> ResultCube:
+        """
+        Build a cube from a results file.
+        :param results: The path to the results file
+        :return: The cube
+        """
+        cube = ResultCube()
+        cube.add_table(ResultsReader(results).read_table(TIME_COLUMNS))
+        return cube
+
+    @staticmethod
+    def open(results: Path) -> ResultCube:
+        """
+        Get the cube stored next to a results file, building it if missing.
+        :param results: The path to the results file
+        :return: The cube, empty if the results file does not exist
+        """
+        path = ResultCube.path_for(results)
+        if path.exists():
+            return ResultCube.load(path)
+        if results.exists():
+            return ResultCube.build(results)
+        return ResultCube()
+
+    @staticmethod
+    def path_for(results: Path) -> Path:
+        """
+        Get the path at which the cube of a results file is stored.
+        :param results: The path to the results file
+        :return: The path to the cube file
+        """
+        return results.with_name(f"{results.name}{_SUFFIX}")
+
+    def _cell(self, event: str, division: str, age_group: str) -> Aggregate:
+        """Get the aggregate of a cell, creating it if necessary."""
+        key = (event, division, age_group)
+        cell = self.cells.get(key)
+        if cell is None:
+            cell = self.cells[key] = Aggregate()
+        return cell
@@ -0,0 +1,80 @@
+"""
+Unit tests for the result cube.
+"""
+
+from datetime import timedelta
+from pathlib import Path
+
+from pydantic import HttpUrl
+
+import pyrox.models as models
+from pyrox.io.writer import ResultsWriter
+
+from .cube import BIN_SECONDS, ResultCube
+
+
+def _result(position: int) -> models.Result:
+    return models.Result(
+        position=position,
+        position_ag=position,
+        name=f"Athlete {position}",
+        age_group=models.AgeGroup.AG_30_34 if position % 2 == 0 else None,
+        time=timedelta(seconds=3600 + 7 * position),
+        url=HttpUrl(f"https://www.hyresult.com/result/R{position}"),
+        splits=(
+            models.Splits(
+                runs=[timedelta(seconds=240 + position + i) for i in range(8)],
+                stations={name: timedelta(seconds=180) for name in models.Station},
+            )
+            if position % 3 == 0
+            else None
+        ),
+    )
+
+
+def test_result_cube_slices(tmp_path: Path) -> None:
+    """Slices aggregate the matching cells, whether built incrementally or from a file."""
+
+    path = tmp_path / "results.csv"
+    men = [_result(i + 1) for i in range(100)]
+    women = [_result(i + 1) for i in range(50)]
+    ResultsWriter("chicago_2025", models.DivisionName.ELITE_MEN).write(men, path)
+    ResultsWriter("chicago_2025", models.DivisionName.ELITE_WOMEN).write(
+        women, path, append=True
+    )
+
+    cube = ResultCube()
+    for r in men:
+        cube.add("chicago_2025", models.DivisionName.ELITE_MEN, r)
+    for r in women:
+        cube.add("chicago_2025", models.DivisionName.ELITE_WOMEN, r)
+
+    # the same aggregates are built from the results file, and survive a round trip
+    cube.save(ResultCube.path_for(path))
+    for other in [ResultCube.build(path), ResultCube.open(path)]:
+        assert other.cells.keys() == cube.cells.keys()
+        for key, cell in cube.cells.items():
+            assert other.cells[key].finish.bins == cell.finish.bins
+            assert {n: h.bins for n, h in other.cells[key].splits.items()} == {
+                n: h.bins for n, h in cell.splits.items()
+            }
+
+    everything = cube.slice()
+    assert everything.finishers == 150
+    assert everything.with_splits == 33 + 16
+
+    men_30_34 = cube.slice(
+        divisions=[models.DivisionName.ELITE_MEN], age_groups=[models.AgeGroup.AG_30_34]
+    )
+    assert men_30_34.finishers == 50
+
+    median = men_30_34.median()
+    exact = sorted(r.time for r in men if r.age_group is not None)[25]
+    assert median is not None
+    assert abs(median - exact) <= timedelta(seconds=2 * BIN_SECONDS)
+
+    # every sled push took 180 seconds; the estimate falls within its bin
+    sled_push = men_30_34.percentile("sled_push", 90)
+    assert sled_push is not None
+    assert timedelta(seconds=180) <= sled_push < timedelta(seconds=180 + BIN_SECONDS)
+    assert cube.slice(events=["glasgow_2025"]).median() is None
@@ -0,0 +1,443 @@
+"""
+Command-line interface.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pyrox.models as models
+from pyrox.client import Hyrox
+from pyrox.client.changes import ChangeFeed, write_changes
+from pyrox.client.fetch import Fetcher
+from pyrox.client.live import LiveTracker
+from pyrox.io.archive import PageArchive
+from pyrox.io.store import ResultStore
+from pyrox.jobs.backfill import BackfillJob
+from pyrox.jobs.loader import MultiEventLoader
+from pyrox.jobs.manifest import Manifest
+from pyrox.jobs.queue import LEASE, TaskQueue
+from pyrox.jobs.rescrape import RescrapeJob
+from pyrox.jobs.worker import QueueWorker, merge_parts, parts_dir
+from pyrox.live import LiveServer
+from pyrox.logging import create_logger
+from pyrox.scrapers.pool import ScrapePool
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the command-line interface.
+    :param argv: The command-line arguments, defaults to `sys.argv[1:]`
+    :return: The exit code
+    """
+    args = _parser().parse_args(argv)
+
+    logger = create_logger(level=logging.DEBUG if args.verbose else logging.WARNING)
+    if args.command == "rescrape":
+        return _rescrape(logger, args)
+    if args.command == "queue" and args.action == "status":
+        return _status(args)
+    if args.command == "queue" and args.action == "merge":
+        return _merge(args)
+
+    archive = PageArchive(args.archive) if args.archive is not None else None
+    fetcher = Fetcher(args.rate_limit, args.cache, logger, archive)
+
+    if args.command == "events":
+        return _events(Hyrox(logger, fetcher=fetcher), args)
+    if args.command == "live":
+        # live rankings change between polls, so are never served from the cache
+        live = Fetcher(args.rate_limit, None, logger, archive)
+        return _live(Hyrox(logger, fetcher=live), logger, args)
+    if args.command == "changes":
+        # changes are diffed against current rankings, never served from the cache
+        fresh = Fetcher(args.rate_limit, None, logger, archive)
+        return _changes(Hyrox(logger, fetcher=fresh), args)
+    if args.command == "queue" and args.action == "enqueue":
+        return _enqueue(Hyrox(logger, fetcher=fetcher), args)
+
+    store = ResultStore(args.store) if args.store is not None else None
+    pool = ScrapePool(args.processes) if args.processes > 0 else None
+    try:
+        client = Hyrox(logger, pool, fetcher, store)
+        if args.command == "queue":
+            return _work(client, args)
+        if args.command == "backfill":
+            return _backfill(client, args)
+        return _load(client, args)
+    finally:
+        if pool is not None:
+            pool.close()
+        if store is not None:
+            store.close()
+
+
+def _events(client: Hyrox, args: argparse.Namespace) -> int:
+    """List events, with an optional date range."""
+    for event in client.events(after=args.after, before=args.before):
+        print(f"{event.model.date:%Y-%m-%d}  {event.model.canonical_name}")
+    return 0
+
+
+def _load(client: Hyrox, args: argparse.Namespace) -> int:
+    """Run the job described by a manifest."""
+    manifest = Manifest.load(args.manifest)
+
+    start = time.perf_counter()
+
+    loader = MultiEventLoader(client)
+    n = loader.load(
+        _event_names(client, manifest),
+        set(manifest.divisions),
+        manifest.output,
+        splits=manifest.splits,
+        profile=manifest.profile,
+        workers=args.workers,
+        resume=args.resume,
+        select=manifest.selection(),
+        top=manifest.top,
+        profiling=args.profiling,
+    )
+
+    _summary(client, n, time.perf_counter() - start)
+    return 0
+
+
+def _backfill(client: Hyrox, args: argparse.Namespace) -> int:
+    """Estimate, then run, a backfill of the date range described by a manifest."""
+    manifest = Manifest.load(args.manifest)
+
+    job = BackfillJob(client)
+    plan = job.plan(
+        set(manifest.divisions),
+        after=manifest.after,
+        before=manifest.before,
+        splits=manifest.splits,
+        profile=manifest.profile,
+        top=manifest.top,
+        event_names=set(manifest.events) or None,
+    )
+    print(plan.report())
+    if args.dry_run:
+        return 0
+
+    start = time.perf_counter()
+
+    n = job.run(
+        plan,
+        manifest.output,
+        workers=args.workers,
+        resume=args.resume,
+        select=manifest.selection(),
+        progress=lambda p: print(p, file=sys.stderr),
+        profiling=args.profiling,
+    )
+
+    _summary(client, n, time.perf_counter() - start)
+    return 0
+
+
+def _enqueue(client: Hyrox, args: argparse.Namespace) -> int:
+    """Queue a task for each event and division described by a manifest."""
+    manifest = Manifest.load(args.manifest)
+    tasks = [
+        (event_name, division_name)
+        for event_name in sorted(_event_names(client, manifest))
+        for division_name in manifest.divisions
+    ]
+    with TaskQueue(args.queue) as queue:
+        n = queue.extend(tasks)
+    print(f"tasks: {n} added, {len(tasks) - n} already queued")
+    return 0
+
+
+def _work(client: Hyrox, args: argparse.Namespace) -> int:
+    """Load tasks claimed from a queue until it is drained."""
+    manifest = Manifest.load(args.manifest)
+
+    start = time.perf_counter()
+
+    with TaskQueue(args.queue, lease=timedelta(seconds=args.lease)) as queue:
+        worker = QueueWorker(
+            client,
+            queue,
+            parts_dir(manifest.output),
+            splits=manifest.splits,
+            profile=manifest.profile,
+            workers=args.workers,
+            select=manifest.selection(),
+            top=manifest.top,
+            chunk=args.chunk,
+        )
+        n = worker.run()
+
+    _summary(client, n, time.perf_counter() - start)
+    return 0
+
+
+def _status(args: argparse.Namespace) -> int:
+    """Count the tasks in a queue by state."""
+    with TaskQueue(args.queue) as queue:
+        counts = queue.counts()
+    print(", ".join(f"{state}: {n}" for state, n in counts.items()))
+    return 0
+
+
+def _merge(args: argparse.Namespace) -> int:
+    """Merge the output of the finished tasks in a queue."""
+    manifest = Manifest.load(args.manifest)
+    with TaskQueue(args.queue) as queue:
+        n = merge_parts(
+            queue, parts_dir(manifest.output), manifest.output, force=args.force
+        )
+    print(f"results: {n}")
+    return 0
+
+
+def _event_names(client: Hyrox, manifest: Manifest) -> set[str]:
+    """Get the names of the events described by a manifest."""
+    return set(manifest.events) or {
+        e.model.canonical_name
+        for e in client.events(after=manifest.after, before=manifest.before)
+    }
+
+
+def _summary(client: Hyrox, n: int, elapsed: float) -> None:
+    """Print the fetch and result counts of a loading run."""
+    # imported on first use; humanize is slow to import
+    import humanize
+
+    stats = client.fetcher.stats
+    print(
+        f"pages: {stats.pages} ({stats.cached} cached), results: {n}, "
+        f"bytes: {humanize.naturalsize(stats.bytes)}, seconds: {elapsed:.1f} "
+        f"({stats.pages / elapsed:.1f} pages/s, {n / elapsed:.1f} results/s)"
+    )
+
+
+def _live(client: Hyrox, logger: logging.Logger, args: argparse.Namespace) -> int:
+    """Track an in-progress event and serve its updates over a websocket."""
+    tracker = LiveTracker(
+        client.event(args.event), args.divisions, splits=args.splits, logger=logger
+    )
+    server = LiveServer(
+        tracker, args.host, args.port, timedelta(seconds=args.interval), logger
+    )
+    try:
+        server.run()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _changes(client: Hyrox, args: argparse.Namespace) -> int:
+    """Write the changes to divisions since a snapshot as a change log."""
+    feed = ChangeFeed(client)
+    out = args.output.open("w") if args.output is not None else sys.stdout
+    try:
+        for division in args.divisions:
+            changes = feed.changes(
+                args.snapshot,
+                args.event,
+                division,
+                splits=args.splits,
+                profile=args.profile,
+                workers=args.workers,
+            )
+            write_changes(changes, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def _rescrape(logger: logging.Logger, args: argparse.Namespace) -> int:
+    """Rebuild results from a page archive."""
+    start = time.perf_counter()
+
+    job = RescrapeJob(PageArchive(args.source), logger, args.processes)
+    n = job.load(args.output)
+
+    elapsed = time.perf_counter() - start
+    print(f"results: {n}, seconds: {elapsed:.1f}")
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(prog="pyrox", description="Hyrox results jobs.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+    parser.add_argument(
+        "--cache", type=Path, default=None, help="directory for cached pages"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="maximum network requests per second",
+    )
+    parser.add_argument(
+        "--archive", type=Path, default=None, help="directory archiving fetched pages"
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=None,
+        help="database of splits and profile URLs, reused across runs",
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    events = commands.add_parser("events", help="list events")
+    events.add_argument("--after", type=datetime.fromisoformat, default=None)
+    events.add_argument("--before", type=datetime.fromisoformat, default=None)
+
+    load = commands.add_parser("load", help="load results described by a manifest")
+    load.add_argument("manifest", type=Path, help="JSON or TOML job manifest")
+    load.add_argument(
+        "--workers", type=int, default=1, help="results enriched concurrently"
+    )
+    load.add_argument(
+        "--processes", type=int, default=0, help="processes for scraping pages"
+    )
+    load.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip divisions already completely written to the output",
+    )
+    load.add_argument(
+        "--profiling",
+        type=Path,
+        default=None,
+        metavar="REPORT",
+        help="profile the run, writing a per-stage report to this path",
+    )
+
+    backfill = commands.add_parser(
+        "backfill",
+        help="load every division of interest in a manifest's date range, largest first",
+    )
+    backfill.add_argument("manifest", type=Path, help="JSON or TOML job manifest")
+    backfill.add_argument(
+        "--workers", type=int, default=1, help="results enriched concurrently"
+    )
+    backfill.add_argument(
+        "--processes", type=int, default=0, help="processes for scraping pages"
+    )
+    backfill.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip divisions already completely written to the output",
+    )
+    backfill.add_argument(
+        "--dry-run", action="store_true", help="only estimate the cost of the backfill"
+    )
+    backfill.add_argument(
+        "--profiling",
+        type=Path,
+        default=None,
+        metavar="REPORT",
+        help="profile the run, writing a per-stage report to this path",
+    )
+
+    queue = commands.add_parser(
+        "queue", help="load results across processes and hosts through a shared queue"
+    )
+    actions = queue.add_subparsers(dest="action", required=True)
+
+    enqueue = actions.add_parser(
+        "enqueue", help="queue the divisions described by a manifest"
+    )
+    enqueue.add_argument("queue", type=Path, help="queue database file")
+    enqueue.add_argument("manifest", type=Path, help="JSON or TOML job manifest")
+
+    work = actions.add_parser("work", help="load queued divisions until none are left")
+    work.add_argument("queue", type=Path, help="queue database file")
+    work.add_argument("manifest", type=Path, help="JSON or TOML job manifest")
+    work.add_argument(
+        "--workers", type=int, default=1, help="results enriched concurrently"
+    )
+    work.add_argument(
+        "--processes", type=int, default=0, help="processes for scraping pages"
+    )
+    work.add_argument(
+        "--chunk",
+        type=int,
+        default=None,
+        help="split divisions into tasks of this many results",
+    )
+    work.add_argument(
+        "--lease",
+        type=float,
+        default=LEASE.total_seconds(),
+        help="seconds a task is leased without a heartbeat",
+    )
+
+    status = actions.add_parser("status", help="count queued tasks by state")
+    status.add_argument("queue", type=Path, help="queue database file")
+
+    merge = actions.add_parser(
+        "merge", help="merge the output of finished tasks into the manifest output"
+    )
+    merge.add_argument("queue", type=Path, help="queue database file")
+    merge.add_argument("manifest", type=Path, help="JSON or TOML job manifest")
+    merge.add_argument("--force", action="store_true", help="overwrite the output")
+
+    live = commands.add_parser(
+        "live", help="track an in-progress event and serve updates over a websocket"
+    )
+    live.add_argument("event", help="the name of the event")
+    live.add_argument(
+        "--division",
+        dest="divisions",
+        type=models.DivisionName,
+        action="append",
+        required=True,
+        help="a division to track; may be repeated",
+    )
+    live.add_argument("--splits", action="store_true", help="broadcast new splits")
+    live.add_argument("--interval", type=float, default=30.0, help="poll seconds")
+    live.add_argument("--host", default="127.0.0.1", help="websocket address")
+    live.add_argument("--port", type=int, default=8765, help="websocket port")
+
+    changes = commands.add_parser(
+        "changes", help="diff divisions against a snapshot, as a change log"
+    )
+    changes.add_argument(
+        "snapshot", type=Path, help="results file holding the snapshot"
+    )
+    changes.add_argument("event", help="the name of the event")
+    changes.add_argument(
+        "--division",
+        dest="divisions",
+        type=models.DivisionName,
+        action="append",
+        required=True,
+        help="a division to diff; may be repeated",
+    )
+    changes.add_argument("--splits", action="store_true", help="compare splits")
+    changes.add_argument("--profile", action="store_true", help="compare profile URLs")
+    changes.add_argument(
+        "--workers", type=int, default=1, help="results enriched concurrently"
+    )
+    changes.add_argument(
+        "--output", type=Path, default=None, help="change log path, or standard output"
+    )
+
+    rescrape = commands.add_parser(
+        "rescrape", help="rebuild results from a page archive, offline"
+    )
+    rescrape.add_argument("source", type=Path, help="page archive directory")
+    rescrape.add_argument("output", type=Path, help="path to which results are written")
+    rescrape.add_argument(
+        "--processes", type=int, default=None, help="processes for scraping segments"
+    )
+
+    return parser
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,3 @@
-from .client import Hyrox
+from .client import Hyrox, prefetch
 
-__all__ = ["Hyrox"]
+__all__ = ["Hyrox", "prefetch"]
@@ -0,0 +1,232 @@
+"""
+Change feeds between a stored snapshot and a fresh scrape of results.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, NamedTuple
+
+import pyrox.models as models
+from pyrox.io.reader import ResultsReader
+from pyrox.io.writer import flatten_splits, unflatten_splits
+
+from .client import Hyrox
+
+
+class ChangeKind(StrEnum):
+    """An enumeration over the kinds of change to a result."""
+
+    # a result not in the snapshot
+    ADDED = "added"
+    # a result in the snapshot, no longer listed
+    REMOVED = "removed"
+    # a result whose fields differ from the snapshot
+    CHANGED = "changed"
+
+
+class Change(NamedTuple):
+    """A change to a result, keyed by its URL."""
+
+    # the kind of change
+    kind: ChangeKind
+    # the name of the event
+    event: str
+    # the name of the division
+    division: models.DivisionName
+    # the result URL
+    url: str
+    # the new values of the changed fields, every field if added, none if removed;
+    # times are in seconds, and splits are 8 run seconds followed by 8 station seconds
+    fields: dict[str, Any]
+
+
+class ChangeFeed:
+    """
+    Diff a division between a stored snapshot and a fresh scrape.
+
+    The client's fetcher must not cache pages, and its store is not consulted,
+    so every result is compared as it is now.
+    """
+
+    def __init__(self, client: Hyrox) -> None:
+        """
+        Create a change feed.
+        :param client: The client
+        :raises: ValueError if the client's fetcher caches pages
+        """
+        if client.fetcher.cache is not None:
+            raise ValueError("change feeds require a fetcher that does not cache")
+
+        # the client, without its store, so stored splits are scraped again
+        self.client = Hyrox(client.logger, client.pool, client.fetcher)
+        # inherit the client's logger
+        self.logger = self.client.logger
+
+    def changes(
+        self,
+        snapshot: Path,
+        event_name: str,
+        division_name: models.DivisionName,
+        splits: bool = False,
+        profile: bool = False,
+        workers: int = 1,
+    ) -> list[Change]:
+        """
+        Scrape a division and diff it against a results file.
+        :param snapshot: The path to a results file holding the division
+        :param event_name: The name of the event
+        :param division_name: The name of the division
+        :param splits: Scrape and compare splits
+        :param profile: Scrape and compare profile URLs
+        :param workers: The number of results enriched concurrently
+        :return: The changes since the snapshot
+        """
+        before = [
+            r.result
+            for r in ResultsReader(snapshot).read([event_name], [division_name])
+        ]
+        after = [
+            r.model
+            for r in self.client.iter_results(
+                event_name, division_name, splits, profile, workers=workers
+            )
+        ]
+        changes = diff(before, after, event_name, division_name, splits, profile)
+        self.logger.info(
+            f"division '{division_name}' at event '{event_name}': {len(changes)} changes"
+        )
+        return changes
+
+
+def diff(
+    before: Iterable[models.Result],
+    after: Iterable[models.Result],
+    event: str,
+    division: models.DivisionName,
+    splits: bool = False,
+    profile: bool = False,
+) -> list[Change]:
+    """
+    Diff two listings of a division, keyed by result URL.
+    :param before: The results in the snapshot
+    :param after: The results now
+    :param event: The name of the event
+    :param division: The name of the division
+    :param splits: Compare splits, where fetched in `after`
+    :param profile: Compare profile URLs, where fetched in `after`
+    :return: The changes, in the order of `after`, followed by removals
+    """
+    old = {str(r.url): _encode(r, splits, profile) for r in before}
+
+    changes: list[Change] = []
+    for r in after:
+        url = str(r.url)
+        new = _encode(r, splits, profile)
+        previous = old.pop(url, None)
+        if previous is None:
+            changes.append(Change(ChangeKind.ADDED, event, division, url, new))
+        else:
+            changed = {k: v for k, v in new.items() if previous[k] != v}
+            # splits and profiles that could not be fetched are unknown, not removed
+            for fetched in ("splits", "profile"):
+                if fetched in changed and changed[fetched] is None:
+                    del changed[fetched]
+            if len(changed) > 0:
+                changes.append(
+                    Change(ChangeKind.CHANGED, event, division, url, changed)
+                )
+    for url in old:
+        changes.append(Change(ChangeKind.REMOVED, event, division, url, {}))
+    return changes
+
+
+def apply(
+    results: Iterable[models.Result], changes: Iterable[Change]
+) -> list[models.Result]:
+    """
+    Apply changes to a listing of a division.
+    :param results: The results in the snapshot
+    :param changes: The changes, for the same division
+    :return: The results with the changes applied, in ranking order
+    """
+    by_url = {str(r.url): r for r in results}
+    for change in changes:
+        if change.kind == ChangeKind.REMOVED:
+            by_url.pop(change.url, None)
+            continue
+        previous = by_url.get(change.url)
+        data = previous.model_dump() if previous is not None else {"url": change.url}
+        data.update(_decode(change.fields))
+        by_url[change.url] = models.Result.model_validate(data)
+    return sorted(by_url.values(), key=lambda r: r.position)
+
+
+def write_changes(changes: Iterable[Change], out: IO[str]) -> int:
+    """
+    Write changes as a change log, one compact JSON object per line.
+    :param changes: The changes
+    :param out: The text stream to which the log is written
+    :return: The number of changes written
+    """
+    n = 0
+    for change in changes:
+        entry: dict[str, Any] = {
+            "op": str(change.kind),
+            "event": change.event,
+            "division": str(change.division),
+            "url": change.url,
+        }
+        if len(change.fields) > 0:
+            entry["fields"] = change.fields
+        out.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        n += 1
+    return n
+
+
+def read_changes(lines: Iterable[str]) -> Iterator[Change]:
+    """
+    Read changes back from a change log.
+    :param lines: The lines of the log
+    :return: An iterator over the changes
+    """
+    for line in lines:
+        if line.strip() == "":
+            continue
+        entry = json.loads(line)
+        yield Change(
+            ChangeKind(entry["op"]),
+            entry["event"],
+            models.DivisionName(entry["division"]),
+            entry["url"],
+            entry.get("fields", {}),
+        )
+
+
+def _encode(r: models.Result, splits: bool, profile: bool) -> dict[str, Any]:
+    """Encode the compared fields of a result as compact JSON-compatible values."""
+    values: dict[str, Any] = {
+        "position": r.position,
+        "position_ag": r.position_ag,
+        "name": r.name,
+        "age_group": str(r.age_group) if r.age_group is not None else None,
+        "time": int(r.time.total_seconds()),
+    }
+    if splits:
+        values["splits"] = flatten_splits(r.splits) if r.splits is not None else None
+    if profile:
+        values["profile"] = str(r.profile) if r.profile is not None else None
+    return values
+
+
+def _decode(fields: dict[str, Any]) -> dict[str, Any]:
+    """Decode encoded fields to result model data."""
+    data = dict(fields)
+    if "time" in data:
+        data["time"] = timedelta(seconds=data["time"])
+    if data.get("splits") is not None:
+        data["splits"] = unflatten_splits(data["splits"])
+    return data
@@ -4,27 +4,50 @@ Hyrox results client.
 
 from __future__ import annotations
 
+import heapq
 import logging
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Callable, Iterable, Iterator
 
-import requests
-from bs4 import BeautifulSoup
 from pydantic import HttpUrl
 
 import pyrox.models as models
 from pyrox.config import BASE_URL
+from pyrox.io.store import ResultStore
+from pyrox.parsers.name import fold_name
+from pyrox.scrapers.athlete import AthleteScraper
+from pyrox.scrapers.base import scrape_page
 from pyrox.scrapers.division import DivisionScraper
 from pyrox.scrapers.event import EventScraper
+from pyrox.scrapers.pool import ScrapePool
+from pyrox.scrapers.profile import ProfileScraper
 from pyrox.scrapers.result import ResultScraper
 from pyrox.scrapers.splits import SplitsScraper
 
+from .fetch import Fetcher
+
 
 class Hyrox:
     """A client for Hyrox results from hyresult.com."""
 
-    def __init__(self, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger = logging.getLogger(__name__),
+        pool: ScrapePool | None = None,
+        fetcher: Fetcher | None = None,
+        store: ResultStore | None = None,
+    ) -> None:
         self.logger = logger
+        # optional process pool for scraping ranking and splits pages
+        self.pool = pool
+        # the fetcher shared by all requests made through the client
+        self.fetcher = fetcher if fetcher is not None else Fetcher(logger=logger)
+        # optional persistent store of splits and profile URLs
+        self.store = store
 
     def events(
         self, *, after: datetime | None = None, before: datetime | None = None
@@ -37,13 +60,15 @@ class Hyrox:
         """
         self.logger.info("fetching all events")
 
-        res = requests.get("https://www.hyresult.com/events?tab=all")
-        res.raise_for_status()
-
+        # concurrent callers share a single request and parse of the events page
         scraper = EventScraper(self.logger)
+        scraped = self.fetcher.parse(
+            f"{BASE_URL}/events?tab=all",
+            "events",
+            lambda content: scrape_page(content, scraper.scrape),
+        )
         events = [
-            Event(e, self.logger)
-            for e in scraper.scrape(BeautifulSoup(res.content, "html.parser"))
+            Event(e, self.logger, self.pool, self.fetcher, self.store) for e in scraped
         ]
 
         self.logger.info(f"found {len(events)} events")
@@ -81,6 +106,11 @@ class Hyrox:
         profile: bool = False,
         retry: int = 8,
         poll_interval: timedelta = timedelta(seconds=1),
+        workers: int = 1,
+        prefetch: int = 1,
+        lazy: bool = False,
+        select: Callable[[models.Result], bool] | None = None,
+        top: int | None = None,
     ) -> list[Result]:
         """
         Get results for the specified division at the specified event.
@@ -90,18 +120,112 @@ class Hyrox:
         :param profile: Enrich results with athlete profile URLs
         :param retry: The number of retries for operations
         :param poll_interval: The poll interval for operations
+        :param workers: The number of results enriched concurrently
+        :param prefetch: The number of ranking pages fetched ahead
+        :param lazy: Fetch splits and profile on first access, instead of up front
+        :param select: Enrich only the results for which this returns True
+        :param top: Enrich only the first `top` results in ranking order
         :return: The collection of results
         """
         event = self.event(event_name)
-        return event.results(division_name, splits, profile, retry, poll_interval)
+        return event.results(
+            division_name,
+            splits,
+            profile,
+            retry,
+            poll_interval,
+            workers,
+            prefetch,
+            lazy,
+            select,
+            top,
+        )
+
+    def iter_results(
+        self,
+        event_name: str,
+        division_name: models.DivisionName,
+        splits: bool = False,
+        profile: bool = False,
+        retry: int = 8,
+        poll_interval: timedelta = timedelta(seconds=1),
+        workers: int = 1,
+        prefetch: int = 1,
+        lazy: bool = False,
+        select: Callable[[models.Result], bool] | None = None,
+        top: int | None = None,
+    ) -> Iterator[Result]:
+        """
+        Stream results for the specified division at the specified event.
+        :param event_name: The name of the event
+        :param division_name: The name of the division
+        :param splits: Enrich results with detailed splits data
+        :param profile: Enrich results with athlete profile URLs
+        :param retry: The number of retries for operations
+        :param poll_interval: The poll interval for operations
+        :param workers: The number of results enriched concurrently
+        :param prefetch: The number of ranking pages fetched ahead of the consumer
+        :param lazy: Fetch splits and profile on first access, instead of up front
+        :param select: Enrich only the results for which this returns True
+        :param top: Enrich only the first `top` results in ranking order
+        :return: An iterator over results
+        """
+        event = self.event(event_name)
+        return event.iter_results(
+            division_name,
+            splits,
+            profile,
+            retry,
+            poll_interval,
+            workers,
+            prefetch,
+            lazy,
+            select,
+            top,
+        )
+
+    def athlete(self, profile: str | HttpUrl) -> Athlete:
+        """
+        Get an athlete from their profile page.
+        :param profile: The athlete profile URL, or the athlete slug (e.g. 'hunter-mcintyre')
+        :raises: ValueError if the profile cannot be parsed
+        :return: The athlete
+        """
+        url = str(profile)
+        if not url.startswith("http"):
+            url = f"{BASE_URL}/athlete/{url.strip('/')}"
+
+        self.logger.info(f"fetching athlete profile '{url}'")
+
+        scraper = AthleteScraper(self.logger)
+        model = self.fetcher.parse(
+            url,
+            "athlete",
+            lambda content: scrape_page(
+                content, lambda soup: scraper.scrape(soup, HttpUrl(url))
+            ),
+        )
+
+        self.logger.info(f"found {len(model.races)} races for athlete '{model.name}'")
+        return Athlete(model, self.logger)
 
 
 class Event:
     """A Hyrox event."""
 
-    def __init__(self, model: models.Event, logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        model: models.Event,
+        logger: logging.Logger,
+        pool: ScrapePool | None = None,
+        fetcher: Fetcher | None = None,
+        store: ResultStore | None = None,
+    ) -> None:
         self.model = model
         self.logger = logger
+        self.pool = pool
+        self.fetcher = fetcher if fetcher is not None else Fetcher(logger=logger)
+        self.store = store
 
     def results(
         self,
@@ -110,6 +234,11 @@ class Event:
         profile: bool = False,
         retry: int = 8,
         poll_interval: timedelta = timedelta(seconds=1),
+        workers: int = 1,
+        prefetch: int = 1,
+        lazy: bool = False,
+        select: Callable[[models.Result], bool] | None = None,
+        top: int | None = None,
     ) -> list[Result]:
         """
         Get the results from an event for the specified division.
@@ -118,35 +247,124 @@ class Event:
         :param profile: Enrich results with athlete profile URLs
         :param retry: The number of retries for operations
         :param poll_interval: The poll interval for operations
+        :param workers: The number of results enriched concurrently
+        :param prefetch: The number of ranking pages fetched ahead
+        :param lazy: Fetch splits and profile on first access, instead of up front
+        :param select: Enrich only the results for which this returns True
+        :param top: Enrich only the first `top` results in ranking order
         :return: The collection of results
         """
         self.logger.info(
             f"fetching results for division '{division_name}' at event '{self.model.canonical_name}'"
         )
 
+        results = list(
+            self.iter_results(
+                division_name,
+                splits,
+                profile,
+                retry,
+                poll_interval,
+                workers,
+                prefetch,
+                lazy,
+                select,
+                top,
+            )
+        )
+        self.logger.info(f"fetched {len(results)} results for division")
+
+        # results whose splits were retried are streamed last; restore ranking order
+        results.sort(key=lambda r: r.model.position)
+
+        return results
+
+    def iter_results(
+        self,
+        division_name: models.DivisionName,
+        splits: bool = False,
+        profile: bool = False,
+        retry: int = 8,
+        poll_interval: timedelta = timedelta(seconds=1),
+        workers: int = 1,
+        prefetch: int = 1,
+        lazy: bool = False,
+        select: Callable[[models.Result], bool] | None = None,
+        top: int | None = None,
+    ) -> Iterator[Result]:
+        """
+        Stream the results from an event for the specified division, in ranking order;
+        results whose splits are not yet available are retried once the rest of the
+        division is processed, and follow it.
+        :param division_name: The name of the division
+        :param splits: Enrich results with detailed splits data
+        :param profile: Enrich results with athlete profile URLs
+        :param retry: The number of retries for operations
+        :param poll_interval: The poll interval for operations
+        :param workers: The number of results enriched concurrently
+        :param prefetch: The number of ranking pages fetched ahead of the consumer
+        :param lazy: Fetch splits and profile on first access, instead of up front
+        :param select: Enrich only the results for which this returns True
+        :param top: Enrich only the first `top` results in ranking order
+        :return: An iterator over results
+        """
         # get the requested division
-        division = self._division(division_name)
+        division = self.division(division_name)
         self.logger.info(f"found division '{division.model.name}'")
 
-        # get the results from the division
-        results = division.results()
-        self.logger.info(f"fetched {len(results)} results for division")
+        if not (splits or profile or lazy):
+            yield from division.iter_results(prefetch)
+            return
 
-        if splits or profile:
-            enricher = ResultEnricher(retry, poll_interval, self.logger)
-            for i, result in enumerate(results):
-                self.logger.info(
-                    f"[{i + 1} / {len(results)}] enriching result for athlete '{result.model.name}'"
-                )
-                try:
-                    result = enricher.enrich(result, splits, profile)
-                except RuntimeError as e:
-                    self.logger.warning(
-                        f"failed to enrich result for athlete '{result.model.name}': {e}"
-                    )
-                    continue
+        enricher = ResultEnricher(
+            retry, poll_interval, self.logger, self.pool, self.fetcher, self.store
+        )
 
-        return results
+        def selected(i: int, r: Result) -> bool:
+            """Determine if the `i`th result is selected for enrichment."""
+            return (top is None or i < top) and (select is None or select(r.model))
+
+        if lazy:
+            for i, result in enumerate(division.iter_results(prefetch)):
+                if selected(i, result):
+                    result.defer(enricher)
+                yield result
+            return
+
+        # results already in the store need no page fetches
+        results = enricher.recall(division.iter_pages(prefetch), splits, profile)
+
+        n = division.model.n_finishers
+        deferred = _DeferredRetries(enricher, splits, profile)
+
+        # enrich up to two results per worker ahead of the consumer
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: deque[Future[tuple[Result, bool]]] = deque()
+            try:
+                for i, result in enumerate(results):
+                    if not selected(i, result):
+                        # pass through in order, without any page fetches
+                        skipped: Future[tuple[Result, bool]] = Future()
+                        skipped.set_result((result, True))
+                        pending.append(skipped)
+                    else:
+                        self.logger.info(
+                            f"[{i + 1} / {n}] enriching result for athlete '{result.model.name}'"
+                        )
+                        pending.append(
+                            executor.submit(
+                                _try_enrich, enricher, result, splits, profile
+                            )
+                        )
+                    if len(pending) >= 2 * workers:
+                        yield from deferred.offer(*pending.popleft().result())
+                while len(pending) > 0:
+                    yield from deferred.offer(*pending.popleft().result())
+
+                # revisit results whose splits were not yet available
+                yield from deferred.drain(executor, 2 * workers)
+            finally:
+                executor.shutdown(cancel_futures=True)
 
     def result(
         self,
@@ -173,15 +391,69 @@ class Event:
         )
 
         # get the requested division
-        division = self._division(division_name)
+        division = self.division(division_name)
 
         result = division.result(athlete_name)
         self.logger.info(f"found result for athlete '{athlete_name}'")
 
-        enricher = ResultEnricher(retry, poll_interval, self.logger)
+        enricher = ResultEnricher(
+            retry, poll_interval, self.logger, self.pool, self.fetcher, self.store
+        )
         return enricher.enrich(result, splits, profile) if splits or profile else result
 
-    def _division(self, name: models.DivisionName) -> _Division:
+    def results_for(
+        self,
+        division_name: models.DivisionName,
+        athlete_names: Iterable[str],
+        splits: bool = False,
+        profile: bool = False,
+        retry: int = 8,
+        poll_interval: timedelta = timedelta(seconds=1),
+    ) -> dict[str, Result]:
+        """
+        Get the results from an event for the specified division and athletes,
+        in a single pass over the division rankings.
+        :param division_name: The name of the division
+        :param athlete_names: The names of the athletes
+        :param splits: Enrich results with detailed splits data
+        :param profile: Enrich results with athlete profile URLs
+        :param retry: The number of retries for operations
+        :param poll_interval: The poll interval for operations
+        :return: The results for the athletes that were found, keyed by requested name
+        """
+        athlete_names = list(athlete_names)
+        self.logger.info(
+            f"fetching results for {len(athlete_names)} athletes in division '{division_name}' at event '{self.model.canonical_name}'"
+        )
+
+        # get the requested division
+        division = self.division(division_name)
+
+        found = division.results_for(athlete_names)
+        self.logger.info(f"found results for {len(found)} athletes")
+
+        for name in athlete_names:
+            if name not in found:
+                self.logger.warning(f"result for athlete '{name}' not found")
+
+        if splits or profile:
+            enricher = ResultEnricher(
+                retry, poll_interval, self.logger, self.pool, self.fetcher, self.store
+            )
+            # results already in the store need no page fetches
+            for _ in enricher.recall([list(found.values())], splits, profile):
+                pass
+            for name, result in found.items():
+                try:
+                    enricher.enrich(result, splits, profile)
+                except RuntimeError as e:
+                    self.logger.warning(
+                        f"failed to enrich result for athlete '{name}': {e}"
+                    )
+
+        return found
+
+    def division(self, name: models.DivisionName) -> Division:
         """
         Get the division for the event with the specified name.
         :param name: The name of the division
@@ -191,12 +463,12 @@ class Event:
         self.logger.info(
             f"fetching division '{name}' at event '{self.model.canonical_name}'"
         )
-        matches = [d for d in self._divisions() if d.model.name == name]
+        matches = [d for d in self.divisions() if d.model.name == name]
         if len(matches) < 1:
             raise ValueError(f"division with name '{name}' not found for event")
         return matches[0]
 
-    def _divisions(self) -> list[_Division]:
+    def divisions(self) -> list[Division]:
         """
         List the divisions for an event.
         :return: The list of divisions for the event
@@ -205,23 +477,27 @@ class Event:
             f"fetching all divisions at event '{self.model.canonical_name}'"
         )
 
-        # get the content from the event page
-        res = requests.get(str(self.model.url))
-        res.raise_for_status()
-
-        # scrape the divisions
+        # get and scrape the divisions from the event page
         scraper = DivisionScraper(logging.getLogger(__name__))
-        return [
-            _Division(d, self.logger)
-            for d in scraper.scrape(BeautifulSoup(res.content, "html.parser"))
-        ]
+        scraped = self.fetcher.parse(
+            str(self.model.url),
+            "divisions",
+            lambda content: scrape_page(content, scraper.scrape),
+        )
+        return [Division(d, self.logger, self.pool, self.fetcher) for d in scraped]
 
 
 class ResultEnricher:
     """A class for enriching results."""
 
     def __init__(
-        self, retry: int, poll_interval: timedelta, logger: logging.Logger
+        self,
+        retry: int,
+        poll_interval: timedelta,
+        logger: logging.Logger,
+        pool: ScrapePool | None = None,
+        fetcher: Fetcher | None = None,
+        store: ResultStore | None = None,
     ) -> None:
         # number of retries per operation
         self.retry = retry
@@ -229,23 +505,84 @@ class ResultEnricher:
         self.poll_interval = poll_interval
         # logger instance
         self.logger = logger
+        # optional process pool for scraping splits pages
+        self.pool = pool
+        # the fetcher for result pages
+        self.fetcher = fetcher if fetcher is not None else Fetcher(logger=logger)
+        # optional persistent store, consulted before fetching and updated after
+        self.store = store
+
+    def recall(
+        self, pages: Iterable[list[Result]], splits: bool, profile: bool
+    ) -> Iterator[Result]:
+        """
+        Fill in stored splits and profile URLs, looking up each page of results
+        in one batch as it arrives.
+        :param pages: The results, in pages
+        :param splits: Indicates splits should be included
+        :param profile: Indicates profile URL should be included
+        :return: An iterator over the results, in order
+        """
+        if self.store is None or not (splits or profile):
+            for page in pages:
+                yield from page
+            return
+
+        for page in pages:
+            stored = self.store.get_many(str(r.model.url) for r in page)
+            for r in page:
+                found = stored.get(str(r.model.url))
+                if found is not None:
+                    if splits and r.model.splits is None:
+                        r.model.splits = found.splits
+                    if profile and r.model.profile is None and found.profile:
+                        r.model.profile = HttpUrl(found.profile)
+                yield r
 
     def enrich(self, r: Result, splits: bool, profile: bool) -> Result:
         """
-        Enrich a result with splits and profile data.
+        Enrich a result with splits and profile data; data already present is not refetched.
         :param r: The result
         :param splits: Indicates splits should be included
         :param profile: Indicates profile URL should be included
         :raises: RuntimeError if maximum retries exceeded
         :return: The enriched result
         """
-        if splits:
+        if splits and r.model.splits is None:
             r.model.splits = self._get_splits_for_result(r)
-        if profile:
+        if profile and r.model.profile is None:
             r.model.profile = self._get_profile_for_result(r)
 
         return r
 
+    def try_enrich(self, r: Result, splits: bool, profile: bool) -> bool:
+        """
+        Enrich a result with splits and profile data, without waiting for
+        splits that are not yet available; data already present is not refetched.
+        :param r: The result
+        :param splits: Indicates splits should be included
+        :param profile: Indicates profile URL should be included
+        :raises: RuntimeError if the profile URL cannot be found
+        :return: True if enriched, False if splits are not yet available
+        """
+        if profile and r.model.profile is None:
+            r.model.profile = self._get_profile_for_result(r)
+        if splits and r.model.splits is None:
+            try:
+                r.model.splits = self._try_get_splits(r)
+            except ValueError:
+                return False
+
+        return True
+
+    def backoff(self, attempt: int) -> timedelta:
+        """
+        Get the delay before retrying an operation.
+        :param attempt: The number of attempts made so far
+        :return: The delay
+        """
+        return min(self.poll_interval * 2 ** (attempt - 1), timedelta(minutes=1))
+
     def _get_splits_for_result(self, r: Result) -> models.Splits:
         """
         Get the splits for a specified result.
@@ -271,17 +608,25 @@ class ResultEnricher:
         :param r: The result
         :return: The profile URL
         """
-        self.logger.debug(f"fetching profile URL for athlete '{r.model.name}'")
+        stored = self.store.get(str(r.model.url)) if self.store is not None else None
+        if stored is not None and stored.profile is not None:
+            return HttpUrl(stored.profile)
 
-        res = requests.get(f"{r.model.url}?tab=overview")
-        res.raise_for_status()
+        self.logger.debug(f"fetching profile URL for athlete '{r.model.name}'")
 
-        soup = BeautifulSoup(res.content, "html.parser")
-        matches = [a["href"] for a in soup.find_all("a") if "/athlete/" in a["href"]]
-        if len(matches) == 0:
-            raise RuntimeError("could not locate athlete profile URL")
+        scraper = ProfileScraper(logging.getLogger(__name__))
+        try:
+            url = self.fetcher.parse(
+                f"{r.model.url}?tab=overview",
+                "profile",
+                lambda content: scrape_page(content, scraper.scrape),
+            )
+        except ValueError as e:
+            raise RuntimeError(str(e)) from e
 
-        return HttpUrl(f"{BASE_URL}{matches[0]}")
+        if self.store is not None:
+            self.store.put_profile(str(r.model.url), str(url))
+        return url
 
     def _try_get_splits(self, r: Result) -> models.Splits:
         """
@@ -289,13 +634,34 @@ class ResultEnricher:
         :param r: The result
         :return: The splits
         """
-        # grab the page
-        res = requests.get(f"{r.model.url}?tab=splits")
-        res.raise_for_status()
+        stored = self.store.get(str(r.model.url)) if self.store is not None else None
+        if stored is not None and stored.splits is not None:
+            return stored.splits
+
+        url = f"{r.model.url}?tab=splits"
+        try:
+            splits = self.fetcher.parse(url, "splits", self._scrape_splits)
+        except ValueError:
+            # splits are not yet available; do not serve this page again
+            self.fetcher.evict(url)
+            raise
+
+        if self.store is not None:
+            self.store.put_splits(str(r.model.url), splits)
+        return splits
+
+    def _scrape_splits(self, content: bytes) -> models.Splits:
+        """
+        Scrape an analysis page for splits.
+        :param content: The page content
+        :raises: ValueError if splits are not yet available
+        :return: The splits
+        """
+        if self.pool is not None:
+            return self.pool.scrape_splits(content)
 
-        # scrape the content
         scraper = SplitsScraper(logging.getLogger(__name__))
-        return scraper.scrape(BeautifulSoup(res.content, "html.parser"))
+        return scrape_page(content, scraper.scrape)
 
 
 class Result:
@@ -305,50 +671,315 @@ class Result:
         self.model = model
         self.logger = logger
 
+        # the enricher for deferred splits and profile, if deferred
+        self._enricher: ResultEnricher | None = None
+        # the deferred fields already attempted, to avoid refetching failures
+        self._attempted: set[str] = set()
+        # guards deferred enrichment
+        self._lock = threading.Lock()
+
+    @property
+    def splits(self) -> models.Splits | None:
+        """The splits for the result, fetched on first access if deferred."""
+        if self.model.splits is None:
+            self._resolve("splits")
+        return self.model.splits
+
+    @property
+    def profile(self) -> HttpUrl | None:
+        """The athlete profile URL, fetched on first access if deferred."""
+        if self.model.profile is None:
+            self._resolve("profile")
+        return self.model.profile
+
+    def defer(self, enricher: ResultEnricher) -> None:
+        """
+        Defer enrichment of the result until splits or profile are accessed.
+        :param enricher: The enricher used on first access
+        """
+        self._enricher = enricher
 
-# -----------------------------------------------------------------------------
-# Private Classes
-# -----------------------------------------------------------------------------
+    def _resolve(self, field: str) -> None:
+        """
+        Fetch a deferred field, at most once.
+        :param field: The field, 'splits' or 'profile'
+        """
+        if self._enricher is None:
+            return
 
+        with self._lock:
+            if field in self._attempted:
+                return
+            self._attempted.add(field)
 
-class _Division:
+            try:
+                self._enricher.enrich(self, field == "splits", field == "profile")
+            except RuntimeError as e:
+                self.logger.warning(
+                    f"failed to fetch {field} for athlete '{self.model.name}': {e}"
+                )
+
+
+class Athlete:
+    """A Hyrox athlete."""
+
+    def __init__(self, model: models.Athlete, logger: logging.Logger) -> None:
+        self.model = model
+        self.logger = logger
+
+
+class Division:
     """A hyrox division."""
 
-    def __init__(self, model: models.Division, logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        model: models.Division,
+        logger: logging.Logger,
+        pool: ScrapePool | None = None,
+        fetcher: Fetcher | None = None,
+        store: ResultStore | None = None,
+    ) -> None:
         self.model = model
         self.logger = logger
+        self.pool = pool
+        self.fetcher = fetcher if fetcher is not None else Fetcher(logger=logger)
+        self.store = store
 
     def results(self) -> list[Result]:
         """
         List the rankings for a division.
         :return: The list of rankings
         """
-        p = 1
-        s = ResultScraper(logging.getLogger(__name__))
+        return [r for page in self.pages() for r in page]
 
-        rankings: list[Result] = []
+    def pages(self) -> Iterator[list[Result]]:
+        """
+        Iterate over the pages of rankings for a division, fetching each on demand.
+        :return: An iterator over pages of rankings
+        """
+        p = 1
         while True:
-            res = requests.get(f"{self.model.url}?p={p}")
-            res.raise_for_status()
-
-            scraped = s.scrape(BeautifulSoup(res.content, "html.parser"))
-            if len(scraped) == 0:
+            page = self.page(p)
+            if len(page) == 0:
                 break
 
-            rankings.extend([Result(r, self.logger) for r in scraped])
+            yield page
             p += 1
 
-        return rankings
+    def iter_results(self, prefetch: int = 1) -> Iterator[Result]:
+        """
+        Stream the rankings for a division, fetching pages ahead in the background.
+        :param prefetch: The number of pages fetched ahead of the consumer
+        :return: An iterator over rankings
+        """
+        for page in self.iter_pages(prefetch):
+            yield from page
+
+    def iter_pages(self, prefetch: int = 1) -> Iterator[list[Result]]:
+        """
+        Stream the pages of rankings for a division, fetching pages ahead in the background.
+        :param prefetch: The number of pages fetched ahead of the consumer
+        :return: An iterator over pages of rankings
+        """
+        if prefetch < 1:
+            yield from self.pages()
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending: deque[Future[list[Result]]] = deque()
+            try:
+                p = 1
+                while True:
+                    # keep the next `prefetch` pages in flight
+                    while len(pending) <= prefetch:
+                        pending.append(executor.submit(self.page, p))
+                        p += 1
+
+                    page = pending.popleft().result()
+                    if len(page) == 0:
+                        break
+
+                    yield page
+            finally:
+                executor.shutdown(cancel_futures=True)
+
+    def page(self, p: int) -> list[Result]:
+        """
+        Fetch and scrape a single page of rankings.
+        :param p: The page number, starting from 1
+        :return: The rankings on the page; empty past the last page
+        """
+        scraped = self.fetcher.parse(
+            f"{self.model.url}?p={p}", "rankings", self._scrape_page
+        )
+
+        # the scraped models are shared with concurrent callers, and are
+        # mutated by enrichment, so each caller gets its own copies
+        return [Result(r.model_copy(), self.logger) for r in scraped]
+
+    def _scrape_page(self, content: bytes) -> list[models.Result]:
+        """
+        Scrape a page of rankings.
+        :param content: The page content
+        :return: The rankings on the page
+        """
+        if self.pool is not None:
+            return self.pool.scrape_results(content)
+
+        s = ResultScraper(logging.getLogger(__name__))
+        return scrape_page(content, s.scrape)
 
     def result(self, athlete: str) -> Result:
         """
         Find the ranking for a specific athlete.
         :param athlete: The name of the athlete
-        :return: The ranking for the athlete, or `None`
+        :raises: ValueError if the athlete is not found
+        :return: The ranking for the athlete
         """
-        found = [r for r in self.results() if r.model.name.lower() == athlete.lower()]
+        found = self.results_for([athlete])
         if len(found) < 1:
             raise ValueError(
                 f"athlete with name '{athlete}' not found in division '{self.model.name}'"
             )
-        return found[0]
+        return found[athlete]
+
+    def results_for(self, athletes: Iterable[str]) -> dict[str, Result]:
+        """
+        Find the rankings for many athletes in a single pass over the pages,
+        stopping as soon as every athlete has been found.
+        :param athletes: The names of the athletes
+        :return: The rankings for the athletes that were found, keyed by requested name
+        """
+        # requested names, keyed by folded name, so case and accents do not matter
+        remaining = {fold_name(a): a for a in athletes}
+
+        found: dict[str, Result] = {}
+        for page in self.pages():
+            for r in page:
+                name = remaining.pop(fold_name(r.model.name), None)
+                if name is not None:
+                    found[name] = r
+            if len(remaining) == 0:
+                break
+
+        return found
+
+
+# -----------------------------------------------------------------------------
+# Private Classes
+# -----------------------------------------------------------------------------
+
+
+class _DeferredRetries:
+    """A queue of results whose splits were not yet available, retried with backoff."""
+
+    def __init__(self, enricher: ResultEnricher, splits: bool, profile: bool) -> None:
+        # the enricher
+        self.enricher = enricher
+        # indicates splits should be included
+        self.splits = splits
+        # indicates profile URL should be included
+        self.profile = profile
+
+        # (due time, sequence number, attempts made, result), ordered by due time
+        self._heap: list[tuple[float, int, int, Result]] = []
+        # breaks ties between results due at the same time
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def offer(
+        self, result: Result, enriched: bool, attempt: int = 1
+    ) -> Iterator[Result]:
+        """
+        Yield an enriched result, or defer it for retry.
+        :param result: The result
+        :param enriched: Indicates the result was enriched
+        :param attempt: The number of attempts made so far
+        :return: An iterator over the result, if it is not deferred
+        """
+        if enriched:
+            yield result
+        elif attempt >= self.enricher.retry:
+            result.logger.warning(
+                f"failed to enrich result for athlete '{result.model.name}': maximum retries exceeded when querying splits"
+            )
+            yield result
+        else:
+            due = time.monotonic() + self.enricher.backoff(attempt).total_seconds()
+            heapq.heappush(self._heap, (due, self._seq, attempt, result))
+            self._seq += 1
+
+    def drain(self, executor: ThreadPoolExecutor, batch: int) -> Iterator[Result]:
+        """
+        Retry deferred results as they come due, until none remain.
+        :param executor: The executor on which retries run
+        :param batch: The maximum number of retries run concurrently
+        :return: An iterator over the results, enriched if possible
+        """
+        while len(self._heap) > 0:
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            # retry every result that is due, up to the batch size
+            due: list[tuple[int, Future[tuple[Result, bool]]]] = []
+            while (
+                len(self._heap) > 0
+                and self._heap[0][0] <= time.monotonic()
+                and len(due) < batch
+            ):
+                _, _, attempt, result = heapq.heappop(self._heap)
+                future = executor.submit(
+                    _try_enrich, self.enricher, result, self.splits, self.profile
+                )
+                due.append((attempt, future))
+
+            for attempt, future in due:
+                yield from self.offer(*future.result(), attempt=attempt + 1)
+
+
+def prefetch(
+    results: Iterable[Result],
+    splits: bool = True,
+    profile: bool = False,
+    workers: int = 4,
+) -> None:
+    """
+    Concurrently resolve the deferred splits and / or profile of the chosen results.
+    :param results: The results, typically a subset of lazily-fetched results
+    :param splits: Resolve splits
+    :param profile: Resolve profile URLs
+    :param workers: The number of results resolved concurrently
+    """
+
+    def resolve(r: Result) -> None:
+        if splits:
+            r.splits
+        if profile:
+            r.profile
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(resolve, results):
+            pass
+
+
+def _try_enrich(
+    enricher: ResultEnricher, result: Result, splits: bool, profile: bool
+) -> tuple[Result, bool]:
+    """
+    Enrich a result without waiting for splits, logging rather than raising on failure.
+    :param enricher: The enricher
+    :param result: The result
+    :param splits: Indicates splits should be included
+    :param profile: Indicates profile URL should be included
+    :return: (the result, False if its splits should be retried)
+    """
+    try:
+        return result, enricher.try_enrich(result, splits, profile)
+    except RuntimeError as e:
+        result.logger.warning(
+            f"failed to enrich result for athlete '{result.model.name}': {e}"
+        )
+        return result, True
@@ -0,0 +1,201 @@
+"""
+HTTP fetching for the results client.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from pyrox.io.archive import PageArchive
+
+from .flight import SingleFlight
+
+if TYPE_CHECKING:
+    import requests
+
+T = TypeVar("T")
+
+
+class FetchStats:
+    """Counters for the work done by a fetcher."""
+
+    def __init__(self) -> None:
+        # the number of pages fetched over the network
+        self.pages = 0
+        # the number of bytes fetched over the network
+        self.bytes = 0
+        # the number of pages served from the cache
+        self.cached = 0
+        # the number of requests collapsed into a concurrent request for the same URL
+        self.collapsed = 0
+        # the number of parses collapsed into a concurrent parse of the same page
+        self.collapsed_parses = 0
+        # guards the counters
+        self._lock = threading.Lock()
+
+    def record(self, n_bytes: int, cached: bool) -> None:
+        """
+        Record a fetched page.
+        :param n_bytes: The size of the page
+        :param cached: Indicates the page was served from the cache
+        """
+        with self._lock:
+            if cached:
+                self.cached += 1
+            else:
+                self.pages += 1
+                self.bytes += n_bytes
+
+    def record_collapsed(self, parse: bool) -> None:
+        """
+        Record a request or parse served by a concurrent caller.
+        :param parse: Indicates a parse, rather than a request, was collapsed
+        """
+        with self._lock:
+            if parse:
+                self.collapsed_parses += 1
+            else:
+                self.collapsed += 1
+
+
+class Fetcher:
+    """A rate-limited, optionally caching, HTTP fetcher."""
+
+    def __init__(
+        self,
+        rate_limit: float | None = None,
+        cache: Path | None = None,
+        logger: logging.Logger = logging.getLogger(__name__),
+        archive: PageArchive | None = None,
+        max_pages: int = 32,
+    ) -> None:
+        # the maximum number of network requests per second, if limited
+        self.rate_limit = rate_limit
+        # the directory in which fetched pages are cached, if caching
+        self.cache = cache
+        # logger instance
+        self.logger = logger
+        # the archive to which pages fetched over the network are appended, if archiving
+        self.archive = archive
+        # the maximum number of pages fetched or parsed at once
+        self.max_pages = max_pages
+        # counters for fetched pages
+        self.stats = FetchStats()
+
+        # the earliest time at which the next network request may be sent
+        self._next = 0.0
+        # guards the rate limit
+        self._lock = threading.Lock()
+        # per-thread HTTP sessions, for connection reuse
+        self._local = threading.local()
+        # deduplicates concurrent requests for the same URL
+        self._requests: SingleFlight[str, bytes] = SingleFlight()
+        # deduplicates concurrent parses of the same page
+        self._parses: SingleFlight[tuple[str, str], Any] = SingleFlight()
+        # caps the pages in flight, so memory is bounded however many callers there are
+        self._pages = threading.BoundedSemaphore(max_pages)
+
+        if self.cache is not None:
+            self.cache.mkdir(parents=True, exist_ok=True)
+
+    def get(self, url: str) -> bytes:
+        """
+        Get the content at `url`, sharing one request among concurrent callers.
+        :param url: The URL
+        :raises: requests.HTTPError on an unsuccessful response
+        :return: The content
+        """
+        content, shared = self._requests.do(url, lambda: self._get(url))
+        if shared:
+            self.stats.record_collapsed(parse=False)
+        return content
+
+    def parse(self, url: str, key: str, fn: Callable[[bytes], T]) -> T:
+        """
+        Get and parse the content at `url`, sharing one request and one parse
+        among concurrent callers; the result must not be mutated. At most
+        `max_pages` pages are held between fetch and parse at once.
+        :param url: The URL
+        :param key: Identifies the parse, e.g. the scraper applied
+        :param fn: Parses the content
+        :raises: requests.HTTPError on an unsuccessful response
+        :return: The parsed content
+        """
+        parsed, shared = self._parses.do((key, url), lambda: self._parse(url, fn))
+        if shared:
+            self.stats.record_collapsed(parse=True)
+        return parsed
+
+    def evict(self, url: str) -> None:
+        """
+        Remove the content at `url` from the cache, if present.
+        :param url: The URL
+        """
+        path = self._cache_path(url)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def _parse(self, url: str, fn: Callable[[bytes], T]) -> T:
+        """Get and parse the content at `url`, once a page slot is free."""
+        with self._pages:
+            return fn(self.get(url))
+
+    def _get(self, url: str) -> bytes:
+        """Get the content at `url` from the cache or the network."""
+        path = self._cache_path(url)
+        if path is not None and path.exists():
+            content = path.read_bytes()
+            self.stats.record(len(content), cached=True)
+            return content
+
+        self._wait()
+        self.logger.debug(f"GET {url}")
+        res = self._session().get(url)
+        res.raise_for_status()
+
+        content = res.content
+        self.stats.record(len(content), cached=False)
+        if self.archive is not None:
+            self.archive.append(url, content)
+        if path is not None:
+            # write then rename, so concurrent readers never see a partial page
+            tmp = path.with_suffix(f".{threading.get_ident()}")
+            tmp.write_bytes(content)
+            tmp.replace(path)
+
+        return content
+
+    def _cache_path(self, url: str) -> Path | None:
+        """Get the cache path for `url`, if caching."""
+        if self.cache is None:
+            return None
+        return self.cache / hashlib.sha256(url.encode()).hexdigest()
+
+    def _session(self) -> requests.Session:
+        """Get the HTTP session for the calling thread."""
+        session: requests.Session | None = getattr(self._local, "session", None)
+        if session is None:
+            # imported on first use; requests is slow to import
+            import requests
+
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def _wait(self) -> None:
+        """Block until the rate limit allows another network request."""
+        if self.rate_limit is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next - now)
+            self._next = max(now, self._next) + 1.0 / self.rate_limit
+
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,51 @@
+"""
+Single-flight deduplication of concurrent calls.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[K, T]):
+    """
+    Collapse concurrent calls with the same key into a single call,
+    whose outcome (result or exception) is shared by every caller.
+    """
+
+    def __init__(self) -> None:
+        # the calls currently in flight, by key
+        self._calls: dict[K, Future[T]] = {}
+        # guards the calls in flight
+        self._lock = threading.Lock()
+
+    def do(self, key: K, fn: Callable[[], T]) -> tuple[T, bool]:
+        """
+        Call `fn`, unless a call with the same key is already in flight,
+        in which case wait for and share its outcome.
+        :param key: The key identifying the call
+        :param fn: The call
+        :return: (the result, the result was shared with another caller)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = Future()
+                self._calls[key] = call
+
+        if not leader:
+            return call.result(), True
+
+        try:
+            call.set_result(fn())
+        except BaseException as e:
+            call.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return call.result(), False
@@ -0,0 +1,240 @@
+"""
+Live tracking of an in-progress event.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from datetime import timedelta
+from typing import Iterable, NamedTuple
+
+import pyrox.models as models
+
+from .client import Division, Event, Result, ResultEnricher
+
+
+class LiveUpdate(NamedTuple):
+    """A newly-posted result or splits."""
+
+    # the kind of update, 'result' or 'splits'
+    kind: str
+    # the canonical name of the event
+    event: str
+    # the name of the division
+    division: models.DivisionName
+    # the result
+    result: models.Result
+
+
+class LiveTracker:
+    """
+    Track an in-progress event, fetching only the ranking pages that can have
+    changed since the last poll.
+
+    The event's fetcher must not cache pages, or updates would not be seen.
+    """
+
+    def __init__(
+        self,
+        event: Event,
+        division_names: Iterable[models.DivisionName],
+        splits: bool = False,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        """
+        Create a tracker.
+        :param event: The event
+        :param division_names: The names of the tracked divisions
+        :param splits: Fetch and broadcast splits for new results
+        :param logger: Logger instance
+        :raises: ValueError if the event's fetcher caches pages
+        """
+        if event.fetcher.cache is not None:
+            raise ValueError("live tracking requires a fetcher that does not cache")
+
+        # the event being tracked
+        self.event = event
+        # the names of the tracked divisions
+        self.division_names = set(division_names)
+        # indicates splits for new results are fetched and broadcast
+        self.splits = splits
+        # logger instance
+        self.logger = logger
+
+        # the state of each tracked division
+        self._state = {name: _DivisionState() for name in self.division_names}
+        # fetches splits for new results
+        self._enricher = ResultEnricher(
+            1, timedelta(seconds=0), logger, event.pool, event.fetcher, event.store
+        )
+
+    def snapshot(self) -> dict[models.DivisionName, list[models.Result]]:
+        """
+        Get the results seen so far, in ranking order.
+        :return: The results, by division
+        """
+        return {
+            name: [state.results[url] for url in state.order]
+            for name, state in self._state.items()
+        }
+
+    def poll(self) -> list[LiveUpdate]:
+        """
+        Fetch changes since the last poll.
+        :return: The results and splits posted since the last poll
+        """
+        # imported on first use; requests is slow to import
+        import requests
+
+        updates: list[LiveUpdate] = []
+        for division in self.event.divisions():
+            state = self._state.get(division.model.name)
+            if state is None:
+                continue
+
+            # a division's poll updates a copy of its state, kept only if the whole
+            # poll succeeds, so results seen by a failed poll are reported by the next
+            polled = state.copy()
+            try:
+                found = self._poll_division(division, polled)
+            except (RuntimeError, requests.RequestException) as e:
+                self.logger.warning(
+                    f"failed to poll division '{division.model.name}': {e}"
+                )
+                continue
+
+            self._state[division.model.name] = polled
+            updates.extend(found)
+
+        return updates
+
+    def _poll_division(
+        self, division: Division, state: _DivisionState
+    ) -> list[LiveUpdate]:
+        """Fetch the changes to a division since the last poll, updating its state."""
+        updates: list[LiveUpdate] = []
+        if division.model.n_finishers != state.n_finishers:
+            updates.extend(self._poll_rankings(division, state))
+        if self.splits:
+            updates.extend(self._poll_splits(division, state))
+
+        state.n_finishers = division.model.n_finishers
+        return updates
+
+    def _poll_rankings(
+        self, division: Division, state: _DivisionState
+    ) -> list[LiveUpdate]:
+        """
+        Fetch the ranking pages that can have changed, from the last page backwards,
+        stopping at the first page identical to the last snapshot; a result inserted
+        on any page shifts every later page, so earlier pages cannot have changed.
+        """
+        # the first poll reads every page to establish the baseline, and learns
+        # the page size; results already posted are not reported as updates
+        baseline = state.page_size is None
+        if state.page_size is None:
+            pages = list(division.pages())
+            if len(pages) > 0:
+                state.page_size = len(pages[0])
+            fetched = [r for page in pages for r in page]
+            keep = 0
+        else:
+            n_pages = math.ceil(division.model.n_finishers / state.page_size)
+            fetched = []
+            keep = 0
+            for p in range(n_pages, 0, -1):
+                page = division.page(p)
+                lo = (p - 1) * state.page_size
+                if [str(r.model.url) for r in page] == state.order[lo : lo + len(page)]:
+                    keep = lo + len(page)
+                    break
+                fetched = page + fetched
+
+        self.logger.info(
+            f"division '{division.model.name}': {len(fetched)} results refreshed"
+        )
+
+        updates: list[LiveUpdate] = []
+        order = state.order[:keep]
+        for r in fetched:
+            url = str(r.model.url)
+            order.append(url)
+            if url not in state.results:
+                state.results[url] = r.model
+                if not baseline:
+                    state.pending.add(url)
+                    updates.append(self._update("result", division, r.model))
+            else:
+                # keep enrichment from earlier polls; take the latest ranking data
+                previous = state.results[url]
+                state.results[url] = r.model.model_copy(
+                    update={"splits": previous.splits, "profile": previous.profile}
+                )
+
+        state.order = order
+        return updates
+
+    def _poll_splits(
+        self, division: Division, state: _DivisionState
+    ) -> list[LiveUpdate]:
+        """
+        Fetch splits for new results whose splits have not yet been posted; a
+        result whose splits fail to fetch is tried again at the next poll.
+        """
+        # imported on first use; requests is slow to import
+        import requests
+
+        updates: list[LiveUpdate] = []
+        for url in [url for url in state.order if url in state.pending]:
+            # enriched as a copy, so the state this poll started from is unchanged
+            result = Result(state.results[url].model_copy(), self.logger)
+            try:
+                enriched = self._enricher.try_enrich(result, True, False)
+            except (RuntimeError, requests.RequestException) as e:
+                self.logger.warning(
+                    f"failed to fetch splits for athlete '{result.model.name}': {e}"
+                )
+                enriched = False
+            if enriched:
+                state.results[url] = result.model
+                state.pending.discard(url)
+                updates.append(self._update("splits", division, result.model))
+        return updates
+
+    def _update(
+        self, kind: str, division: Division, result: models.Result
+    ) -> LiveUpdate:
+        """Build an update."""
+        return LiveUpdate(
+            kind, self.event.model.canonical_name, division.model.name, result
+        )
+
+
+class _DivisionState:
+    """The last seen state of a tracked division."""
+
+    def __init__(self) -> None:
+        # the number of finishers at the last poll
+        self.n_finishers: int | None = None
+        # the number of results per ranking page, once known
+        self.page_size: int | None = None
+        # result URLs, in ranking order
+        self.order: list[str] = []
+        # results, by URL
+        self.results: dict[str, models.Result] = {}
+        # URLs of results whose splits have not yet been posted
+        self.pending: set[str] = set()
+
+    def copy(self) -> _DivisionState:
+        """
+        Copy the state, so it can be updated without changing this one.
+        :return: The copy
+        """
+        state = _DivisionState()
+        state.n_finishers = self.n_finishers
+        state.page_size = self.page_size
+        state.order = list(self.order)
+        state.results = dict(self.results)
+        state.pending = set(self.pending)
+        return state
@@ -0,0 +1,142 @@
+"""
+Unit tests for change feeds.
+"""
+
+import io
+import logging
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from pydantic import HttpUrl
+
+import pyrox.models as models
+from pyrox.io.store import ResultStore
+from pyrox.io.writer import ResultsSink, flatten_splits
+
+from .changes import ChangeFeed, ChangeKind, apply, diff, read_changes, write_changes
+from .client import Hyrox
+from .fetch import Fetcher
+
+_EVENT = "chicago_2025"
+_DIVISION = models.DivisionName.ELITE_MEN
+
+
+def _result(i: int, minutes: int, splits: models.Splits | None = None) -> models.Result:
+    return models.Result(
+        position=i,
+        name=f"Athlete {i}",
+        time=timedelta(minutes=minutes),
+        url=HttpUrl(f"https://www.hyresult.com/result/R{i}"),
+        splits=splits,
+    )
+
+
+def _splits(seconds: int) -> models.Splits:
+    return models.Splits(
+        runs=[timedelta(seconds=seconds)] * 8,
+        stations={name: timedelta(seconds=seconds) for name in models.Station},
+    )
+
+
+def test_diff() -> None:
+    """Diffs report added, removed and changed results by URL."""
+
+    before = [_result(1, 60), _result(2, 61), _result(3, 62)]
+    # result 2 is disqualified, result 3 moves up with splits posted, result 4 is new
+    after = [
+        _result(1, 60),
+        _result(3, 62, _splits(240)).model_copy(update={"position": 2}),
+        _result(4, 63).model_copy(update={"position": 3}),
+    ]
+
+    changes = diff(before, after, _EVENT, _DIVISION, splits=True)
+    assert [(c.kind, c.url[-2:]) for c in changes] == [
+        (ChangeKind.CHANGED, "R3"),
+        (ChangeKind.ADDED, "R4"),
+        (ChangeKind.REMOVED, "R2"),
+    ]
+    assert changes[0].fields == {"position": 2, "splits": [240] * 16}
+    assert changes[2].fields == {}
+
+    # splits and profiles that could not be fetched are not reported as removed
+    assert (
+        diff(
+            [_result(1, 60, _splits(240))],
+            [_result(1, 60)],
+            _EVENT,
+            _DIVISION,
+            splits=True,
+        )
+        == []
+    )
+    profiled = _result(1, 60).model_copy(
+        update={"profile": HttpUrl("https://www.hyresult.com/athlete/a")}
+    )
+    assert diff([profiled], [_result(1, 60)], _EVENT, _DIVISION, profile=True) == []
+    moved = profiled.model_copy(
+        update={"profile": HttpUrl("https://www.hyresult.com/athlete/b")}
+    )
+    assert diff([profiled], [moved], _EVENT, _DIVISION, profile=True)[0].fields == {
+        "profile": "https://www.hyresult.com/athlete/b"
+    }
+
+    # splits are only compared when asked for
+    assert diff(before, after, _EVENT, _DIVISION)[0].fields == {"position": 2}
+    assert diff(after, after, _EVENT, _DIVISION, splits=True) == []
+
+    # the log round-trips, and applying it to the snapshot gives the fresh results
+    log = io.StringIO()
+    assert write_changes(changes, log) == 3
+    read = list(read_changes(log.getvalue().splitlines()))
+    assert read == changes
+    assert apply(before, read) == after
+
+
+def test_change_log_is_compact() -> None:
+    """Removals carry no fields."""
+
+    log = io.StringIO()
+    write_changes(diff([_result(1, 60)], [], _EVENT, _DIVISION), log)
+    assert log.getvalue() == (
+        '{"op":"removed","event":"chicago_2025","division":"elite_men",'
+        '"url":"https://www.hyresult.com/result/R1"}\n'
+    )
+
+
+def test_change_feed_scrapes_afresh(
+    tmp_path: Path, fake_fetcher: Callable[..., Fetcher]
+) -> None:
+    """Fresh results are scraped past the client's store, and cached fetchers are rejected."""
+
+    logger = logging.getLogger(__name__)
+    fresh = list(
+        Hyrox(logger, fetcher=fake_fetcher(range(1, 4))).iter_results(
+            "test_2025", _DIVISION, splits=True
+        )
+    )
+    posted = fresh[0].model.splits
+    assert posted is not None
+
+    # the snapshot and the store both hold stale splits for the first result
+    stale = fresh[0].model.model_copy(update={"splits": _splits(1)})
+    snapshot = tmp_path / "snapshot.csv"
+    with ResultsSink(snapshot) as sink:
+        sink.write("test_2025", _DIVISION, [stale] + [r.model for r in fresh[1:]])
+
+    with ResultStore(tmp_path / "store.db") as store:
+        store.put_splits(str(stale.url), _splits(1))
+        client = Hyrox(logger, fetcher=fake_fetcher(range(1, 4)), store=store)
+        changes = ChangeFeed(client).changes(
+            snapshot, "test_2025", _DIVISION, splits=True
+        )
+
+    assert [(c.kind, c.url, c.fields) for c in changes] == [
+        (ChangeKind.CHANGED, str(stale.url), {"splits": flatten_splits(posted)})
+    ]
+
+    cached = fake_fetcher(range(1, 4))
+    cached.cache = tmp_path / "cache"
+    with pytest.raises(ValueError):
+        ChangeFeed(Hyrox(logger, fetcher=cached))
@@ -0,0 +1,139 @@
+"""
+Unit tests for the results client.
+"""
+
+import logging
+from datetime import timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from pyrox.io.store import ResultStore
+from pyrox.models import DivisionName
+
+from .client import Hyrox, Result, ResultEnricher
+from .fetch import Fetcher
+
+_POLL = timedelta(milliseconds=1)
+
+
+def _names(results: list[Result]) -> list[str]:
+    return [r.model.name for r in results]
+
+
+def test_iter_results_retries_unposted_splits_last(
+    fake_fetcher: Callable[..., Fetcher],
+) -> None:
+    """Results whose splits are not yet posted are retried after the rest, in due order."""
+
+    # athlete 2 posts splits on the third request, athlete 4 never does
+    unposted = {2: 2, 4: 100}
+    client = Hyrox(
+        logging.getLogger(__name__), fetcher=fake_fetcher(range(1, 7), unposted)
+    )
+
+    results = list(
+        client.iter_results(
+            "test_2025",
+            DivisionName.ELITE_MEN,
+            splits=True,
+            retry=4,
+            poll_interval=_POLL,
+        )
+    )
+    assert _names(results) == [f"Athlete {i}" for i in [1, 3, 5, 6, 2, 4]]
+    assert [r.model.splits is not None for r in results] == [True] * 5 + [False]
+    # athlete 4 is given up on after the maximum number of attempts
+    assert unposted == {2: 0, 4: 96}
+
+
+def test_backoff_doubles_up_to_a_cap() -> None:
+    """Retries back off exponentially, to at most a minute."""
+
+    enricher = ResultEnricher(8, timedelta(seconds=1), logging.getLogger(__name__))
+    assert [enricher.backoff(a).total_seconds() for a in range(1, 5)] == [1, 2, 4, 8]
+    assert enricher.backoff(20) == timedelta(minutes=1)
+
+
+def test_iter_results_selects_and_limits_enrichment(
+    fake_fetcher: Callable[..., Fetcher],
+) -> None:
+    """Only the selected results within the top N are enriched; all are streamed in order."""
+
+    client = Hyrox(logging.getLogger(__name__), fetcher=fake_fetcher(range(1, 7)))
+    results = list(
+        client.iter_results(
+            "test_2025",
+            DivisionName.ELITE_MEN,
+            splits=True,
+            select=lambda r: r.position % 2 == 1,
+            top=4,
+        )
+    )
+    assert [r.model.position for r in results] == list(range(1, 7))
+    assert [r.model.splits is not None for r in results] == [
+        True,
+        False,
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_results_for_stops_once_all_are_found(
+    fake_fetcher: Callable[..., Fetcher],
+) -> None:
+    """Athletes are matched ignoring case, paging only as far as needed."""
+
+    fetcher = fake_fetcher(range(1, 251))
+    event = Hyrox(logging.getLogger(__name__), fetcher=fetcher).event("test_2025")
+
+    found = event.results_for(
+        DivisionName.ELITE_MEN, ["athlete 3", "ATHLETE 120", "Nobody"], splits=True
+    )
+    assert sorted(found) == ["ATHLETE 120", "athlete 3"]
+    assert found["ATHLETE 120"].model.position == 120
+    assert found["athlete 3"].model.splits is not None
+
+    # a second lookup fetches only the event page and the first ranking page
+    pages = fetcher.stats.pages
+    event.results_for(DivisionName.ELITE_MEN, ["Athlete 7"])
+    assert fetcher.stats.pages - pages == 2
+
+
+def test_recall_streams(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    fake_fetcher: Callable[..., Fetcher],
+) -> None:
+    """Stored data is recalled as each page arrives, without reading ahead."""
+
+    client = Hyrox(logging.getLogger(__name__), fetcher=fake_fetcher(range(1, 3)))
+    first, second = client.results("test_2025", DivisionName.ELITE_MEN, splits=True)
+
+    def arriving() -> Iterator[list[Result]]:
+        yield [
+            Result(r.model.model_copy(update={"splits": None}), r.logger)
+            for r in [first, second]
+        ]
+        raise AssertionError("read ahead of the consumer")
+
+    with ResultStore(tmp_path / "store.db") as store:
+        assert first.model.splits is not None
+        store.put_splits(str(first.model.url), first.model.splits)
+        enricher = ResultEnricher(1, _POLL, first.logger, store=store)
+
+        # each page is looked up in one batch, not a result at a time
+        def get(url: str) -> None:
+            raise AssertionError("looked up a single result")
+
+        monkeypatch.setattr(store, "get", get)
+
+        recalled = enricher.recall(arriving(), splits=True, profile=False)
+        assert [r.model.splits for r in islice(recalled, 2)] == [
+            first.model.splits,
+            None,
+        ]
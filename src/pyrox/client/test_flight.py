@@ -0,0 +1,51 @@
+"""
+Unit tests for single-flight deduplication.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from .flight import SingleFlight
+
+
+def test_single_flight_collapses_concurrent_calls() -> None:
+    """Concurrent calls with the same key share a single call."""
+
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = threading.Event()
+    calls = 0
+
+    def fn() -> int:
+        nonlocal calls
+        calls += 1
+        release.wait()
+        return 42
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(flight.do, "key", fn) for _ in range(4)]
+        # give the followers time to join the leader's call
+        time.sleep(0.1)
+        release.set()
+        outcomes = [f.result() for f in futures]
+
+    assert calls == 1
+    assert [result for result, _ in outcomes] == [42] * 4
+    assert sorted(shared for _, shared in outcomes) == [False, True, True, True]
+
+    # once the call completes, the next call goes through
+    assert flight.do("key", lambda: 7) == (7, False)
+
+
+def test_single_flight_shares_exceptions() -> None:
+    """The leader's exception is raised to every caller."""
+
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    def fn() -> int:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", fn)
@@ -0,0 +1,145 @@
+"""
+Unit tests for live tracking.
+"""
+
+import logging
+from pathlib import Path
+from typing import Callable
+
+import pytest
+import requests
+
+from pyrox.models import DivisionName
+
+from .client import Hyrox
+from .fetch import Fetcher
+from .live import LiveTracker
+
+
+def _tracker(fetcher: Fetcher, splits: bool = False) -> LiveTracker:
+    client = Hyrox(logging.getLogger(__name__), fetcher=fetcher)
+    return LiveTracker(
+        client.event("test_2025"), [DivisionName.ELITE_MEN], splits=splits
+    )
+
+
+def _fail_once(monkeypatch: pytest.MonkeyPatch, fetcher: Fetcher, suffix: str) -> None:
+    """Fail the next request for a URL ending in `suffix` with an HTTP error."""
+    serve = fetcher._serve  # type: ignore[attr-defined]
+    failed = False
+
+    def failing(url: str) -> bytes:
+        nonlocal failed
+        if url.endswith(suffix) and not failed:
+            failed = True
+            raise requests.HTTPError(f"503 Server Error for url: {url}")
+        return serve(url)
+
+    monkeypatch.setattr(fetcher, "_serve", failing)
+
+
+def _names(tracker: LiveTracker) -> list[str]:
+    return [r.name for r in tracker.snapshot()[DivisionName.ELITE_MEN]]
+
+
+def test_poll_reports_new_finisher(fake_fetcher: Callable[..., Fetcher]) -> None:
+    """A new finisher is reported, fetching only the last pages up to an unchanged one."""
+
+    athletes = list(range(1, 251))
+    fetcher = fake_fetcher(athletes)
+    tracker = _tracker(fetcher)
+
+    # results posted before the first poll are not updates
+    assert tracker.poll() == []
+    assert _names(tracker) == [f"Athlete {i}" for i in athletes]
+
+    athletes.append(251)
+    before = fetcher.stats.pages
+    updates = tracker.poll()
+
+    assert [(u.kind, u.result.name) for u in updates] == [("result", "Athlete 251")]
+    assert _names(tracker) == [f"Athlete {i}" for i in athletes]
+    # the event page, then the third and the unchanged second ranking page
+    assert fetcher.stats.pages - before == 3
+
+
+def test_poll_refreshes_reordered_pages(fake_fetcher: Callable[..., Fetcher]) -> None:
+    """A finisher ranked on an earlier page shifts the later pages, which are refreshed."""
+
+    athletes = list(range(1, 251))
+    fetcher = fake_fetcher(athletes)
+    tracker = _tracker(fetcher)
+    tracker.poll()
+
+    athletes.insert(149, 999)
+    before = fetcher.stats.pages
+    updates = tracker.poll()
+
+    assert [(u.kind, u.result.name) for u in updates] == [("result", "Athlete 999")]
+    assert _names(tracker) == [f"Athlete {i}" for i in athletes]
+    # the event page, then every ranking page back to the unchanged first one
+    assert fetcher.stats.pages - before == 4
+
+
+def test_poll_skips_unchanged_division(fake_fetcher: Callable[..., Fetcher]) -> None:
+    """A division without new finishers fetches no ranking pages."""
+
+    fetcher = fake_fetcher(range(1, 251))
+    tracker = _tracker(fetcher)
+    tracker.poll()
+
+    before = fetcher.stats.pages
+    assert tracker.poll() == []
+    assert fetcher.stats.pages - before == 1
+
+
+def test_poll_reports_results_after_failed_page(
+    monkeypatch: pytest.MonkeyPatch, fake_fetcher: Callable[..., Fetcher]
+) -> None:
+    """A page failing partway through a poll leaves its results to the next poll."""
+
+    athletes = list(range(1, 251))
+    fetcher = fake_fetcher(athletes)
+    tracker = _tracker(fetcher)
+    tracker.poll()
+
+    # the third page is refreshed, then the second fails
+    athletes.insert(149, 999)
+    _fail_once(monkeypatch, fetcher, "?p=2")
+    assert tracker.poll() == []
+    assert _names(tracker) == [f"Athlete {i}" for i in range(1, 251)]
+
+    updates = tracker.poll()
+    assert [(u.kind, u.result.name) for u in updates] == [("result", "Athlete 999")]
+    assert _names(tracker) == [f"Athlete {i}" for i in athletes]
+
+
+def test_poll_retries_failed_splits(
+    monkeypatch: pytest.MonkeyPatch, fake_fetcher: Callable[..., Fetcher]
+) -> None:
+    """A new result is reported even if its splits fail to fetch; they follow later."""
+
+    athletes = list(range(1, 251))
+    fetcher = fake_fetcher(athletes)
+    tracker = _tracker(fetcher, splits=True)
+    tracker.poll()
+
+    athletes.append(251)
+    _fail_once(monkeypatch, fetcher, "/result/R251?tab=splits")
+    updates = tracker.poll()
+    assert [(u.kind, u.result.name) for u in updates] == [("result", "Athlete 251")]
+
+    updates = tracker.poll()
+    assert [(u.kind, u.result.name) for u in updates] == [("splits", "Athlete 251")]
+    assert updates[0].result.splits is not None
+
+
+def test_tracker_rejects_caching_fetcher(
+    tmp_path: Path, fake_fetcher: Callable[..., Fetcher]
+) -> None:
+    """A fetcher that caches pages would hide updates, so is rejected."""
+
+    fetcher = fake_fetcher(range(1, 11))
+    fetcher.cache = tmp_path
+    with pytest.raises(ValueError):
+        _tracker(fetcher)
@@ -0,0 +1,101 @@
+"""
+Shared fixtures: a fake results site served without a network.
+"""
+
+import re
+from typing import Callable, Sequence
+
+import pytest
+
+from pyrox.client.fetch import Fetcher
+
+# the number of results on each ranking page
+_PAGE = 100
+
+_EVENTS = (
+    '<div class="rt-reset rt-BaseCard rt-Card rt-r-size-1 rt-variant-surface">'
+    "<h3>HYROX Test 2025</h3>"
+    '<div class="text-sm text-gray-400">1 Jun 2025, Chicago, USA</div>'
+    '<a href="event/test">x</a></div>'
+)
+
+_ROXZONE = '<tr class="border-b"><td>Roxzone</td><td>0:10</td></tr>'
+
+
+class _FakeFetcher(Fetcher):
+    """
+    Serves synthetic pages for a single event, 'test_2025', with a single
+    division, ELITE_MEN, ranking athletes in the order of `athletes`.
+    """
+
+    def __init__(
+        self, athletes: Sequence[int], unposted: dict[int, int] | None = None
+    ) -> None:
+        super().__init__()
+        # the ids of the ranked athletes, in ranking order; read on every request,
+        # so changes to a mutable sequence are served as updated rankings
+        self.athletes = athletes
+        # the number of requests for an athlete's analysis page served before its
+        # splits are posted, by athlete id; counted down as they are served
+        self.unposted = unposted if unposted is not None else {}
+
+    def _get(self, url: str) -> bytes:
+        content = self._serve(url)
+        self.stats.record(len(content), cached=False)
+        return content
+
+    def _serve(self, url: str) -> bytes:
+        if url.endswith("/events?tab=all"):
+            return _EVENTS.encode()
+        if url.endswith("/event/test"):
+            return (
+                '<table><tr class="border-b"><th>h</th></tr><tr class="border-b">'
+                f"<td>HYROX ELITE MEN</td><td>{len(self.athletes)}</td>"
+                '<td><a href="/ranking/test-elite-men">r</a></td></tr></table>'
+            ).encode()
+        if (m := re.search(r"\?p=(\d+)$", url)) is not None:
+            p = int(m.group(1))
+            rows = range((p - 1) * _PAGE, min(p * _PAGE, len(self.athletes)))
+            return (
+                "<table>"
+                + "".join(_ranking(i + 1, self.athletes[i]) for i in rows)
+                + "</table>"
+            ).encode()
+        if (m := re.search(r"/result/R(\d+)\?tab=splits$", url)) is not None:
+            athlete = int(m.group(1))
+            if self.unposted.get(athlete, 0) > 0:
+                self.unposted[athlete] -= 1
+                return b"<table></table>"
+            return _splits()
+        raise AssertionError(f"unexpected URL {url}")
+
+
+def _ranking(position: int, athlete: int) -> str:
+    """A row of a ranking page."""
+    return (
+        f'<tr class="border-t"><td></td><td>{position}</td><td>{position}</td>'
+        f"<td>Athlete {athlete}</td><td>30-34</td><td>1:{athlete % 60:02d}:00</td>"
+        f'<td><a href="/result/R{athlete}">x</a></td></tr>'
+    )
+
+
+def _splits() -> bytes:
+    """An analysis page with splits."""
+    rows = ['<tr class="border-b"><td>Roxzone In</td><td>0:10</td></tr>']
+    for k in range(8):
+        rows.append(f'<tr class="border-b"><td>Run {k}</td><td>4:0{k}</td></tr>')
+        rows.append(_ROXZONE)
+        rows.append(f'<tr class="border-b"><td>Station {k}</td><td>3:0{k}</td></tr>')
+        if k < 6:
+            rows.append(_ROXZONE)
+    return ("<table>" + "".join(rows) + "</table>").encode()
+
+
+@pytest.fixture
+def fake_fetcher() -> Callable[..., Fetcher]:
+    """
+    A factory of fetchers serving the fake site, given the ids of the ranked
+    athletes and, optionally, the analysis pages served before splits are
+    posted; picklable, so worker processes can build their own.
+    """
+    return _FakeFetcher
@@ -0,0 +1,12 @@
+from .athlete import AthleteIndex, AthleteResult
+from .rank import Placement, RankIndex
+from .search import NameMatch, NameSearch
+
+__all__ = [
+    "AthleteIndex",
+    "AthleteResult",
+    "NameMatch",
+    "NameSearch",
+    "Placement",
+    "RankIndex",
+]
@@ -0,0 +1,70 @@
+"""
+Athlete index over loaded results.
+"""
+
+from typing import Iterable, NamedTuple
+
+import pyrox.models as models
+from pyrox.parsers.name import fold_name
+
+
+class AthleteResult(NamedTuple):
+    """A result in the context of the event and division in which it occurred."""
+
+    # the name of the event
+    event: str
+    # the name of the division
+    division: models.DivisionName
+    # the result
+    result: models.Result
+
+
+class AthleteIndex:
+    """An index of results by athlete name and profile URL."""
+
+    def __init__(self) -> None:
+        # results keyed by normalized athlete name
+        self._by_name: dict[str, list[AthleteResult]] = {}
+        # results keyed by athlete profile URL
+        self._by_profile: dict[str, list[AthleteResult]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_name.values())
+
+    def add(
+        self,
+        event: str,
+        division: models.DivisionName,
+        results: Iterable[models.Result],
+    ) -> None:
+        """
+        Add results from a division at an event to the index.
+        :param event: The name of the event
+        :param division: The name of the division
+        :param results: The results
+        """
+        for result in results:
+            entry = AthleteResult(event, division, result)
+            self._by_name.setdefault(fold_name(result.name), []).append(entry)
+            if result.profile is not None:
+                self._by_profile.setdefault(str(result.profile), []).append(entry)
+
+    def by_name(self, name: str) -> list[AthleteResult]:
+        """
+        Get all results for the athlete with the specified name.
+        :param name: The name of the athlete
+        :return: The results for the athlete, possibly empty
+        """
+        return list(self._by_name.get(fold_name(name), []))
+
+    def by_profile(self, profile: str) -> list[AthleteResult]:
+        """
+        Get all results for the athlete with the specified profile URL.
+        :param profile: The athlete profile URL
+        :return: The results for the athlete, possibly empty
+        """
+        return list(self._by_profile.get(str(profile), []))
+
+    def names(self) -> list[str]:
+        """Get the folded names of all indexed athletes."""
+        return list(self._by_name.keys())
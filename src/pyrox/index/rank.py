@@ -0,0 +1,182 @@
+"""
+Rank estimation over loaded results.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+import pyrox.models as models
+from pyrox.io.reader import ResultsReader, ResultsTable
+from pyrox.io.writer import SPLITS, TIME_COLUMNS, flatten_splits
+
+# the name of the finish time column
+FINISH = "finish_time"
+
+# (event name, division name, age group or None for the whole division)
+_Key = tuple[str, str, str | None]
+
+
+class Placement(NamedTuple):
+    """Where a time would have placed."""
+
+    # the position, starting from 1; a tie takes the better position
+    position: int
+    # the percentage of times strictly slower, in [0, 100]
+    percentile: float
+    # the number of times compared against
+    total: int
+
+
+class RankIndex:
+    """
+    Sorted finish and split times for every event × division × age group,
+    answering placement queries by binary search.
+    """
+
+    def __init__(self) -> None:
+        # times in seconds by column, for each event / division / age group
+        self._times: dict[_Key, dict[str, array]] = {}
+        # the keys whose arrays have been added to since they were last sorted
+        self._unsorted: set[_Key] = set()
+
+    def __len__(self) -> int:
+        return sum(
+            len(columns[FINISH])
+            for (_, _, age_group), columns in self._times.items()
+            if age_group is None
+        )
+
+    def add(
+        self,
+        event: str,
+        division: models.DivisionName,
+        results: Iterable[models.Result],
+    ) -> None:
+        """
+        Add results from a division at an event to the index.
+        :param event: The name of the event
+        :param division: The name of the division
+        :param results: The results
+        """
+        for r in results:
+            splits = flatten_splits(r.splits) if r.splits is not None else None
+            age_group = str(r.age_group) if r.age_group is not None else "unknown"
+            self._add(
+                event, str(division), age_group, int(r.time.total_seconds()), splits
+            )
+
+    def add_table(self, table: ResultsTable) -> None:
+        """
+        Add the results in a table read with `ResultsReader.read_table`.
+        :param table: A table with the columns in `TIME_COLUMNS`
+        """
+        columns = [table[name] for name in TIME_COLUMNS]
+        events, divisions, age_groups, finish, has_splits = columns[:5]
+        splits = columns[5:]
+        for i in range(len(table)):
+            self._add(
+                str(events[i]),
+                str(divisions[i]),
+                str(age_groups[i]),
+                int(finish[i]),
+                [int(s[i]) for s in splits] if has_splits[i] else None,
+            )
+
+    def place(
+        self,
+        event: str,
+        division: models.DivisionName,
+        time: timedelta | int,
+        split: str | None = None,
+        age_group: models.AgeGroup | None = None,
+    ) -> Placement:
+        """
+        Get where a time would have placed.
+        :param event: The name of the event
+        :param division: The name of the division
+        :param time: The time, as a duration or in seconds
+        :param split: Compare against a split column (e.g. 'run_1', 'sled_push'), instead of finish times
+        :param age_group: Compare within an age group, instead of the whole division
+        :return: The placement
+        """
+        return self.place_many(event, division, [time], split, age_group)[0]
+
+    def place_many(
+        self,
+        event: str,
+        division: models.DivisionName,
+        times: Iterable[timedelta | int],
+        split: str | None = None,
+        age_group: models.AgeGroup | None = None,
+    ) -> list[Placement]:
+        """
+        Get where each of many times would have placed, in one pass.
+        :param event: The name of the event
+        :param division: The name of the division
+        :param times: The times, as durations or in seconds
+        :param split: Compare against a split column (e.g. 'run_1', 'sled_push'), instead of finish times
+        :param age_group: Compare within an age group, instead of the whole division
+        :raises: KeyError if nothing is indexed for the event, division and age group
+        :return: The placements, in the order of `times`
+        """
+        key = (event, str(division), str(age_group) if age_group is not None else None)
+        column = self._column(key, split if split is not None else FINISH)
+        n = len(column)
+
+        seconds = [
+            int(t.total_seconds()) if isinstance(t, timedelta) else t for t in times
+        ]
+        placements: list[Placement | None] = [None] * len(seconds)
+
+        # visit the times in ascending order, so each search starts where the last ended
+        lo = 0
+        for i in sorted(range(len(seconds)), key=seconds.__getitem__):
+            lo = bisect_left(column, seconds[i], lo)
+            hi = bisect_right(column, seconds[i], lo)
+            placements[i] = Placement(lo + 1, 100 * (n - hi) / n if n > 0 else 0.0, n)
+
+        return [p for p in placements if p is not None]
+
+    @staticmethod
+    def build(results: Path) -> "RankIndex":
+        """
+        Build an index from a results file.
+        :param results: The path to the results file
+        :return: The index
+        """
+        index = RankIndex()
+        index.add_table(ResultsReader(results).read_table(TIME_COLUMNS))
+        return index
+
+    def _add(
+        self,
+        event: str,
+        division: str,
+        age_group: str,
+        finish: int,
+        splits: list[int] | None,
+    ) -> None:
+        """Add a result to its age group and to its whole division."""
+        for key in [(event, division, age_group), (event, division, None)]:
+            columns = self._times.get(key)
+            if columns is None:
+                columns = self._times[key] = {
+                    name: array("i") for name in [FINISH] + SPLITS
+                }
+            columns[FINISH].append(finish)
+            if splits is not None:
+                for name, seconds in zip(SPLITS, splits):
+                    columns[name].append(seconds)
+            self._unsorted.add(key)
+
+    def _column(self, key: _Key, name: str) -> array:
+        """Get a column of times, sorted."""
+        columns = self._times[key]
+        if key in self._unsorted:
+            for c, values in columns.items():
+                columns[c] = array("i", sorted(values))
+            self._unsorted.discard(key)
+        return columns[name]
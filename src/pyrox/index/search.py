@@ -0,0 +1,197 @@
+"""
+Fuzzy athlete name search over loaded results.
+"""
+
+import heapq
+import math
+from array import array
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+from typing import Iterable, NamedTuple
+
+import pyrox.models as models
+from pyrox.parsers.name import fold_name
+
+from .athlete import AthleteIndex
+
+# the number of candidate names past which common query words no longer add candidates
+_MAX_CANDIDATES = 256
+# the number of most similar indexed words considered for each query word
+_MAX_SIMILAR = 5
+# the number of indexed words scored for each query word
+_MAX_VERIFIED = 32
+
+
+class NameMatch(NamedTuple):
+    """A name matching a search."""
+
+    # the name, as it appears in results
+    name: str
+    # the similarity to the query, in (0, 1]
+    score: float
+
+
+class NameSearch:
+    """
+    An index of athlete names for fuzzy search. Names are folded (case,
+    accents, punctuation) and split into words; query words are matched to
+    indexed words by the similarity of their character trigrams, so only
+    names sharing a similar word are ever scored. Word order does not matter.
+    """
+
+    def __init__(self) -> None:
+        # folded names, by name id
+        self._names: list[str] = []
+        # the spellings of each folded name seen in results, by name id
+        self._spellings: list[set[str]] = []
+        # the word ids of each folded name, by name id
+        self._name_words: list[tuple[int, ...]] = []
+        # name ids by folded name
+        self._name_ids: dict[str, int] = {}
+
+        # words, by word id
+        self._words: list[str] = []
+        # word ids by word
+        self._word_ids: dict[str, int] = {}
+        # the trigrams of each word, by word id
+        self._word_grams: list[frozenset[str]] = []
+        # ids of the words containing each trigram
+        self._grams: dict[str, array] = {}
+        # ids of the names containing each word, by word id
+        self._postings: list[array] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, names: Iterable[str]) -> None:
+        """
+        Add athlete names to the index.
+        :param names: The names, as they appear in results
+        """
+        for name in names:
+            folded = fold_name(name)
+            i = self._name_ids.get(folded)
+            if i is None:
+                i = self._name_ids[folded] = len(self._names)
+                words = tuple(dict.fromkeys(self._word(w) for w in folded.split()))
+                self._names.append(folded)
+                self._spellings.append(set())
+                self._name_words.append(words)
+                for w in words:
+                    self._postings[w].append(i)
+            self._spellings[i].add(name)
+
+    def add_results(self, results: Iterable[models.Result]) -> None:
+        """
+        Add the athlete names of results to the index.
+        :param results: The results
+        """
+        self.add(r.name for r in results)
+
+    @staticmethod
+    def from_athletes(athletes: AthleteIndex) -> "NameSearch":
+        """
+        Build a search index over the athletes in an athlete index.
+        :param athletes: The athlete index
+        :return: The search index
+        """
+        search = NameSearch()
+        for name in athletes.names():
+            search.add(entry.result.name for entry in athletes.by_name(name))
+        return search
+
+    def search(
+        self, query: str, limit: int = 10, threshold: float = 0.5
+    ) -> list[NameMatch]:
+        """
+        Find the names most similar to a query.
+        :param query: The name to search for
+        :param limit: The maximum number of matches
+        :param threshold: The minimum similarity of a match, in (0, 1]
+        :return: The matches, most similar first
+        """
+        words = list(dict.fromkeys(fold_name(query).split()))
+        if len(words) == 0:
+            return []
+
+        # the indexed words similar to each query word, with their similarity
+        similar = [self._similar(w, threshold) for w in words]
+
+        # candidates contain a word similar to a query word; the rarest query
+        # words are used first, and more only while the candidates are few
+        order = sorted(
+            range(len(words)),
+            key=lambda q: sum(len(self._postings[w]) for w in similar[q]),
+        )
+        candidates: set[int] = set()
+        for q in order:
+            postings = [self._postings[w] for w in similar[q]]
+            size = sum(len(p) for p in postings)
+            if len(candidates) > 0 and len(candidates) + size > _MAX_CANDIDATES:
+                break
+            for p in postings:
+                candidates.update(p)
+
+        # score by the best similarity of each query word to a word of the name
+        scored: list[tuple[float, int]] = []
+        for i in candidates:
+            name_words = self._name_words[i]
+            total = sum(
+                max((s.get(w, 0.0) for w in name_words), default=0.0) for s in similar
+            )
+            score = 2 * total / (len(words) + len(name_words))
+            if score >= threshold:
+                scored.append((score, i))
+        scored.sort(key=lambda s: (-s[0], self._names[s[1]]))
+
+        matches: list[NameMatch] = []
+        for score, i in scored:
+            for name in sorted(self._spellings[i]):
+                matches.append(NameMatch(name, min(score, 1.0)))
+        return matches[:limit]
+
+    def _word(self, word: str) -> int:
+        """Get the id of a word, indexing it if new."""
+        w = self._word_ids.get(word)
+        if w is None:
+            w = self._word_ids[word] = len(self._words)
+            grams = frozenset(_trigrams(word))
+            self._words.append(word)
+            self._word_grams.append(grams)
+            self._postings.append(array("i"))
+            for gram in grams:
+                self._grams.setdefault(gram, array("i")).append(w)
+        return w
+
+    def _similar(self, word: str, threshold: float) -> dict[int, float]:
+        """Get the indexed words most similar to a word, by the Dice similarity of their trigrams."""
+        grams = _trigrams(word)
+
+        # a similar word shares at least `need` trigrams, so it contains one of
+        # the rarest len(grams) - need + 1 of them; only those postings are read
+        need = max(1, math.ceil(threshold * len(grams) / (2 - threshold)))
+        ranked = sorted(grams, key=lambda g: len(self._grams.get(g, ())))
+        hits = Counter(
+            chain.from_iterable(
+                self._grams.get(gram, ()) for gram in ranked[: len(grams) - need + 1]
+            )
+        )
+        # words sharing the most rare trigrams are the most similar; only those are scored
+        candidates = [
+            w for w, _ in heapq.nlargest(_MAX_VERIFIED, hits.items(), key=itemgetter(1))
+        ]
+
+        scored: list[tuple[float, int]] = []
+        for w in candidates:
+            other = self._word_grams[w]
+            score = 2 * len(grams & other) / (len(grams) + len(other))
+            if score >= threshold:
+                scored.append((score, w))
+        return {w: score for score, w in heapq.nlargest(_MAX_SIMILAR, scored)}
+
+
+def _trigrams(word: str) -> set[str]:
+    """Get the trigrams of a word, padded so short words and prefixes count."""
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
@@ -0,0 +1,53 @@
+"""
+Unit tests for athlete index.
+"""
+
+from datetime import timedelta
+
+from pydantic import HttpUrl
+
+import pyrox.models as models
+
+from .athlete import AthleteIndex
+
+
+def _result(name: str, profile: str | None = None) -> models.Result:
+    return models.Result(
+        position=1,
+        name=name,
+        time=timedelta(hours=1),
+        url=HttpUrl("https://www.hyresult.com/result/X"),
+        profile=HttpUrl(profile) if profile is not None else None,
+    )
+
+
+def test_athlete_index() -> None:
+    """Athlete index behaves as expected."""
+
+    index = AthleteIndex()
+    index.add(
+        "chicago_2025",
+        models.DivisionName.ELITE_MEN,
+        [
+            _result("Hunter McIntyre", "https://www.hyresult.com/athlete/hunter"),
+            _result("Rich Ryan"),
+        ],
+    )
+    index.add(
+        "glasgow_2025",
+        models.DivisionName.ELITE_MEN,
+        [_result("hunter  mcintyre", "https://www.hyresult.com/athlete/hunter")],
+    )
+
+    assert len(index) == 3
+
+    found = index.by_name("HUNTER MCINTYRE")
+    assert [e.event for e in found] == ["chicago_2025", "glasgow_2025"]
+    # names are folded as name search folds them
+    assert index.by_name("Hunter-McIntyre") == found
+
+    found = index.by_profile("https://www.hyresult.com/athlete/hunter")
+    assert len(found) == 2
+
+    assert index.by_name("nobody") == []
+    assert len(index.by_name("rich ryan")) == 1
@@ -0,0 +1,74 @@
+"""
+Unit tests for rank index.
+"""
+
+from datetime import timedelta
+from pathlib import Path
+
+from pydantic import HttpUrl
+
+import pyrox.models as models
+from pyrox.io.writer import ResultsWriter
+
+from .rank import Placement, RankIndex
+
+
+def _result(position: int) -> models.Result:
+    return models.Result(
+        position=position,
+        name=f"Athlete {position}",
+        age_group=models.AgeGroup.AG_30_34 if position % 2 == 0 else None,
+        time=timedelta(seconds=3600 + 10 * position),
+        url=HttpUrl(f"https://www.hyresult.com/result/R{position}"),
+        splits=models.Splits(
+            runs=[timedelta(seconds=240) for _ in range(8)],
+            stations={
+                name: timedelta(seconds=100 + position) for name in models.Station
+            },
+        ),
+    )
+
+
+def test_rank_index(tmp_path: Path) -> None:
+    """Placements match a linear scan, for single and batched queries."""
+
+    results = [_result(i + 1) for i in range(100)]
+    division = models.DivisionName.PRO_MEN
+
+    path = tmp_path / "results.csv"
+    ResultsWriter("chicago_2025", division).write(results, path)
+
+    index = RankIndex()
+    index.add("chicago_2025", division, reversed(results))
+
+    for idx in [index, RankIndex.build(path)]:
+        assert len(idx) == 100
+
+        # a tie takes the better position; 10 results are strictly slower
+        assert idx.place("chicago_2025", division, 3600 + 900) == Placement(
+            90, 10.0, 100
+        )
+        assert idx.place("chicago_2025", division, timedelta(hours=1)) == Placement(
+            1, 100.0, 100
+        )
+        assert idx.place("chicago_2025", division, 10_000) == Placement(101, 0.0, 100)
+
+        # within an age group, and against a station split
+        assert idx.place(
+            "chicago_2025", division, 3600 + 500, age_group=models.AgeGroup.AG_30_34
+        ) == Placement(25, 50.0, 50)
+        assert idx.place(
+            "chicago_2025", division, 150, split=models.Station.SledPush
+        ) == Placement(50, 50.0, 100)
+
+    times = [3600 + 7 * i for i in range(200)][::-1]
+    finish = sorted(int(r.time.total_seconds()) for r in results)
+    expected = [
+        Placement(
+            sum(f < t for f in finish) + 1,
+            100 * sum(f > t for f in finish) / 100,
+            100,
+        )
+        for t in times
+    ]
+    assert index.place_many("chicago_2025", division, times) == expected
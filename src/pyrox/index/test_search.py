@@ -0,0 +1,82 @@
+"""
+Unit tests for name search.
+"""
+
+from datetime import timedelta
+
+from pydantic import HttpUrl
+
+import pyrox.models as models
+
+from .athlete import AthleteIndex
+from .search import NameSearch
+
+
+def _result(name: str) -> models.Result:
+    return models.Result(
+        position=1,
+        name=name,
+        time=timedelta(hours=1),
+        url=HttpUrl("https://www.hyresult.com/result/X"),
+    )
+
+
+def test_name_search() -> None:
+    """Name search finds close matches, best first."""
+
+    search = NameSearch()
+    search.add(
+        [
+            "Hunter McIntyre",
+            "hunter mcintyre",
+            "Alexander Rončević",
+            "Rich Ryan",
+            "Tim Wenisch",
+            "Megan Jacoby",
+            "Lauren Weeks",
+        ]
+    )
+    assert len(search) == 6
+
+    # every spelling of the best match is returned
+    found = search.search("HUNTER MCINTYRE")
+    assert [m.name for m in found[:2]] == ["Hunter McIntyre", "hunter mcintyre"]
+    assert found[0].score == 1.0
+
+    # accents, typos and word order do not matter
+    assert search.search("alexander roncevic")[0].name == "Alexander Rončević"
+    assert search.search("Alexnder Roncevic")[0].name == "Alexander Rončević"
+    assert search.search("Wenisch Tim")[0].name == "Tim Wenisch"
+    assert search.search("ryan")[0].name == "Rich Ryan"
+
+    # matches are limited and ranked
+    found = search.search("Lauren Weeks", limit=1)
+    assert [m.name for m in found] == ["Lauren Weeks"]
+    scores = [m.score for m in search.search("Hunter Weeks")]
+    assert scores == sorted(scores, reverse=True)
+
+    assert search.search("Zzyzx Qwerty") == []
+    assert search.search("") == []
+
+
+def test_name_search_from_athletes() -> None:
+    """Name search is built over an athlete index."""
+
+    index = AthleteIndex()
+    index.add(
+        "chicago_2025",
+        models.DivisionName.ELITE_MEN,
+        [_result("Hunter McIntyre"), _result("Rich Ryan")],
+    )
+    index.add(
+        "glasgow_2025",
+        models.DivisionName.ELITE_MEN,
+        [_result("hunter  mcintyre")],
+    )
+
+    search = NameSearch.from_athletes(index)
+    assert len(search) == 2
+    assert {m.name for m in search.search("hunter mcintyre")} == {
+        "Hunter McIntyre",
+        "hunter  mcintyre",
+    }
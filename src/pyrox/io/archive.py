@@ -0,0 +1,187 @@
+"""
+Compressed archive of raw fetched pages.
+"""
+
+from __future__ import annotations
+
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple
+
+# record header: (url length, fetch time, compressed content length)
+_HEADER = struct.Struct("<IdI")
+
+# the name of the index file within the archive directory
+_INDEX = "index.tsv"
+
+
+class ArchivedPage(NamedTuple):
+    """A page read back from the archive."""
+
+    # the URL from which the page was fetched
+    url: str
+    # the fetch time, in seconds since the epoch
+    fetched_at: float
+    # the raw page content
+    content: bytes
+
+
+class _Entry(NamedTuple):
+    """The location of an archived page."""
+
+    # the fetch time, in seconds since the epoch
+    fetched_at: float
+    # the name of the segment file
+    segment: str
+    # the offset of the record within the segment
+    offset: int
+
+
+class PageArchive:
+    """
+    An append-only archive of fetched pages, stored as zlib-compressed records
+    in segment files, with an index by URL and fetch time.
+
+    An archive directory must only be written by one process at a time.
+    """
+
+    def __init__(self, root: Path, segment_size: int = 64 * 1024 * 1024) -> None:
+        # the archive directory
+        self.root = root
+        # the size at which a new segment file is started, in bytes
+        self.segment_size = segment_size
+
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        # archived pages by URL, in order of fetch
+        self._index: dict[str, list[_Entry]] = {}
+        # guards appends
+        self._lock = threading.Lock()
+
+        self._load_index()
+
+        segments = self.segments()
+        self._segment = segments[-1] if len(segments) > 0 else self._segment_path(0)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._index.values())
+
+    def append(self, url: str, content: bytes, fetched_at: float | None = None) -> None:
+        """
+        Append a fetched page to the archive.
+        :param url: The URL from which the page was fetched
+        :param content: The raw page content
+        :param fetched_at: The fetch time, in seconds since the epoch; defaults to now
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        record = _encode(url, content, fetched_at)
+
+        with self._lock:
+            if (
+                self._segment.exists()
+                and self._segment.stat().st_size + len(record) > self.segment_size
+            ):
+                self._segment = self._segment_path(_segment_number(self._segment) + 1)
+
+            with self._segment.open("ab") as f:
+                offset = f.tell()
+                f.write(record)
+
+            entry = _Entry(fetched_at, self._segment.name, offset)
+            with (self.root / _INDEX).open("a") as f:
+                f.write(f"{fetched_at!r}\t{entry.segment}\t{offset}\t{url}\n")
+
+            self._index.setdefault(url, []).append(entry)
+
+    def get(self, url: str) -> bytes | None:
+        """
+        Get the most recently fetched content for `url`.
+        :param url: The URL
+        :return: The content, or `None` if the URL is not archived
+        """
+        entries = self._index.get(url)
+        if entries is None:
+            return None
+
+        entry = max(entries)
+        with (self.root / entry.segment).open("rb") as f:
+            f.seek(entry.offset)
+            page = _read(f)
+
+        assert page is not None
+        return page.content
+
+    def history(self, url: str) -> list[float]:
+        """
+        Get the times at which `url` was fetched.
+        :param url: The URL
+        :return: The fetch times, in seconds since the epoch, in order
+        """
+        return sorted(e.fetched_at for e in self._index.get(url, []))
+
+    def urls(self) -> list[str]:
+        """Get all archived URLs."""
+        return list(self._index.keys())
+
+    def segments(self) -> list[Path]:
+        """Get the segment files, in order."""
+        return sorted(self.root.glob("segment-*.bin"))
+
+    def _load_index(self) -> None:
+        """Load the index from disk, if present."""
+        path = self.root / _INDEX
+        if not path.exists():
+            return
+
+        with path.open() as f:
+            for line in f:
+                fetched_at, segment, offset, url = line.rstrip("\n").split("\t", 3)
+                self._index.setdefault(url, []).append(
+                    _Entry(float(fetched_at), segment, int(offset))
+                )
+
+    def _segment_path(self, n: int) -> Path:
+        """Get the path to the segment file with number `n`."""
+        return self.root / f"segment-{n:06d}.bin"
+
+
+def read_segment(path: Path) -> Iterator[ArchivedPage]:
+    """
+    Read all pages in a segment file, in the order they were appended.
+    :param path: The path to the segment file
+    :return: An iterator over the archived pages
+    """
+    with path.open("rb") as f:
+        while (page := _read(f)) is not None:
+            yield page
+
+
+def _encode(url: str, content: bytes, fetched_at: float) -> bytes:
+    """Encode a page as a segment record."""
+    encoded_url = url.encode()
+    compressed = zlib.compress(content)
+    return (
+        _HEADER.pack(len(encoded_url), fetched_at, len(compressed))
+        + encoded_url
+        + compressed
+    )
+
+
+def _read(f: BinaryIO) -> ArchivedPage | None:
+    """Read the record at the current position in a segment file."""
+    header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+
+    n_url, fetched_at, n_content = _HEADER.unpack(header)
+    url = f.read(n_url).decode()
+    content = zlib.decompress(f.read(n_content))
+    return ArchivedPage(url, fetched_at, content)
+
+
+def _segment_number(path: Path) -> int:
+    """Get the number of the segment file at `path`."""
+    return int(path.stem.removeprefix("segment-"))
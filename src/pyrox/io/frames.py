@@ -0,0 +1,146 @@
+"""
+DataFrame and Arrow export of results tables.
+"""
+
+import importlib
+from types import ModuleType
+from typing import Any, Iterable
+
+import pyrox.models as models
+
+from .reader import ResultsTable
+from .writer import COLUMNS, SPLITS
+
+# integer columns holding durations, in seconds
+_DURATION_COLUMNS = {"finish_time", *SPLITS}
+
+# split columns, which hold 0 in results without splits; no posted split takes 0 seconds
+_SPLIT_COLUMNS = _DURATION_COLUMNS - {"finish_time"}
+
+# the values written for missing data, exported as nulls
+_MISSING: dict[str, int | str] = {
+    "event_name": "unknown",
+    "division_name": "unknown",
+    "age_group": "unknown",
+    "position_ag": -1,
+    "profile_url": "n/a",
+}
+
+
+def table_from_results(
+    results: Iterable[models.Result],
+    event: str | None = None,
+    division: models.DivisionName | None = None,
+    columns: Iterable[str] | None = None,
+) -> ResultsTable:
+    """
+    Build a table from results, in a single pass.
+    :param results: The results
+    :param event: The name of the event
+    :param division: The name of the division
+    :param columns: Include only these columns; defaults to all columns
+    :return: The table, as `ResultsReader.read_table` would read it back
+    """
+    table = ResultsTable(list(columns) if columns is not None else list(COLUMNS))
+    table.add(event, division, results)
+    return table
+
+
+def to_arrow(table: ResultsTable, native: bool = False) -> Any:
+    """
+    Export a table as an Arrow table. Every column is copied in bulk, so the
+    table may keep growing while the export is alive. Missing values, and the
+    splits of results without splits, are nulls; results without splits are
+    found from the `has_splits` column, or, if it was not read, by their
+    splits of 0 seconds.
+    :param table: The table
+    :param native: Type durations as Arrow durations, instead of integer seconds
+    :raises: ImportError if pyarrow is not installed
+    :return: A `pyarrow.Table` with the table's columns, named as in `ResultsWriter`'s header
+    """
+    pa = _require("pyarrow", "Arrow export")
+    pc = _require("pyarrow.compute", "Arrow export")
+
+    n = len(table)
+    has_splits = (
+        _bools(pa, table["has_splits"], n) if "has_splits" in table.columns else None
+    )
+    # without the column, a result has splits if any split column read is not 0
+    if has_splits is None:
+        for name in _SPLIT_COLUMNS.intersection(table.columns):
+            posted = pc.not_equal(_ints(pa, table[name], n), 0)
+            has_splits = posted if has_splits is None else pc.or_(has_splits, posted)
+
+    arrays = []
+    for name, values in table.columns.items():
+        if isinstance(values, list):
+            array = pa.array(values[:n], type=pa.string())
+        elif values.typecode == "b":
+            array = _bools(pa, values, n)
+        else:
+            array = _ints(pa, values, n)
+
+        missing = _MISSING.get(name)
+        if missing is not None:
+            array = pc.if_else(
+                pc.equal(array, missing), pa.scalar(None, array.type), array
+            )
+        if name in _SPLIT_COLUMNS and has_splits is not None:
+            array = pc.if_else(has_splits, array, pa.scalar(None, array.type))
+        if name in _DURATION_COLUMNS and native:
+            array = array.cast(pa.int64()).cast(pa.duration("s"))
+        arrays.append(array)
+
+    return pa.Table.from_arrays(arrays, names=list(table.columns))
+
+
+def to_pandas(table: ResultsTable, native: bool = False) -> Any:
+    """
+    Export a table as a pandas DataFrame, through Arrow.
+    :param table: The table
+    :param native: Type durations as timedeltas, instead of integer seconds
+    :raises: ImportError if pandas or pyarrow is not installed
+    :return: A `pandas.DataFrame`
+    """
+    _require("pandas", "pandas export")
+    return to_arrow(table, native).to_pandas()
+
+
+def to_polars(table: ResultsTable, native: bool = False) -> Any:
+    """
+    Export a table as a Polars DataFrame, through Arrow without copying.
+    :param table: The table
+    :param native: Type durations as Polars durations, instead of integer seconds
+    :raises: ImportError if polars or pyarrow is not installed
+    :return: A `polars.DataFrame`
+    """
+    pl = _require("polars", "Polars export")
+    return pl.from_arrow(to_arrow(table, native))
+
+
+def _ints(pa: ModuleType, values: Any, n: int) -> Any:
+    """
+    Copy a column of integers to an Arrow integer array, in bulk; wrapping the
+    column's own memory would keep it from growing while the export is alive.
+    """
+    width = pa.int32() if values.itemsize == 4 else pa.int64()
+    return pa.Array.from_buffers(width, n, [None, pa.py_buffer(values[:n].tobytes())])
+
+
+def _bools(pa: ModuleType, values: Any, n: int) -> Any:
+    """Copy a column of 8-bit booleans to an Arrow boolean array, in bulk."""
+    flags = pa.Array.from_buffers(
+        pa.int8(), n, [None, pa.py_buffer(values[:n].tobytes())]
+    )
+    return flags.cast(pa.bool_())
+
+
+def _require(name: str, feature: str) -> ModuleType:
+    """Import an optional dependency, imported on first use."""
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        package = name.split(".")[0]
+        raise ImportError(
+            f"{feature} requires '{package}'; install it with pip install 'pyrox[frames]'"
+        ) from e
@@ -0,0 +1,265 @@
+"""
+Results reader.
+"""
+
+import csv
+import io
+import mmap
+from array import array
+from datetime import timedelta
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+from pydantic import HttpUrl
+
+import pyrox.models as models
+
+from .writer import COLUMNS, SPLITS, flatten_splits
+
+# columns holding integers, stored as 32-bit arrays in a table;
+# unknown positions are stored as -1
+_INT_COLUMNS = {"position", "position_ag", "finish_time", *SPLITS}
+
+# columns holding booleans, stored as 8-bit arrays in a table
+_BOOL_COLUMNS = {"has_splits", "has_profile"}
+
+# the values of the columns taken from a result's own fields, as read back into a table
+_FIELDS: dict[str, Callable[[models.Result], int | str]] = {
+    "athlete_name": attrgetter("name"),
+    "age_group": lambda r: str(r.age_group) if r.age_group is not None else "unknown",
+    "position": attrgetter("position"),
+    "position_ag": lambda r: r.position_ag if r.position_ag is not None else -1,
+    "finish_time": lambda r: r.time.seconds,
+    "analysis_url": lambda r: str(r.url),
+    "has_splits": lambda r: r.splits is not None,
+    "has_profile": lambda r: r.profile is not None,
+    "profile_url": lambda r: str(r.profile) if r.profile is not None else "n/a",
+}
+
+# the split values of a result without splits
+_NO_SPLITS = [0] * len(SPLITS)
+
+
+class RecordedResult(NamedTuple):
+    """A result read back from a file, with the event and division in which it occurred."""
+
+    # the name of the event, if recorded
+    event: str | None
+    # the name of the division, if recorded
+    division: models.DivisionName | None
+    # the result
+    result: models.Result
+
+
+class ResultsTable:
+    """A compact columnar table of results."""
+
+    def __init__(self, columns: list[str]) -> None:
+        # the column data, by column name: array('i') for integers,
+        # array('b') for booleans, and list[str] for text
+        self.columns: dict[str, array | list[str]] = {
+            name: (
+                array("i")
+                if name in _INT_COLUMNS
+                else array("b") if name in _BOOL_COLUMNS else []
+            )
+            for name in columns
+        }
+
+    def __len__(self) -> int:
+        return min((len(c) for c in self.columns.values()), default=0)
+
+    def __getitem__(self, name: str) -> array | list[str]:
+        return self.columns[name]
+
+    def add(
+        self,
+        event: str | None,
+        division: models.DivisionName | None,
+        results: Iterable[models.Result],
+    ) -> None:
+        """
+        Add results from a division at an event, with the values they would be read back with.
+        :param event: The name of the event
+        :param division: The name of the division
+        :param results: The results
+        """
+        constants = {
+            "event_name": event if event is not None else "unknown",
+            "division_name": str(division) if division is not None else "unknown",
+        }
+        # the columns filled with a constant, from a result's fields, and from its splits
+        fixed = [(c, constants[n]) for n, c in self.columns.items() if n in constants]
+        fields = [(c, _FIELDS[n]) for n, c in self.columns.items() if n in _FIELDS]
+        splits = [(c, SPLITS.index(n)) for n, c in self.columns.items() if n in SPLITS]
+
+        for result in results:
+            for column, value in fixed:
+                column.append(value)  # type: ignore[arg-type]
+            for column, field in fields:
+                column.append(field(result))  # type: ignore[arg-type]
+            if len(splits) > 0:
+                seconds = (
+                    flatten_splits(result.splits)
+                    if result.splits is not None
+                    else _NO_SPLITS
+                )
+                for column, i in splits:
+                    column.append(seconds[i])  # type: ignore[arg-type]
+
+
+class ResultsReader:
+    """A fast reader for results written by `ResultsWriter`."""
+
+    def __init__(self, path: Path, chunk_size: int = 16 * 1024 * 1024) -> None:
+        # the path from which results are read
+        self.path = path
+        # the approximate number of bytes parsed at once
+        self.chunk_size = chunk_size
+
+    def read(
+        self,
+        events: Iterable[str] | None = None,
+        divisions: Iterable[models.DivisionName] | None = None,
+    ) -> Iterator[RecordedResult]:
+        """
+        Read results back into typed models.
+        :param events: Read only results from events with these names
+        :param divisions: Read only results from divisions with these names
+        :return: An iterator over the results
+        """
+        for row in self._rows(events, divisions):
+            yield _to_result(COLUMNS, row)
+
+    def read_table(
+        self,
+        columns: Iterable[str] | None = None,
+        events: Iterable[str] | None = None,
+        divisions: Iterable[models.DivisionName] | None = None,
+    ) -> ResultsTable:
+        """
+        Read results into a compact columnar table.
+        :param columns: Read only these columns; defaults to all columns
+        :param events: Read only results from events with these names
+        :param divisions: Read only results from divisions with these names
+        :raises: ValueError if a requested column does not exist
+        :return: The table
+        """
+        names = list(columns) if columns is not None else list(COLUMNS)
+        unknown = set(names) - set(COLUMNS)
+        if len(unknown) > 0:
+            raise ValueError(f"unknown columns: {', '.join(sorted(unknown))}")
+
+        table = ResultsTable(names)
+        projection = [(COLUMNS.index(name), table.columns[name]) for name in names]
+        for row in self._rows(events, divisions):
+            for i, column in projection:
+                column.append(_convert(COLUMNS[i], row[i]))  # type: ignore[arg-type]
+
+        return table
+
+    def _rows(
+        self,
+        events: Iterable[str] | None,
+        divisions: Iterable[models.DivisionName] | None,
+    ) -> Iterator[list[str]]:
+        """
+        Parse the raw rows of the file, in chunks of a memory map,
+        skipping rows that do not match the event and division filters.
+        """
+        event_set = set(events) if events is not None else None
+        division_set = {str(d) for d in divisions} if divisions is not None else None
+
+        with self.path.open("rb") as f:
+            if self.path.stat().st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                end = m.find(b"\n") + 1
+                if end == 0 or _split(m[:end]) != COLUMNS:
+                    raise ValueError(f"file at path {self.path} is not a results file")
+
+                for chunk in _chunks(m, end, self.chunk_size):
+                    # quoted fields may hold newlines, so rows are split by the parser
+                    for row in csv.reader(io.StringIO(chunk.decode(), newline="")):
+                        if event_set is not None and row[0] not in event_set:
+                            continue
+                        if division_set is not None and row[1] not in division_set:
+                            continue
+                        yield row
+
+
+def _chunks(m: mmap.mmap, start: int, size: int) -> Iterator[bytes]:
+    """
+    Split a memory map into chunks of whole records, from offset `start`.
+    A newline ends a record only outside quotes, that is, after an even number
+    of quote characters since the start of the chunk.
+    """
+    while start < len(m):
+        end = min(start + size, len(m)) - 1
+        counted, quotes = start, 0
+        while True:
+            newline = m.find(b"\n", end)
+            end = len(m) if newline == -1 else newline + 1
+            quotes += m[counted:end].count(b'"')
+            counted = end
+            if quotes % 2 == 0 or end == len(m):
+                break
+        yield m[start:end]
+        start = end
+
+
+def _split(line: bytes) -> list[str]:
+    """Parse a single CSV line."""
+    return next(csv.reader([line.decode()]))
+
+
+def _convert(column: str, value: str) -> int | str:
+    """Convert a raw value to its column type, for a table."""
+    if column in _INT_COLUMNS:
+        return int(value) if value != "unknown" else -1
+    if column in _BOOL_COLUMNS:
+        return value == "true"
+    return value
+
+
+def _to_result(header: list[str], row: list[str]) -> RecordedResult:
+    """Convert a raw row to a typed result."""
+    data = dict(zip(header, row))
+
+    splits = None
+    if data["has_splits"] == "true":
+        splits = models.Splits.model_construct(
+            runs=[timedelta(seconds=int(data[f"run_{i + 1}"])) for i in range(8)],
+            stations={
+                name: timedelta(seconds=int(data[str(name)])) for name in models.Station
+            },
+        )
+
+    result = models.Result.model_construct(
+        position=int(data["position"]),
+        position_ag=(
+            int(data["position_ag"]) if data["position_ag"] != "unknown" else None
+        ),
+        name=data["athlete_name"],
+        age_group=(
+            models.AgeGroup(data["age_group"])
+            if data["age_group"] != "unknown"
+            else None
+        ),
+        time=timedelta(seconds=int(data["finish_time"])),
+        url=HttpUrl(data["analysis_url"]),
+        splits=splits,
+        profile=(
+            HttpUrl(data["profile_url"]) if data["has_profile"] == "true" else None
+        ),
+    )
+    return RecordedResult(
+        data["event_name"] if data["event_name"] != "unknown" else None,
+        (
+            models.DivisionName(data["division_name"])
+            if data["division_name"] != "unknown"
+            else None
+        ),
+        result,
+    )
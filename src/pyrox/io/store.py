@@ -0,0 +1,134 @@
+"""
+Persistent store of parsed splits and profile URLs.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import struct
+import threading
+from itertools import batched
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+import pyrox.models as models
+
+from .writer import flatten_splits, unflatten_splits
+
+# encoded splits: 8 run seconds followed by 8 station seconds
+_SPLITS = struct.Struct("<16i")
+
+# the maximum number of URLs looked up in one query
+_BATCH = 500
+
+
+class StoredResult(NamedTuple):
+    """The enrichment data stored for a result."""
+
+    # the splits, if stored
+    splits: models.Splits | None
+    # the athlete profile URL, if stored
+    profile: str | None
+
+
+class ResultStore:
+    """
+    A persistent store of the splits and profile URL of finished results,
+    keyed by result URL; neither changes once a race is finished, so stored
+    data is never refetched.
+    """
+
+    def __init__(self, path: Path) -> None:
+        # the path to the database file
+        self.path = path
+
+        # one connection shared by all threads
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        # guards the connection
+        self._lock = threading.Lock()
+
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(url TEXT PRIMARY KEY, splits BLOB, profile TEXT) WITHOUT ROWID"
+            )
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (n,) = self._db.execute("SELECT COUNT(*) FROM results").fetchone()
+        return int(n)
+
+    def get(self, url: str) -> StoredResult | None:
+        """
+        Look up the data stored for a result.
+        :param url: The result URL
+        :return: The stored data, or None if nothing is stored
+        """
+        return self.get_many([url]).get(url)
+
+    def get_many(self, urls: Iterable[str]) -> dict[str, StoredResult]:
+        """
+        Look up the data stored for many results, in batched queries.
+        :param urls: The result URLs
+        :return: The stored data, by URL, for the results with data stored
+        """
+        found: dict[str, StoredResult] = {}
+        for batch in batched(urls, _BATCH):
+            query = (
+                "SELECT url, splits, profile FROM results "
+                f"WHERE url IN ({', '.join('?' * len(batch))})"
+            )
+            with self._lock:
+                rows = self._db.execute(query, batch).fetchall()
+            for url, splits, profile in rows:
+                found[url] = StoredResult(
+                    _decode(splits) if splits is not None else None, profile
+                )
+        return found
+
+    def put_splits(self, url: str, splits: models.Splits) -> None:
+        """
+        Store the splits for a result.
+        :param url: The result URL
+        :param splits: The splits
+        """
+        self._put(url, "splits", _encode(splits))
+
+    def put_profile(self, url: str, profile: str) -> None:
+        """
+        Store the athlete profile URL for a result.
+        :param url: The result URL
+        :param profile: The profile URL
+        """
+        self._put(url, "profile", profile)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def _put(self, url: str, column: str, value: bytes | str) -> None:
+        """Set one column for a result, keeping the others."""
+        with self._lock, self._db:
+            self._db.execute(
+                f"INSERT INTO results (url, {column}) VALUES (?, ?) "
+                f"ON CONFLICT (url) DO UPDATE SET {column} = excluded.{column}",
+                (url, value),
+            )
+
+
+def _encode(splits: models.Splits) -> bytes:
+    """Encode splits as 16 int32 seconds."""
+    return _SPLITS.pack(*flatten_splits(splits))
+
+
+def _decode(data: bytes) -> models.Splits:
+    """Decode splits from 16 int32 seconds."""
+    return unflatten_splits(_SPLITS.unpack(data))
@@ -0,0 +1,83 @@
+"""
+Unit tests for DataFrame and Arrow export.
+"""
+
+from pathlib import Path
+
+import pytest
+
+import pyrox.models as models
+
+from .frames import table_from_results, to_arrow, to_pandas, to_polars
+from .reader import ResultsReader
+from .test_reader import _result
+from .writer import ResultsWriter
+
+
+def test_table_from_results(tmp_path: Path) -> None:
+    """Tables built from results match the tables read back from a file."""
+
+    results = [_result(i + 1, splits=i < 3) for i in range(10)]
+    path = tmp_path / "results.csv"
+    ResultsWriter("chicago_2025", models.DivisionName.PRO_MEN).write(results, path)
+
+    built = table_from_results(results, "chicago_2025", models.DivisionName.PRO_MEN)
+    read = ResultsReader(path).read_table()
+    assert built.columns == read.columns
+
+    built = table_from_results(results, columns=["event_name", "ski"])
+    assert list(built["event_name"]) == ["unknown"] * 10
+    assert list(built["ski"])[:4] == [180, 180, 180, 0]
+
+
+def test_to_arrow() -> None:
+    """Tables export to Arrow with nulls for missing values."""
+
+    pa = pytest.importorskip("pyarrow")
+
+    results = [_result(i + 1, splits=i < 3) for i in range(10)]
+    table = table_from_results(results, "chicago_2025", models.DivisionName.PRO_MEN)
+
+    exported = to_arrow(table)
+    assert exported.column_names == list(table.columns)
+    assert exported.num_rows == 10
+    assert exported["finish_time"].to_pylist() == [3601 + i for i in range(10)]
+    assert exported["position_ag"].to_pylist()[:2] == [1, None]
+    assert exported["ski"].to_pylist()[:4] == [180, 180, 180, None]
+    assert exported["has_splits"].type == pa.bool_()
+
+    native = to_arrow(table, native=True)
+    assert native["run_1"].type == pa.duration("s")
+
+    # results without splits are found the same way without the has_splits column
+    subset = to_arrow(table_from_results(results, columns=["ski"]))
+    assert subset["ski"].to_pylist()[:4] == [180, 180, 180, None]
+
+    # the export does not hold the table's memory, so the table may keep growing
+    table.add("chicago_2025", models.DivisionName.PRO_MEN, [_result(11, splits=False)])
+    assert len(table) == 11
+    assert exported.num_rows == 10
+
+
+def test_to_pandas() -> None:
+    """Tables export to pandas DataFrames."""
+
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("pandas")
+
+    results = [_result(i + 1, splits=i < 3) for i in range(10)]
+    frame = to_pandas(table_from_results(results, "chicago_2025"))
+    assert frame["event_name"].tolist() == ["chicago_2025"] * 10
+    assert frame["ski"].isna().sum() == 7
+
+
+def test_to_polars() -> None:
+    """Tables export to Polars DataFrames."""
+
+    pytest.importorskip("pyarrow")
+    pl = pytest.importorskip("polars")
+
+    results = [_result(i + 1, splits=i < 3) for i in range(10)]
+    frame = to_polars(table_from_results(results, "chicago_2025"), native=True)
+    assert frame["run_1"].dtype == pl.Duration("ms")
+    assert frame["ski"].null_count() == 7
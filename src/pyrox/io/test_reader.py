@@ -0,0 +1,92 @@
+"""
+Unit tests for results reader.
+"""
+
+from datetime import timedelta
+from pathlib import Path
+
+from pydantic import HttpUrl
+
+import pyrox.models as models
+
+from .reader import ResultsReader
+from .writer import ResultsWriter
+
+
+def _result(position: int, splits: bool) -> models.Result:
+    return models.Result(
+        position=position,
+        position_ag=None if position % 2 == 0 else position,
+        name=f"Athlete, {position}",
+        age_group=models.AgeGroup.AG_30_34 if position % 2 == 0 else None,
+        time=timedelta(seconds=3600 + position),
+        url=HttpUrl(f"https://www.hyresult.com/result/R{position}"),
+        splits=(
+            models.Splits(
+                runs=[timedelta(seconds=240 + i) for i in range(8)],
+                stations={name: timedelta(seconds=180) for name in models.Station},
+            )
+            if splits
+            else None
+        ),
+        profile=HttpUrl("https://www.hyresult.com/athlete/a") if splits else None,
+    )
+
+
+def test_results_reader_round_trip(tmp_path: Path) -> None:
+    """Results read back are identical to the results written."""
+
+    path = tmp_path / "results.csv"
+    written = [_result(i + 1, splits=i < 3) for i in range(10)]
+    ResultsWriter("chicago_2025", models.DivisionName.PRO_MEN).write(written, path)
+    ResultsWriter("glasgow_2025", models.DivisionName.PRO_MEN).write(
+        written[:4], path, append=True
+    )
+
+    # a tiny chunk size exercises the chunk boundaries
+    reader = ResultsReader(path, chunk_size=64)
+
+    read = list(reader.read(events=["chicago_2025"]))
+    assert [r.event for r in read] == ["chicago_2025"] * 10
+    assert [r.division for r in read] == [models.DivisionName.PRO_MEN] * 10
+    assert [r.result for r in read] == written
+
+    assert len(list(reader.read(divisions=[models.DivisionName.ELITE_MEN]))) == 0
+
+
+def test_results_reader_table(tmp_path: Path) -> None:
+    """Results are read into a projected, filtered table."""
+
+    path = tmp_path / "results.csv"
+    ResultsWriter("chicago_2025", models.DivisionName.PRO_MEN).write(
+        [_result(i + 1, splits=i < 3) for i in range(10)], path
+    )
+
+    table = ResultsReader(path).read_table(["finish_time", "position_ag", "ski"])
+    assert len(table) == 10
+    assert list(table.columns) == ["finish_time", "position_ag", "ski"]
+    assert list(table["finish_time"]) == [3601 + i for i in range(10)]
+    assert list(table["position_ag"])[:2] == [1, -1]
+    assert list(table["ski"])[:4] == [180, 180, 180, 0]
+
+
+def test_results_reader_quoting(tmp_path: Path) -> None:
+    """Quoted commas and newlines survive chunking and filtering."""
+
+    path = tmp_path / "results.csv"
+    written = [
+        _result(i + 1, splits=False).model_copy(update={"name": f"A\nB\r\nC {i}"})
+        for i in range(10)
+    ]
+    ResultsWriter("paris, 2025", models.DivisionName.PRO_MEN).write(written, path)
+    ResultsWriter("chicago_2025", models.DivisionName.PRO_MEN).write(
+        written[:2], path, append=True
+    )
+
+    reader = ResultsReader(path, chunk_size=16)
+    read = list(reader.read(events=["paris, 2025"]))
+    assert [r.result for r in read] == written
+    assert len(list(reader.read(events=["chicago_2025"]))) == 2
+    assert reader.read_table(["athlete_name"])["athlete_name"][:10] == [
+        r.name for r in written
+    ]
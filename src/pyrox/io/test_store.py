@@ -0,0 +1,47 @@
+"""
+Unit tests for the result store.
+"""
+
+from datetime import timedelta
+from pathlib import Path
+
+import pyrox.models as models
+
+from .store import ResultStore
+
+
+def _splits(offset: int) -> models.Splits:
+    return models.Splits(
+        runs=[timedelta(seconds=240 + offset + i) for i in range(8)],
+        stations={
+            name: timedelta(seconds=180 + offset + i)
+            for i, name in enumerate(models.Station)
+        },
+    )
+
+
+def test_result_store_round_trip(tmp_path: Path) -> None:
+    """Stored splits and profiles are read back, across reopens and in batches."""
+
+    path = tmp_path / "store.db"
+    urls = [f"https://www.hyresult.com/result/R{i}" for i in range(1200)]
+
+    with ResultStore(path) as store:
+        for i, url in enumerate(urls):
+            store.put_splits(url, _splits(i))
+        # a profile added later keeps the splits
+        store.put_profile(urls[0], "https://www.hyresult.com/athlete/a")
+        store.put_profile("https://www.hyresult.com/result/X", "https://p")
+
+    with ResultStore(path) as store:
+        assert len(store) == 1201
+        found = store.get_many(urls + ["https://www.hyresult.com/result/missing"])
+
+        assert len(found) == 1200
+        assert all(found[url].splits == _splits(i) for i, url in enumerate(urls))
+        assert found[urls[0]].profile == "https://www.hyresult.com/athlete/a"
+        assert found[urls[1]].profile is None
+
+        other = store.get("https://www.hyresult.com/result/X")
+        assert other is not None and other.splits is None
+        assert store.get("https://www.hyresult.com/result/missing") is None
@@ -0,0 +1,61 @@
+"""
+Unit tests for results writer.
+"""
+
+import csv
+from datetime import timedelta
+from pathlib import Path
+
+from pydantic import HttpUrl
+
+import pyrox.models as models
+
+from .writer import COLUMNS, ResultsSink
+
+
+def test_results_sink_matches_csv_writer(tmp_path: Path) -> None:
+    """Lines are written exactly as the CSV writer would write the rows."""
+
+    names = ["Athlete", 'Athlete "A", Jr', "Line\nBreak", "Carriage\rReturn", ""]
+    results = [
+        models.Result(
+            position=i + 1,
+            position_ag=i + 1 if i % 2 == 0 else None,
+            name=name,
+            age_group=models.AgeGroup.AG_30_34 if i % 2 == 0 else None,
+            time=timedelta(seconds=3600 + i),
+            url=HttpUrl(f"https://www.hyresult.com/result/R{i},{i}"),
+            splits=(
+                models.Splits(
+                    runs=[timedelta(seconds=240 + k) for k in range(8)],
+                    stations={name: timedelta(seconds=180) for name in models.Station},
+                )
+                if i % 2 == 1
+                else None
+            ),
+            profile=HttpUrl("https://www.hyresult.com/athlete/a") if i > 2 else None,
+        )
+        for i, name in enumerate(names)
+    ]
+    event, division = 'event, "quoted"', models.DivisionName.PRO_MEN
+
+    path = tmp_path / "results.csv"
+    with ResultsSink(path) as sink:
+        sink.write(event, division, results)
+        sink.write(None, None, results[:1])
+
+    # parsing and rewriting the rows with the CSV module gives back the same bytes
+    with path.open(newline="") as f:
+        rows = list(csv.reader(f))
+    expected = tmp_path / "expected.csv"
+    with expected.open("w", newline="") as f:
+        csv.writer(f).writerows(rows)
+    assert path.read_bytes() == expected.read_bytes()
+
+    assert rows[0] == COLUMNS
+    assert [row[:3] for row in rows[1:3]] == [
+        [event, str(division), "Athlete"],
+        [event, str(division), 'Athlete "A", Jr'],
+    ]
+    assert rows[3][2] == "Line\nBreak"
+    assert rows[-1][:2] == ["unknown", "unknown"]
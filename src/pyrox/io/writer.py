@@ -3,10 +3,69 @@ Results writer.
 """
 
 import csv
+import re
+from datetime import timedelta
+from itertools import batched
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from typing import Iterable, Iterator, Sequence
 
 import pyrox.models as models
 
+# the split columns, in file order: 8 runs followed by 8 stations
+SPLITS = [f"run_{i + 1}" for i in range(8)] + [str(name) for name in models.Station]
+
+# the columns of a results file, in file order
+COLUMNS = [
+    "event_name",
+    "division_name",
+    "athlete_name",
+    "age_group",
+    "position",
+    "position_ag",
+    "finish_time",
+    "analysis_url",
+    "has_splits",
+    *SPLITS,
+    "has_profile",
+    "profile_url",
+]
+
+# the columns holding the times of results, with their event, division and age group
+TIME_COLUMNS = [
+    "event_name",
+    "division_name",
+    "age_group",
+    "finish_time",
+    "has_splits",
+    *SPLITS,
+]
+
+# the size of the write buffer
+_BUFFER_SIZE = 1024 * 1024
+
+# the number of lines joined into a single write
+_BATCH = 1024
+
+# station splits, in column order
+_STATIONS = itemgetter(*models.Station)
+
+# the seconds of a split
+_SECONDS = attrgetter("seconds")
+
+# has_splits, ...run_splits..., ...station_splits...
+_SPLITS = "true" + ",%d" * 16
+_NO_SPLITS = "false" + ",0" * 16
+
+# age groups as written
+_AGE_GROUPS: dict[models.AgeGroup | None, str] = {
+    age_group: str(age_group) for age_group in models.AgeGroup
+}
+_AGE_GROUPS[None] = "unknown"
+
+# characters that make the CSV writer quote a field
+_SPECIAL = re.compile(r'[",\r\n]')
+
 
 class ResultsWriter:
     """A simple writer for results."""
@@ -21,7 +80,7 @@ class ResultsWriter:
 
     def write(
         self,
-        results: list[models.Result],
+        results: Iterable[models.Result],
         path: Path,
         append: bool = False,
         force: bool = False,
@@ -30,7 +89,21 @@ class ResultsWriter:
         Write the provided results to a CSV file at `path`.
         :param results: The results to write
         :param path: The path to which results are written
-        :param append: Append to the file instead of
+        :param append: Append to the file instead of overwriting
+        :param force: Overwrite existing file
+        """
+        with ResultsSink(path, append, force) as sink:
+            sink.write(self.event, self.division, results)
+
+
+class ResultsSink:
+    """An open results file, to which results are written as they arrive."""
+
+    def __init__(self, path: Path, append: bool = False, force: bool = False) -> None:
+        """
+        Open a results file at `path`.
+        :param path: The path to which results are written
+        :param append: Append to the file instead of overwriting
         :param force: Overwrite existing file
         """
         if path.exists():
@@ -43,91 +116,119 @@ class ResultsWriter:
             if not append and force:
                 path.unlink()
 
+        # the path to which results are written
+        self.path = path
+
         mode = "a" if append else "w"
-        with path.open(mode, newline="") as f:
-            writer = csv.writer(f)
-            # write the header if not appending
-            if not append:
-                writer.writerow(_write_header())
-            writer.writerows(
-                [_write_row(self.event, self.division, result) for result in results]
-            )
+        self._file = path.open(mode, newline="", buffering=_BUFFER_SIZE)
+        self._writer = csv.writer(self._file)
+        # write the header if not appending
+        if not append:
+            self._writer.writerow(COLUMNS)
 
+    def __enter__(self) -> "ResultsSink":
+        return self
 
-def _write_header() -> list[str]:
-    """Write the header row."""
-    headers_splits_run = [f"run_{i + 1}" for i in range(8)]
-    header_splits_station = [str(name) for name in models.Station]
-    return (
-        [
-            "event_name",
-            "division_name",
-            "athlete_name",
-            "age_group",
-            "position",
-            "position_ag",
-            "finish_time",
-            "analysis_url",
-            "has_splits",
-        ]
-        + headers_splits_run
-        + header_splits_station
-        + ["has_profile", "profile_url"]
-    )
+    def __exit__(self, *_: object) -> None:
+        self.close()
 
+    def write(
+        self,
+        event: str | None,
+        division: models.DivisionName | None,
+        results: Iterable[models.Result],
+    ) -> None:
+        """
+        Write results from a division at an event.
+        :param event: The name of the event
+        :param division: The name of the division
+        :param results: The results to write
+        """
+        for lines in batched(_lines(event, division, results), _BATCH):
+            self._file.write("".join(lines))
 
-def _write_row(
-    event: str | None, division: models.DivisionName | None, result: models.Result
-) -> list[str]:
+    def flush(self) -> None:
+        """Flush the results written so far to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+def flatten_splits(splits: models.Splits) -> list[int]:
     """
-    Serialize all data for a row.
-    :param event: The event name
-    :param division: The division name
-    :param result: The result
-    :return: The serialized row
+    Flatten splits to seconds.
+    :param splits: The splits
+    :return: The seconds of each split, in the order of `SPLITS`
     """
-    # event_name, division_name, ...results
     return [
-        event if event is not None else "unknown",
-        str(division) if division is not None else "unknown",
-    ] + _result_to_row(result)
+        int(split.total_seconds())
+        for split in splits.runs + [splits.stations[name] for name in models.Station]
+    ]
 
 
-def _result_to_row(r: models.Result) -> list[str]:
+def unflatten_splits(seconds: Sequence[int]) -> models.Splits:
     """
-    Convert a result to a row for writing.
-    :param r: The result
-    :return: The serialized row
+    Rebuild splits from their seconds.
+    :param seconds: The seconds of each split, in the order of `SPLITS`
+    :return: The splits
     """
-
-    # serialize run splits
-    run_splits = (
-        [str(split.seconds) for split in r.splits.runs]
-        if r.splits is not None
-        else [str(0)] * 8
-    )
-    # serialize station splits
-    station_splits = (
-        [str(r.splits.stations[name].seconds) for name in models.Station]
-        if r.splits is not None
-        else [str(0)] * 8
+    return models.Splits(
+        runs=[timedelta(seconds=s) for s in seconds[:8]],
+        stations={
+            name: timedelta(seconds=s) for name, s in zip(models.Station, seconds[8:])
+        },
     )
 
-    # name, ag, position, position_ag, finish_time, analysis_url, has_splits, ...run_splits..., ...station_splits..., has_profile, profile
-    return (
+
+def _lines(
+    event: str | None,
+    division: models.DivisionName | None,
+    results: Iterable[models.Result],
+) -> Iterator[str]:
+    """
+    Serialize rows straight to CSV lines, identical to the CSV writer's output
+    for the same fields, with the constant and fixed-format columns precomputed.
+    :param event: The event name
+    :param division: The division name
+    :param results: The results
+    :return: An iterator over the lines
+    """
+    # event_name, division_name
+    prefix = ",".join(
         [
-            r.name,
-            str(r.age_group) if r.age_group is not None else "unknown",
-            str(r.position),
-            str(r.position_ag) if r.position_ag is not None else "unknown",
-            str(r.time.seconds),
-            str(r.url),
-            "true" if r.splits is not None else "false",
-        ]
-        + run_splits
-        + station_splits
-        + [
-            "true" if r.profile is not None else "false",
-            str(r.profile) if r.profile is not None else "n/a",
+            _quote(event if event is not None else "unknown"),
+            _quote(str(division) if division is not None else "unknown"),
         ]
     )
+    for r in results:
+        position_ag = r.position_ag
+        splits = r.splits
+        profile = r.profile
+        yield (
+            f"{prefix},{_quote(r.name)},{_AGE_GROUPS[r.age_group]},{r.position},"
+            f"{position_ag if position_ag is not None else 'unknown'},"
+            f"{r.time.seconds},{_quote(str(r.url))},"
+            + (
+                _SPLITS
+                % (
+                    *map(_SECONDS, splits.runs),
+                    *map(_SECONDS, _STATIONS(splits.stations)),
+                )
+                if splits is not None
+                else _NO_SPLITS
+            )
+            + (
+                f",true,{_quote(str(profile))}\r\n"
+                if profile is not None
+                else ",false,n/a\r\n"
+            )
+        )
+
+
+def _quote(field: str) -> str:
+    """Quote a field as the CSV writer does, only if it contains special characters."""
+    if _SPECIAL.search(field) is None:
+        return field
+    return '"' + field.replace('"', '""') + '"'
@@ -0,0 +1,265 @@
+"""
+Backfill jobs over a date range of events.
+"""
+
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import pyrox.models as models
+from pyrox.client import Hyrox
+from pyrox.jobs.loader import load_tasks, resume_tasks
+
+# the assumed number of results on a ranking page, for estimates
+PAGE_SIZE = 100
+
+# the pages fetched to find a division before loading it: the events and event pages
+_CATALOG_REQUESTS = 2
+
+# the default interval between progress reports
+_PROGRESS_INTERVAL = timedelta(seconds=10)
+
+
+class BackfillTask(NamedTuple):
+    """A division at an event to be backfilled, with its estimated cost."""
+
+    # the name of the event
+    event: str
+    # the name of the division
+    division: models.DivisionName
+    # the number of finishers in the division
+    finishers: int
+    # the estimated number of requests to load the division
+    requests: int
+
+
+class BackfillPlan(NamedTuple):
+    """The divisions to be backfilled, largest first, with the estimated cost."""
+
+    # the tasks, largest first
+    tasks: list[BackfillTask]
+    # load with splits
+    splits: bool
+    # load with profile
+    profile: bool
+    # enrich only the first `top` results in each division
+    top: int | None
+    # the network requests allowed per second, or None if unlimited
+    rate_limit: float | None
+
+    @property
+    def requests(self) -> int:
+        """The estimated number of requests to load every division."""
+        return sum(t.requests for t in self.tasks)
+
+    @property
+    def duration(self) -> timedelta | None:
+        """The estimated duration at the rate limit, or None if unlimited."""
+        if self.rate_limit is None:
+            return None
+        return timedelta(seconds=round(self.requests / self.rate_limit))
+
+    def report(self) -> str:
+        """
+        Summarize the plan.
+        :return: The summary
+        """
+        events = len({t.event for t in self.tasks})
+        results = sum(t.finishers for t in self.tasks)
+        duration = (
+            f"{self.duration} at {self.rate_limit} requests/s"
+            if self.duration is not None
+            else "unknown; no rate limit"
+        )
+        return (
+            f"events: {events}, divisions: {len(self.tasks)}, results: {results}\n"
+            f"estimated requests: {self.requests}\n"
+            f"estimated duration: {duration}"
+        )
+
+    def without(self, completed: set[tuple[str, str]]) -> "BackfillPlan":
+        """
+        Drop the divisions already loaded.
+        :param completed: The (event, division) pairs already loaded
+        :return: The plan for the remaining divisions
+        """
+        tasks = [t for t in self.tasks if (t.event, str(t.division)) not in completed]
+        return self._replace(tasks=tasks)
+
+
+class BackfillProgress(NamedTuple):
+    """The progress of a running backfill."""
+
+    # the number of requests made so far, including those served from the cache
+    requests: int
+    # the estimated number of requests in total
+    total: int
+    # the time since the backfill started
+    elapsed: timedelta
+    # the estimated time remaining, at the rate so far, or None before any request
+    eta: timedelta | None
+
+    def __str__(self) -> str:
+        percent = 100 * min(self.requests / self.total, 1.0) if self.total > 0 else 100
+        eta = str(self.eta) if self.eta is not None else "unknown"
+        return (
+            f"requests: {self.requests} / {self.total} ({percent:.0f}%), "
+            f"elapsed: {self.elapsed}, eta: {eta}"
+        )
+
+
+class BackfillJob:
+    """Load every division of interest at the events in a date range."""
+
+    def __init__(self, client: Hyrox) -> None:
+        # the client
+        self.client = client
+        # inherit the client's logger
+        self.logger = self.client.logger
+
+    def plan(
+        self,
+        division_names: set[models.DivisionName],
+        after: datetime | None = None,
+        before: datetime | None = None,
+        splits: bool = False,
+        profile: bool = False,
+        top: int | None = None,
+        event_names: set[str] | None = None,
+    ) -> BackfillPlan:
+        """
+        Resolve the events in a date range from the catalog, and estimate the
+        cost of loading their divisions from their numbers of finishers.
+        :param division_names: The names of the divisions to load at each event
+        :param after: The beginning of the date range
+        :param before: The end of the date range
+        :param splits: Load with splits
+        :param profile: Load with profile
+        :param top: Enrich only the first `top` results in each division
+        :param event_names: Load only these events in the date range, or every event if None
+        :return: The plan, largest division first
+        """
+        # imported on first use; requests is slow to import
+        import requests
+
+        tasks: list[BackfillTask] = []
+        for event in self.client.events(after=after, before=before):
+            name = event.model.canonical_name
+            if event_names is not None and name not in event_names:
+                continue
+            try:
+                divisions = event.divisions()
+            except (RuntimeError, requests.RequestException) as e:
+                self.logger.warning(f"failed to list divisions at event '{name}': {e}")
+                continue
+            for division in (d.model for d in divisions):
+                if division.name not in division_names:
+                    continue
+                n = division.n_finishers
+                tasks.append(
+                    BackfillTask(
+                        name, division.name, n, _requests(n, splits, profile, top)
+                    )
+                )
+
+        # the largest divisions first, so the longest tasks do not straggle at the end
+        tasks.sort(key=lambda t: (-t.finishers, t.event, t.division))
+        return BackfillPlan(tasks, splits, profile, top, self.client.fetcher.rate_limit)
+
+    def run(
+        self,
+        plan: BackfillPlan,
+        path: Path,
+        workers: int = 1,
+        resume: bool = False,
+        select: Callable[[models.Result], bool] | None = None,
+        progress: Callable[[BackfillProgress], None] | None = None,
+        interval: timedelta = _PROGRESS_INTERVAL,
+        profiling: Path | None = None,
+    ) -> int:
+        """
+        Load the divisions in a plan, largest first, reporting progress periodically.
+        :param plan: The plan
+        :param path: The path to which results are written
+        :param workers: The number of results enriched concurrently
+        :param resume: Skip divisions already completely written to an existing file at `path`
+        :param select: Enrich only the results for which this returns True
+        :param progress: Called with the progress at each interval; logged if None
+        :param interval: The interval between progress reports
+        :param profiling: Profile the run, writing a report to this path
+        :return: The number of results written
+        """
+        if resume:
+            plan = plan.without(resume_tasks(path))
+        append = resume and path.exists()
+
+        report = progress if progress is not None else self._log_progress
+        stop = threading.Event()
+        reporter = threading.Thread(
+            target=self._report,
+            args=(plan.requests, report, interval, stop),
+            daemon=True,
+        )
+        reporter.start()
+        try:
+            return load_tasks(
+                self.client,
+                [(t.event, t.division) for t in plan.tasks],
+                path,
+                plan.splits,
+                plan.profile,
+                workers,
+                append,
+                select,
+                plan.top,
+                profiling,
+            )
+        finally:
+            stop.set()
+            reporter.join()
+
+    def _report(
+        self,
+        total: int,
+        report: Callable[[BackfillProgress], None],
+        interval: timedelta,
+        stop: threading.Event,
+    ) -> None:
+        """Report progress at each interval until stopped, measured in requests."""
+        stats = self.client.fetcher.stats
+        start = time.perf_counter()
+        before = stats.pages + stats.cached
+        while not stop.wait(interval.total_seconds()):
+            elapsed = time.perf_counter() - start
+            done = stats.pages + stats.cached - before
+            eta = (
+                timedelta(seconds=round(max(total - done, 0) * elapsed / done))
+                if done > 0
+                else None
+            )
+            report(
+                BackfillProgress(done, total, timedelta(seconds=round(elapsed)), eta)
+            )
+
+    def _log_progress(self, progress: BackfillProgress) -> None:
+        """Log the progress of a backfill."""
+        self.logger.info(str(progress))
+
+
+def _requests(n: int, splits: bool, profile: bool, top: int | None) -> int:
+    """
+    Estimate the requests to load a division; an upper bound when results are
+    selected or already stored.
+    :param n: The number of finishers
+    :param splits: Load with splits
+    :param profile: Load with profile
+    :param top: Enrich only the first `top` results
+    :return: The estimated number of requests
+    """
+    # ranking pages, and the empty page past the last
+    rankings = math.ceil(n / PAGE_SIZE) + 1
+    enriched = min(n, top) if top is not None else n
+    return _CATALOG_REQUESTS + rankings + enriched * (int(splits) + int(profile))
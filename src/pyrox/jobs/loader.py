@@ -2,11 +2,32 @@
 Results loading jobs.
 """
 
+import csv
+from contextlib import nullcontext
+from datetime import timedelta
 from pathlib import Path
+from typing import Callable, Iterator
 
 import pyrox.models as models
+from pyrox.analytics.cube import ResultCube
 from pyrox.client import Hyrox
-from pyrox.io.writer import ResultsWriter
+from pyrox.client.client import Result, ResultEnricher
+from pyrox.io.reader import ResultsReader
+from pyrox.io.writer import ResultsSink
+from pyrox.jobs.pipeline import Pipeline, Retry, Stage
+from pyrox.jobs.profiling import Profiler
+
+# the number of attempts to enrich a result whose splits are not yet available
+_RETRY = 8
+# the initial delay between attempts to enrich a result
+_POLL_INTERVAL = timedelta(seconds=1)
+
+# the suffix of the file recording the divisions completely written to a results file
+_DONE_SUFFIX = ".done"
+
+# (event name, division name, ranking index, result), or, once a division's
+# rankings are exhausted, (event name, division name, number of results, None)
+_Item = tuple[str, models.DivisionName, int, Result | None]
 
 
 class ResultsLoader:
@@ -25,7 +46,11 @@ class ResultsLoader:
         path: Path,
         splits: bool = False,
         profile: bool = False,
-    ) -> None:
+        workers: int = 1,
+        select: Callable[[models.Result], bool] | None = None,
+        top: int | None = None,
+        profiling: Path | None = None,
+    ) -> int:
         """
         Load results from the specified event and division.
         :param event_name: The name of the event
@@ -33,14 +58,25 @@ class ResultsLoader:
         :param path: The path to which results are written
         :param splits: Load with splits
         :param profile: Load with profile
+        :param workers: The number of results enriched concurrently
+        :param select: Enrich only the results for which this returns True
+        :param top: Enrich only the first `top` results in each division
+        :param profiling: Profile the run, writing a report to this path
+        :return: The number of results written
         """
-        results = self.client.results(
-            event_name, division_name, splits=splits, profile=profile
+        return load_tasks(
+            self.client,
+            [(event_name, division_name)],
+            path,
+            splits,
+            profile,
+            workers,
+            False,
+            select,
+            top,
+            profiling,
         )
 
-        writer = ResultsWriter(event_name, division_name)
-        writer.write([r.model for r in results], path)
-
 
 class MultiDivisionLoader:
     """Download results from multiple divisions at the same event."""
@@ -58,7 +94,12 @@ class MultiDivisionLoader:
         path: Path,
         splits: bool = False,
         profile: bool = False,
-    ) -> None:
+        workers: int = 1,
+        resume: bool = False,
+        select: Callable[[models.Result], bool] | None = None,
+        top: int | None = None,
+        profiling: Path | None = None,
+    ) -> int:
         """
         Load results from the specified divisions at the specified event.
         :param event_name: The name of the event
@@ -66,21 +107,26 @@ class MultiDivisionLoader:
         :param path: The path to which results are written
         :param splits: Load with splits
         :param profile: Load with profile
+        :param workers: The number of results enriched concurrently
+        :param resume: Skip divisions already completely written to an existing file at `path`
+        :param select: Enrich only the results for which this returns True
+        :param top: Enrich only the first `top` results in each division
+        :param profiling: Profile the run, writing a report to this path
+        :return: The number of results written
         """
-        # write results for all requested divisions
-        for i, division_name in enumerate(division_names):
-            try:
-                division_results = self.client.results(
-                    event_name, division_name, splits=splits, profile=profile
-                )
-            except RuntimeError:
-                self.logger.warning(
-                    f"failed to load results for division '{division_name}'"
-                )
-                continue
-
-            writer = ResultsWriter(event_name, division_name)
-            writer.write([r.model for r in division_results], path, append=i > 0)
+        loader = MultiEventLoader(self.client)
+        return loader.load(
+            {event_name},
+            division_names,
+            path,
+            splits,
+            profile,
+            workers,
+            resume,
+            select,
+            top,
+            profiling,
+        )
 
 
 class MultiEventLoader:
@@ -99,7 +145,12 @@ class MultiEventLoader:
         path: Path,
         splits: bool = False,
         profile: bool = False,
-    ) -> None:
+        workers: int = 1,
+        resume: bool = False,
+        select: Callable[[models.Result], bool] | None = None,
+        top: int | None = None,
+        profiling: Path | None = None,
+    ) -> int:
         """
         Load results from the specified divisions at the specified event.
         :param event_names: The names of the event
@@ -107,18 +158,234 @@ class MultiEventLoader:
         :param path: The path to which results are written
         :param splits: Load with splits
         :param profile: Load with profile
+        :param workers: The number of results enriched concurrently
+        :param resume: Skip event / division pairs already completely written to an existing file at `path`
+        :param select: Enrich only the results for which this returns True
+        :param top: Enrich only the first `top` results in each division
+        :param profiling: Profile the run, writing a report to this path
+        :return: The number of results written
         """
-        for i, event_name in enumerate(event_names):
-            for j, division_name in enumerate(division_names):
-                try:
-                    results = self.client.results(
-                        event_name, division_name, splits=splits, profile=profile
-                    )
-                except RuntimeError:
-                    self.logger.warning(
-                        f"failed to load results for division '{division_name}' at event '{event_name}'"
+        completed = resume_tasks(path) if resume else set()
+        # append to the file if resuming a previous run
+        append = resume and path.exists()
+
+        tasks = []
+        for event_name in event_names:
+            for division_name in division_names:
+                if (event_name, str(division_name)) in completed:
+                    self.logger.info(
+                        f"skipping division '{division_name}' at event '{event_name}'; already loaded"
                     )
                     continue
+                tasks.append((event_name, division_name))
+
+        return load_tasks(
+            self.client,
+            tasks,
+            path,
+            splits,
+            profile,
+            workers,
+            append,
+            select,
+            top,
+            profiling,
+        )
+
+
+def load_tasks(
+    client: Hyrox,
+    tasks: list[tuple[str, models.DivisionName]],
+    path: Path,
+    splits: bool,
+    profile: bool,
+    workers: int,
+    append: bool,
+    select: Callable[[models.Result], bool] | None,
+    top: int | None,
+    profiling: Path | None,
+    window: range | None = None,
+) -> int:
+    """
+    Load results for each (event, division) pair through a rankings -> enrich -> write pipeline.
+    Each pair is recorded as complete once all of its results are written.
+    :param client: The client
+    :param tasks: The (event, division) pairs to load
+    :param path: The path to which results are written
+    :param splits: Load with splits
+    :param profile: Load with profile
+    :param workers: The number of results enriched concurrently
+    :param append: Append to an existing file at `path`
+    :param select: Enrich only the results for which this returns True
+    :param top: Enrich only the first `top` results in each division
+    :param profiling: Profile the run, writing a report to this path
+    :param window: Load only the results at these ranking indices in each division
+    :return: The number of results written
+    """
+    logger = client.logger
+    enricher = ResultEnricher(
+        _RETRY, _POLL_INTERVAL, logger, client.pool, client.fetcher, client.store
+    )
+
+    def rankings(task: tuple[str, models.DivisionName]) -> Iterator[_Item]:
+        """Stream the unenriched results for a division, in ranking order."""
+        event_name, division_name = task
+        try:
+            # results already in the store need no page fetches
+            division = client.event(event_name).division(division_name)
+            results = enricher.recall(division.iter_pages(), splits, profile)
+            n = 0
+            for i, result in enumerate(results):
+                if window is not None and i >= window.stop:
+                    break
+                if window is None or i in window:
+                    yield event_name, division_name, i, result
+                    n += 1
+        except RuntimeError:
+            logger.warning(
+                f"failed to load results for division '{division_name}' at event '{event_name}'"
+            )
+            return
+        yield event_name, division_name, n, None
+
+    def enrich(item: _Item) -> Iterator[_Item]:
+        """Enrich a selected result, retrying later if its splits are not yet available."""
+        _, _, i, result = item
+        if result is None:
+            yield item
+            return
+        selected = (top is None or i < top) and (select is None or select(result.model))
+        if (splits or profile) and selected:
+            try:
+                enriched = enricher.try_enrich(result, splits, profile)
+            except RuntimeError as e:
+                logger.warning(
+                    f"failed to enrich result for athlete '{result.model.name}': {e}"
+                )
+                enriched = True
+            if not enriched:
+                raise Retry(
+                    f"splits not available for athlete '{result.model.name}'", [item]
+                )
+        yield item
+
+    # aggregates stored next to the results, updated with the results written
+    cube = ResultCube.open(path) if append else ResultCube()
+    done = done_path(path)
+    # a record left next to a file that no longer exists is stale
+    if not append and not path.exists():
+        done.unlink(missing_ok=True)
+    # opened up front, so a file without results still has its header
+    sink = ResultsSink(path, append=append)
+    done.touch()
+    # the number of results written, and expected once rankings are exhausted, by pair
+    written: dict[tuple[str, str], int] = {}
+    expected: dict[tuple[str, str], int] = {}
+    n = 0
+
+    def write(item: _Item) -> Iterator[_Item]:
+        """
+        Write a result, and record its division as complete after the last
+        one; enrichment may reorder them.
+        """
+        nonlocal n
+        event_name, division_name, i, result = item
+        key = (event_name, str(division_name))
+        if result is None:
+            expected[key] = i
+        else:
+            sink.write(event_name, division_name, [result.model])
+            cube.add(event_name, division_name, result.model)
+            written[key] = written.get(key, 0) + 1
+            n += 1
+        if expected.get(key) == written.get(key, 0):
+            sink.flush()
+            with done.open("a", newline="") as f:
+                csv.writer(f).writerow(key)
+        return iter(())
+
+    pipeline = Pipeline(
+        [
+            Stage("rankings", rankings),
+            Stage(
+                "enrich",
+                enrich,
+                workers=workers,
+                capacity=4 * workers,
+                attempts=_RETRY,
+                backoff=lambda attempt: enricher.backoff(attempt).total_seconds(),
+            ),
+            Stage("write", write),
+        ],
+        logger,
+    )
+    profiler = Profiler(profiling, logger) if profiling is not None else nullcontext()
+    try:
+        with profiler:
+            pipeline.run(tasks)
+    finally:
+        sink.close()
+        cube.save(ResultCube.path_for(path))
+
+    return n
+
+
+def completed_tasks(path: Path) -> set[tuple[str, str]]:
+    """
+    Get the (event, division) pairs completely written to the file at `path`.
+    :param path: The path to a results file
+    :return: The set of pairs, empty if the file does not exist
+    """
+    done = done_path(path)
+    if done.exists():
+        with done.open(newline="") as f:
+            return {(event, division) for event, division in csv.reader(f)}
+    if not path.exists():
+        return set()
+
+    # files without a record of completion were written a division at a time
+    table = ResultsReader(path).read_table(["event_name", "division_name"])
+    return set(zip(table["event_name"], table["division_name"]))
+
+
+def resume_tasks(path: Path) -> set[tuple[str, str]]:
+    """
+    Prepare to resume loading to the file at `path`, discarding the results of
+    any (event, division) pair left incomplete and rebuilding its aggregates.
+    :param path: The path to a results file
+    :return: The pairs completely written, which need not be loaded again
+    """
+    completed = completed_tasks(path)
+    if not path.exists():
+        return completed
+
+    done = done_path(path)
+    if not done.exists():
+        with done.open("w", newline="") as f:
+            csv.writer(f).writerows(sorted(completed))
+
+    table = ResultsReader(path).read_table(["event_name", "division_name"])
+    if set(zip(table["event_name"], table["division_name"])) <= completed:
+        return completed
+
+    tmp = path.with_name(f"{path.name}.tmp")
+    with ResultsSink(tmp, force=True) as sink:
+        for r in ResultsReader(path).read():
+            key = (
+                r.event if r.event is not None else "unknown",
+                str(r.division) if r.division is not None else "unknown",
+            )
+            if key in completed:
+                sink.write(r.event, r.division, [r.result])
+    tmp.replace(path)
+    ResultCube.build(path).save(ResultCube.path_for(path))
+    return completed
+
 
-                writer = ResultsWriter(event_name, division_name)
-                writer.write([r.model for r in results], path, append=(i + j) > 0)
+def done_path(path: Path) -> Path:
+    """
+    Get the path of the file recording the pairs completely written to a results file.
+    :param path: The path to the results file
+    :return: The path to the record
+    """
+    return path.with_name(f"{path.name}{_DONE_SUFFIX}")
@@ -0,0 +1,86 @@
+"""
+Job manifests.
+"""
+
+from __future__ import annotations
+
+import json
+import tomllib
+from datetime import datetime, timedelta
+from enum import StrEnum
+from pathlib import Path
+from typing import Callable
+
+from pydantic import BaseModel, model_validator
+
+import pyrox.models as models
+
+
+class OutputFormat(StrEnum):
+    """An enumeration over output formats."""
+
+    CSV = "csv"
+
+
+class Manifest(BaseModel):
+    """A description of a results loading job."""
+
+    # the names of the events to load; resolved from the date range if empty
+    events: list[str] = []
+    # the beginning of the date range
+    after: datetime | None = None
+    # the end of the date range
+    before: datetime | None = None
+    # the names of the divisions to load at each event
+    divisions: list[models.DivisionName]
+    # load with splits
+    splits: bool = False
+    # load with athlete profile URLs
+    profile: bool = False
+    # enrich only the first `top` results in each division
+    top: int | None = None
+    # enrich only results in these age groups
+    age_groups: list[models.AgeGroup] | None = None
+    # enrich only results with a finish time under this cutoff
+    cutoff: timedelta | None = None
+    # the format of the output file
+    format: OutputFormat = OutputFormat.CSV
+    # the path to which results are written
+    output: Path
+
+    @model_validator(mode="after")
+    def _check_events(self) -> Manifest:
+        """Require either explicit events or a date range."""
+        if len(self.events) == 0 and self.after is None and self.before is None:
+            raise ValueError("manifest requires either events or a date range")
+        return self
+
+    def selection(self) -> Callable[[models.Result], bool] | None:
+        """
+        Get the predicate selecting results for enrichment.
+        :return: The predicate, or `None` if every result is selected
+        """
+        if self.age_groups is None and self.cutoff is None:
+            return None
+
+        age_groups = set(self.age_groups) if self.age_groups is not None else None
+        cutoff = self.cutoff
+
+        def select(r: models.Result) -> bool:
+            if age_groups is not None and r.age_group not in age_groups:
+                return False
+            return cutoff is None or r.time < cutoff
+
+        return select
+
+    @staticmethod
+    def load(path: Path) -> Manifest:
+        """
+        Load a manifest from a JSON or TOML file.
+        :param path: The path to the manifest
+        :raises: ValueError if the manifest is invalid
+        :return: The manifest
+        """
+        with path.open("rb") as f:
+            data = tomllib.load(f) if path.suffix == ".toml" else json.load(f)
+        return Manifest.model_validate(data)
@@ -0,0 +1,311 @@
+"""
+A staged pipeline with bounded queues between stages.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+# how long an idle worker waits for work before re-checking for completion, in seconds
+_POLL = 0.05
+
+
+class Retry(Exception):
+    """Raised by a stage function to process an item again after a backoff."""
+
+    def __init__(self, reason: str, fallback: Iterable[Any] = ()) -> None:
+        super().__init__(reason)
+        # why the item should be retried
+        self.reason = reason
+        # the outputs emitted for the item if it runs out of retries
+        self.fallback = list(fallback)
+
+
+class StageStats:
+    """Counters for the work done by a stage."""
+
+    def __init__(self, name: str, workers: int) -> None:
+        # the name of the stage
+        self.name = name
+        # the number of workers
+        self.workers = workers
+        # the number of items taken from the input queue
+        self.items_in = 0
+        # the number of items put on the output queue
+        self.items_out = 0
+        # the number of retries scheduled
+        self.retries = 0
+        # total worker time spent in the stage function, in seconds
+        self.busy = 0.0
+        # total worker time spent blocked on a full output queue, in seconds
+        self.blocked = 0.0
+        # guards the counters
+        self._lock = threading.Lock()
+
+    def utilization(self, elapsed: float) -> float:
+        """
+        Get the fraction of worker time spent in the stage function.
+        :param elapsed: The wall time of the run, in seconds
+        :return: The utilization, in [0, 1]
+        """
+        return self.busy / (elapsed * self.workers) if elapsed > 0 else 0.0
+
+    def record(
+        self, items_in: int, items_out: int, busy: float, blocked: float
+    ) -> None:
+        """Record the work done on one item."""
+        with self._lock:
+            self.items_in += items_in
+            self.items_out += items_out
+            self.busy += busy
+            self.blocked += blocked
+
+    def record_retry(self) -> None:
+        """Record a retry."""
+        with self._lock:
+            self.retries += 1
+
+
+class PipelineStats:
+    """Counters for a pipeline run."""
+
+    def __init__(self, stages: list[StageStats], elapsed: float) -> None:
+        # per-stage counters, in pipeline order
+        self.stages = stages
+        # the wall time of the run, in seconds
+        self.elapsed = elapsed
+
+    @property
+    def bottleneck(self) -> str | None:
+        """The name of the stage with the highest utilization."""
+        if len(self.stages) == 0:
+            return None
+        return max(self.stages, key=lambda s: s.utilization(self.elapsed)).name
+
+    def report(self) -> str:
+        """Get a human-readable report of per-stage utilization."""
+        lines = [f"pipeline: {self.elapsed:.1f}s, bottleneck: {self.bottleneck}"]
+        for s in self.stages:
+            lines.append(
+                f"  {s.name:<10} workers={s.workers} in={s.items_in} out={s.items_out} "
+                f"retries={s.retries} busy={s.busy:.1f}s blocked={s.blocked:.1f}s "
+                f"utilization={s.utilization(self.elapsed):.0%}"
+            )
+        return "\n".join(lines)
+
+
+class Stage:
+    """A pipeline stage: a function mapping each input item to zero or more outputs."""
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[Any], Iterable[Any]],
+        workers: int = 1,
+        capacity: int = 64,
+        attempts: int = 1,
+        backoff: Callable[[int], float] = lambda attempt: 0.0,
+    ) -> None:
+        # the name of the stage
+        self.name = name
+        # the stage function; may raise `Retry` before producing any outputs
+        self.fn = fn
+        # the number of worker threads
+        self.workers = workers
+        # the maximum number of items waiting in the stage's input queue
+        self.capacity = capacity
+        # the maximum number of attempts for an item that raises `Retry`
+        self.attempts = attempts
+        # the delay before each retry, in seconds, by attempts made
+        self.backoff = backoff
+
+
+class Pipeline:
+    """
+    Run items through stages connected by bounded queues; each stage runs on
+    its own worker threads, and a full queue blocks the stage feeding it.
+    """
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        # the stages, in order
+        self.stages = stages
+        # logger instance
+        self.logger = logger
+
+    def run(self, source: Iterable[Any]) -> PipelineStats:
+        """
+        Run every item from `source` through the pipeline; outputs of the last stage are discarded.
+        :param source: The input items for the first stage
+        :raises: The first exception raised by a stage function
+        :return: The run statistics
+        """
+        start = time.perf_counter()
+
+        stop = threading.Event()
+        runners = [_StageRunner(stage, stop, self.logger) for stage in self.stages]
+        for upstream, downstream in zip(runners, runners[1:]):
+            upstream.downstream = downstream
+
+        threads = [
+            threading.Thread(target=r.work, name=f"{r.stage.name}-{i}", daemon=True)
+            for r in runners
+            for i in range(r.stage.workers)
+        ]
+        for t in threads:
+            t.start()
+
+        try:
+            if len(runners) > 0:
+                for item in source:
+                    if not runners[0].put(item):
+                        break
+                runners[0].close()
+        finally:
+            for t in threads:
+                t.join()
+
+        for r in runners:
+            if r.error is not None:
+                raise r.error
+
+        stats = PipelineStats([r.stats for r in runners], time.perf_counter() - start)
+        self.logger.info(stats.report())
+        return stats
+
+
+# -----------------------------------------------------------------------------
+# Private Classes
+# -----------------------------------------------------------------------------
+
+
+class _StageRunner:
+    """The runtime state of a stage."""
+
+    def __init__(
+        self, stage: Stage, stop: threading.Event, logger: logging.Logger
+    ) -> None:
+        # the stage
+        self.stage = stage
+        # logger instance
+        self.logger = logger
+        # set when any stage fails, to stop the whole pipeline
+        self.stop = stop
+        # the next stage, if any
+        self.downstream: _StageRunner | None = None
+        # counters for the stage
+        self.stats = StageStats(stage.name, stage.workers)
+        # the first exception raised by the stage function
+        self.error: BaseException | None = None
+
+        # (item, attempts made) waiting to be processed
+        self._queue: queue.Queue[tuple[Any, int]] = queue.Queue(stage.capacity)
+        # (due time, sequence number, item, attempts made) waiting to be retried
+        self._retries: list[tuple[float, int, Any, int]] = []
+        # the number of items accepted and not yet fully processed
+        self._outstanding = 0
+        # indicates no more items will be put by upstream
+        self._closed = False
+        # the number of workers still running
+        self._running = stage.workers
+        # breaks ties between retries due at the same time
+        self._seq = 0
+        # guards the state above
+        self._lock = threading.Lock()
+
+    def put(self, item: Any, attempt: int = 0) -> bool:
+        """
+        Put an item on the input queue, blocking while the queue is full.
+        :return: False if the pipeline was stopped
+        """
+        with self._lock:
+            self._outstanding += 1
+        while not self.stop.is_set():
+            try:
+                self._queue.put((item, attempt), timeout=_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def close(self) -> None:
+        """Indicate that no more items will be put by upstream."""
+        with self._lock:
+            self._closed = True
+
+    def work(self) -> None:
+        """Process items until upstream is closed and no work remains."""
+        try:
+            while not self.stop.is_set():
+                entry = self._next()
+                if entry is None:
+                    with self._lock:
+                        if self._closed and self._outstanding == 0:
+                            break
+                    continue
+                self._process(*entry)
+        except BaseException as e:
+            self.error = e
+            self.stop.set()
+        finally:
+            with self._lock:
+                self._running -= 1
+                last = self._running == 0
+            # the last worker to finish closes the next stage
+            if last and self.downstream is not None:
+                self.downstream.close()
+
+    def _next(self) -> tuple[Any, int] | None:
+        """Get the next item to process: a due retry, else a queued item."""
+        with self._lock:
+            if len(self._retries) > 0 and self._retries[0][0] <= time.monotonic():
+                _, _, item, attempt = heapq.heappop(self._retries)
+                return item, attempt
+        try:
+            return self._queue.get(timeout=_POLL)
+        except queue.Empty:
+            return None
+
+    def _process(self, item: Any, attempt: int) -> None:
+        """Apply the stage function to an item, forwarding outputs as they are produced."""
+        start = time.perf_counter()
+        blocked = 0.0
+        n = 0
+
+        def forward(output: Any) -> None:
+            nonlocal blocked, n
+            t = time.perf_counter()
+            if self.downstream is not None:
+                self.downstream.put(output)
+            blocked += time.perf_counter() - t
+            n += 1
+
+        try:
+            for output in self.stage.fn(item):
+                forward(output)
+        except Retry as e:
+            if attempt + 1 < self.stage.attempts:
+                due = time.monotonic() + self.stage.backoff(attempt + 1)
+                with self._lock:
+                    heapq.heappush(self._retries, (due, self._seq, item, attempt + 1))
+                    self._seq += 1
+                self.stats.record_retry()
+                self.stats.record(1, n, time.perf_counter() - start - blocked, blocked)
+                return
+            self.logger.warning(
+                f"stage '{self.stage.name}' giving up after {attempt + 1} attempts: {e.reason}"
+            )
+            for output in e.fallback:
+                forward(output)
+
+        self.stats.record(1, n, time.perf_counter() - start - blocked, blocked)
+        with self._lock:
+            self._outstanding -= 1
@@ -0,0 +1,155 @@
+"""
+CPU and allocation profiling for jobs.
+"""
+
+import cProfile
+import logging
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+from types import TracebackType
+
+# the number of allocation sites listed in the report
+_TOP_ALLOCATIONS = 15
+# the number of functions listed in the report
+_TOP_FUNCTIONS = 15
+
+# (category, fragments of the file path or builtin name of functions in it), first match wins
+_CATEGORIES = [
+    (
+        "network wait",
+        [
+            "/socket.py",
+            "/ssl.py",
+            "/http/client.py",
+            "/urllib3/",
+            "/requests/",
+            "_socket.socket",
+            "_ssl._SSLSocket",
+        ],
+    ),
+    (
+        "html parsing",
+        ["/bs4/", "/lxml/", "/html/parser.py", "/soupsieve/", "/charset_normalizer/"],
+    ),
+    ("model construction", ["/pydantic/", "/pydantic_core/", "pydantic_core."]),
+    ("date parsing", ["/dateutil/", "/pyrox/parsers/", "/_strptime.py"]),
+    ("csv serialization", ["/pyrox/io/writer.py", "_csv.writer"]),
+    ("idle (queues, locks)", ["_thread.lock", "_thread.RLock"]),
+]
+
+
+class Profiler:
+    """
+    Profile CPU time and track allocations while active; on exit, write a
+    report to `path`. From Python 3.12, cProfile observes every thread.
+    """
+
+    def __init__(
+        self, path: Path, logger: logging.Logger = logging.getLogger(__name__)
+    ) -> None:
+        # the path to which the report is written
+        self.path = path
+        # logger instance
+        self.logger = logger
+
+        # the CPU profile
+        self._profile = cProfile.Profile()
+        # the start of the profiled run
+        self._start = 0.0
+
+    def __enter__(self) -> "Profiler":
+        tracemalloc.start()
+        self._start = time.perf_counter()
+        self._profile.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._profile.disable()
+        elapsed = time.perf_counter() - self._start
+
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.path.write_text(self.report(elapsed, snapshot, peak))
+        self.logger.info(f"wrote profiling report to {self.path}")
+
+    def report(self, elapsed: float, snapshot: tracemalloc.Snapshot, peak: int) -> str:
+        """
+        Format the profiling report.
+        :param elapsed: The wall time of the run, in seconds
+        :param snapshot: The allocations live at the end of the run
+        :param peak: The peak traced memory, in bytes
+        :return: The report
+        """
+        stats = pstats.Stats(self._profile)
+
+        # self time per category; summed across threads, so may exceed wall time
+        totals = {name: 0.0 for name, _ in _CATEGORIES}
+        other = 0.0
+        for (filename, _, function), entry in stats.stats.items():  # type: ignore[attr-defined]
+            category = _categorize(filename, function)
+            if category is not None:
+                totals[category] += entry[2]
+            elif filename == "~":
+                # attribute builtins (regex, str methods, ...) to their callers
+                for (caller, _, name), timing in entry[4].items():
+                    category = _categorize(caller, name)
+                    if category is None:
+                        other += timing[2]
+                    else:
+                        totals[category] += timing[2]
+            else:
+                other += entry[2]
+
+        lines = [
+            f"wall time: {elapsed:.2f}s",
+            f"peak traced memory: {peak / 2**20:.1f} MiB",
+            "",
+            "time by stage (self time, summed across threads):",
+        ]
+        for name, seconds in totals.items():
+            lines.append(f"  {name:<22} {seconds:8.2f}s")
+        lines.append(f"  {'other':<22} {other:8.2f}s")
+
+        lines += ["", f"top {_TOP_ALLOCATIONS} allocation sites (live at exit):"]
+        for stat in snapshot.statistics("lineno")[:_TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"  {stat.size / 1024:10.1f} KiB {stat.count:8} blocks  {frame.filename}:{frame.lineno}"
+            )
+
+        # cumulative time double counts when threads interleave, so rank by self time
+        lines += ["", f"top {_TOP_FUNCTIONS} functions by self time:"]
+        ranked = sorted(
+            stats.stats.items(),  # type: ignore[attr-defined]
+            key=lambda item: item[1][2],
+            reverse=True,
+        )
+        for (filename, lineno, function), entry in ranked[:_TOP_FUNCTIONS]:
+            lines.append(
+                f"  {entry[2]:8.2f}s {entry[1]:8} calls  {function} ({filename}:{lineno})"
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def _categorize(filename: str, function: str) -> str | None:
+    """
+    Get the stage category of a function.
+    :param filename: The file defining the function, or '~' for builtins
+    :param function: The name of the function
+    :return: The category, or None if uncategorized
+    """
+    where = function if filename == "~" else filename.replace("\\", "/")
+    for name, fragments in _CATEGORIES:
+        if any(fragment in where for fragment in fragments):
+            return name
+    return None
@@ -0,0 +1,276 @@
+"""
+A lease-based task queue shared by loader processes.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from enum import StrEnum
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+import pyrox.models as models
+
+# the default time for which a claimed task is leased without a heartbeat
+LEASE = timedelta(minutes=5)
+
+# the default number of times a task is claimed before it is given up
+ATTEMPTS = 3
+
+# the seconds to wait for another process to release the database
+_TIMEOUT = 60.0
+
+
+class TaskState(StrEnum):
+    """An enumeration over the states of a task."""
+
+    # waiting to be claimed
+    PENDING = "pending"
+    # claimed by a worker, until its lease expires
+    LEASED = "leased"
+    # finished, with its results written
+    DONE = "done"
+    # given up after too many attempts
+    FAILED = "failed"
+
+
+class Task(NamedTuple):
+    """A unit of loading work: a chunk of the results of a division at an event."""
+
+    # the task id, in the order tasks were added
+    id: int
+    # the name of the event
+    event: str
+    # the name of the division
+    division: models.DivisionName
+    # the chunk of the division's results, starting from 0
+    chunk: int
+    # the number of times the task has been claimed, including this one
+    attempts: int
+
+
+class TaskQueue:
+    """
+    A queue of loading tasks in a SQLite database file, which any number of
+    worker processes claim from. A claimed task is leased to its worker,
+    which must renew the lease with heartbeats; a task whose lease expires,
+    or which fails, is claimed again by another worker, until it has been
+    attempted too many times.
+
+    Workers on several hosts may share a queue on a network filesystem
+    with working file locks. The default rollback journal is kept for that
+    reason (WAL requires shared memory), and leases assume their clocks roughly agree.
+    """
+
+    def __init__(
+        self, path: Path, lease: timedelta = LEASE, attempts: int = ATTEMPTS
+    ) -> None:
+        """
+        Open a queue, creating it if necessary.
+        :param path: The path to the database file
+        :param lease: The time for which a claimed task is leased without a heartbeat
+        :param attempts: The number of times a task is claimed before it is given up
+        """
+        # the path to the database file
+        self.path = path
+        # the time for which a claimed task is leased without a heartbeat
+        self.lease = lease
+        # the number of times a task is claimed before it is given up
+        self.attempts = attempts
+
+        # one connection shared by the threads of a worker; transactions are explicit
+        self._db = sqlite3.connect(
+            path, timeout=_TIMEOUT, isolation_level=None, check_same_thread=False
+        )
+        # guards the connection
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                "id INTEGER PRIMARY KEY, "
+                "event TEXT NOT NULL, "
+                "division TEXT NOT NULL, "
+                "chunk INTEGER NOT NULL, "
+                "state TEXT NOT NULL, "
+                "worker TEXT, "
+                "expires REAL, "
+                "attempts INTEGER NOT NULL DEFAULT 0, "
+                "results INTEGER, "
+                "error TEXT, "
+                "UNIQUE (event, division, chunk))"
+            )
+
+    def __enter__(self) -> TaskQueue:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def put(self, event: str, division: models.DivisionName, chunk: int = 0) -> bool:
+        """
+        Add a task, unless it is already queued.
+        :param event: The name of the event
+        :param division: The name of the division
+        :param chunk: The chunk of the division's results
+        :return: True if the task was added
+        """
+        return self.extend([(event, division)], chunk) == 1
+
+    def extend(
+        self, tasks: Iterable[tuple[str, models.DivisionName]], chunk: int = 0
+    ) -> int:
+        """
+        Add the tasks for many (event, division) pairs, skipping those already queued.
+        :param tasks: The (event, division) pairs
+        :param chunk: The chunk of each division's results
+        :return: The number of tasks added
+        """
+        with self._lock:
+            before = self._db.total_changes
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO tasks (event, division, chunk, state) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(e, str(d), chunk, TaskState.PENDING) for e, d in tasks],
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            return self._db.total_changes - before
+
+    def claim(self, worker: str) -> Task | None:
+        """
+        Claim the oldest pending task, or one whose lease has expired.
+        :param worker: A name identifying the worker, unique across hosts
+        :return: The task, or None if no task can be claimed
+        """
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                # expired tasks out of attempts are given up, rather than claimed again
+                self._db.execute(
+                    "UPDATE tasks SET state = ?, error = 'lease expired' "
+                    "WHERE state = ? AND expires < ? AND attempts >= ?",
+                    (TaskState.FAILED, TaskState.LEASED, now, self.attempts),
+                )
+                row = self._db.execute(
+                    "UPDATE tasks SET state = ?, worker = ?, expires = ?, "
+                    "attempts = attempts + 1 "
+                    "WHERE id = (SELECT id FROM tasks "
+                    "WHERE state = ? OR (state = ? AND expires < ?) "
+                    "ORDER BY id LIMIT 1) "
+                    "RETURNING id, event, division, chunk, attempts",
+                    (
+                        TaskState.LEASED,
+                        worker,
+                        now + self.lease.total_seconds(),
+                        TaskState.PENDING,
+                        TaskState.LEASED,
+                        now,
+                    ),
+                ).fetchone()
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+        if row is None:
+            return None
+        id, event, division, chunk, attempts = row
+        return Task(id, event, models.DivisionName(division), chunk, attempts)
+
+    def heartbeat(self, task: Task, worker: str) -> bool:
+        """
+        Renew the lease on a claimed task.
+        :param task: The task
+        :param worker: The worker holding the lease
+        :return: True if the lease was renewed, False if it was lost to another worker
+        """
+        return self._update(
+            task,
+            worker,
+            "expires = ?",
+            time.time() + self.lease.total_seconds(),
+        )
+
+    def complete(self, task: Task, worker: str, results: int) -> bool:
+        """
+        Mark a claimed task as done.
+        :param task: The task
+        :param worker: The worker holding the lease
+        :param results: The number of results written for the task
+        :return: True if the task was marked, False if its lease was lost to another worker
+        """
+        return self._update(
+            task,
+            worker,
+            "state = ?, results = ?, error = NULL",
+            TaskState.DONE,
+            results,
+        )
+
+    def fail(self, task: Task, worker: str, error: str) -> bool:
+        """
+        Release a claimed task that failed, to be claimed again unless out of attempts.
+        :param task: The task
+        :param worker: The worker holding the lease
+        :param error: A description of the failure
+        :return: True if the task was released, False if its lease was lost to another worker
+        """
+        state = (
+            TaskState.FAILED if task.attempts >= self.attempts else TaskState.PENDING
+        )
+        return self._update(task, worker, "state = ?, error = ?", state, error)
+
+    def counts(self) -> dict[TaskState, int]:
+        """
+        Count the tasks in each state.
+        :return: The number of tasks, by state
+        """
+        counts = {state: 0 for state in TaskState}
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT state, COUNT(*) FROM tasks GROUP BY state"
+            ).fetchall()
+        for state, n in rows:
+            counts[TaskState(state)] = n
+        return counts
+
+    def tasks(self, state: TaskState | None = None) -> list[Task]:
+        """
+        Get the tasks in the queue.
+        :param state: Get only the tasks in this state, or every task if None
+        :return: The tasks, in the order they were added
+        """
+        query = "SELECT id, event, division, chunk, attempts FROM tasks"
+        params: tuple[str, ...] = ()
+        if state is not None:
+            query += " WHERE state = ?"
+            params = (state,)
+        with self._lock:
+            rows = self._db.execute(f"{query} ORDER BY id", params).fetchall()
+        return [
+            Task(id, event, models.DivisionName(division), chunk, attempts)
+            for id, event, division, chunk, attempts in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def _update(self, task: Task, worker: str, assign: str, *values: object) -> bool:
+        """Update a task only while the worker still holds its lease."""
+        with self._lock:
+            cursor = self._db.execute(
+                f"UPDATE tasks SET {assign} WHERE id = ? AND worker = ? AND state = ?",
+                (*values, task.id, worker, TaskState.LEASED),
+            )
+        return cursor.rowcount == 1
@@ -0,0 +1,201 @@
+"""
+Rebuild results from a page archive, without network access.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import HttpUrl
+
+import pyrox.models as models
+from pyrox.io.archive import PageArchive, read_segment
+from pyrox.io.writer import ResultsWriter
+from pyrox.scrapers.base import make_soup, release_soup
+from pyrox.scrapers.division import DivisionScraper
+from pyrox.scrapers.event import EventScraper
+from pyrox.scrapers.profile import ProfileScraper
+from pyrox.scrapers.result import ResultScraper
+from pyrox.scrapers.splits import SplitsScraper
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class RescrapeJob:
+    """Rebuild results from the pages in an archive, in parallel across segments."""
+
+    def __init__(
+        self,
+        archive: PageArchive,
+        logger: logging.Logger,
+        processes: int | None = None,
+    ) -> None:
+        # the archive from which pages are read
+        self.archive = archive
+        # logger instance
+        self.logger = logger
+        # the number of worker processes; defaults to the number of CPUs
+        self.processes = processes
+
+    def load(
+        self,
+        path: Path,
+        event_names: set[str] | None = None,
+        division_names: set[models.DivisionName] | None = None,
+    ) -> int:
+        """
+        Rebuild results for every archived event and division and write them to `path`.
+        :param path: The path to which results are written
+        :param event_names: Restrict to events with these names
+        :param division_names: Restrict to divisions with these names
+        :return: The number of results written
+        """
+        segments = self.archive.segments()
+        self.logger.info(f"re-scraping {len(segments)} archive segments")
+
+        scraped = _Scraped()
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            for partial in executor.map(_scrape_segment, segments):
+                scraped.merge(partial)
+
+        if scraped.events is None:
+            self.logger.warning("archive does not contain the events page")
+            return 0
+
+        canonical = (
+            {models.Event.canonicalize(e) for e in event_names}
+            if event_names is not None
+            else None
+        )
+
+        n = 0
+        append = False
+        for event in scraped.events[1]:
+            if canonical is not None and event.canonical_name not in canonical:
+                continue
+
+            _, divisions = scraped.divisions.get(str(event.url), (0.0, []))
+            for division in divisions:
+                if division_names is not None and division.name not in division_names:
+                    continue
+
+                results = scraped.results(str(division.url))
+                if len(results) == 0:
+                    continue
+
+                writer = ResultsWriter(event.canonical_name, division.name)
+                writer.write(results, path, append=append)
+                append = True
+                n += len(results)
+
+        self.logger.info(f"re-scraped {n} results")
+        return n
+
+
+class _Scraped:
+    """The data scraped from archived pages, keeping the most recent fetch of each."""
+
+    def __init__(self) -> None:
+        # the events page
+        self.events: tuple[float, list[models.Event]] | None = None
+        # divisions, by event URL
+        self.divisions: dict[str, tuple[float, list[models.Division]]] = {}
+        # pages of rankings, by (division URL, page number)
+        self.rankings: dict[tuple[str, int], tuple[float, list[models.Result]]] = {}
+        # splits, by result URL
+        self.splits: dict[str, tuple[float, models.Splits]] = {}
+        # athlete profile URLs, by result URL
+        self.profiles: dict[str, tuple[float, HttpUrl]] = {}
+
+    def merge(self, other: "_Scraped") -> None:
+        """Merge data scraped from another set of pages."""
+        if other.events is not None and (
+            self.events is None or other.events[0] > self.events[0]
+        ):
+            self.events = other.events
+        _merge(self.divisions, other.divisions)
+        _merge(self.rankings, other.rankings)
+        _merge(self.splits, other.splits)
+        _merge(self.profiles, other.profiles)
+
+    def results(self, division_url: str) -> list[models.Result]:
+        """Assemble the enriched results for the division at `division_url`."""
+        pages = sorted(p for (url, p) in self.rankings if url == division_url)
+
+        results: list[models.Result] = []
+        for p in pages:
+            _, page = self.rankings[(division_url, p)]
+            for r in page:
+                url = str(r.url)
+                splits = self.splits.get(url)
+                profile = self.profiles.get(url)
+                results.append(
+                    r.model_copy(
+                        update={
+                            "splits": splits[1] if splits is not None else None,
+                            "profile": profile[1] if profile is not None else None,
+                        }
+                    )
+                )
+
+        return results
+
+
+def _merge(into: dict[K, tuple[float, V]], other: dict[K, tuple[float, V]]) -> None:
+    """Merge timestamped entries, keeping the most recent for each key."""
+    for key, value in other.items():
+        current = into.get(key)
+        if current is None or value[0] > current[0]:
+            into[key] = value
+
+
+def _scrape_segment(path: Path) -> _Scraped:
+    """
+    Scrape every page in an archive segment, in a worker process.
+    :param path: The path to the segment file
+    :return: The scraped data
+    """
+    logger = logging.getLogger(__name__)
+    scraped = _Scraped()
+
+    for page in read_segment(path):
+        url, at = page.url, page.fetched_at
+        soup = make_soup(page.content)
+        try:
+            if url.endswith("/events?tab=all"):
+                other = _Scraped()
+                other.events = (at, EventScraper(logger).scrape(soup))
+                scraped.merge(other)
+            elif "?p=" in url:
+                base, p = url.split("?p=", 1)
+                _merge(
+                    scraped.rankings,
+                    {(base, int(p)): (at, ResultScraper(logger).scrape(soup))},
+                )
+            elif url.endswith("?tab=splits"):
+                try:
+                    splits = SplitsScraper(logger).scrape(soup)
+                except ValueError:
+                    # splits were not yet available when the page was fetched
+                    continue
+                _merge(scraped.splits, {url.removesuffix("?tab=splits"): (at, splits)})
+            elif url.endswith("?tab=overview"):
+                try:
+                    profile = ProfileScraper(logger).scrape(soup)
+                except ValueError:
+                    continue
+                _merge(
+                    scraped.profiles, {url.removesuffix("?tab=overview"): (at, profile)}
+                )
+            elif "/athlete/" not in url:
+                # any other page is an event page, listing its divisions
+                _merge(
+                    scraped.divisions, {url: (at, DivisionScraper(logger).scrape(soup))}
+                )
+        finally:
+            # release the parsed page; only scraped values are kept
+            release_soup(soup)
+
+    return scraped
@@ -0,0 +1,70 @@
+"""
+Unit tests for backfill jobs.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Sequence
+
+import pytest
+import requests
+
+from pyrox.client import Hyrox
+from pyrox.client.fetch import Fetcher
+from pyrox.models import DivisionName
+
+from .backfill import BackfillJob, BackfillProgress, BackfillTask
+
+
+def test_backfill(
+    tmp_path: Path, fake_fetcher: Callable[[Sequence[int]], Fetcher]
+) -> None:
+    """A backfill resolves events by date, estimates its cost, and reports progress."""
+
+    fetcher = fake_fetcher(range(1, 251))
+    fetcher.rate_limit = 100.0
+    job = BackfillJob(Hyrox(logging.getLogger(__name__), fetcher=fetcher))
+
+    plan = job.plan({DivisionName.ELITE_MEN}, after=datetime(2025, 1, 1), splits=True)
+    # events and event pages, 3 ranking pages and the empty page past them, and splits
+    assert plan.tasks == [
+        BackfillTask("test_2025", DivisionName.ELITE_MEN, 250, 2 + 4 + 250)
+    ]
+    assert plan.duration == timedelta(seconds=3)
+
+    assert job.plan({DivisionName.ELITE_MEN}, before=datetime(2025, 1, 1)).tasks == []
+    assert job.plan({DivisionName.PRO_MEN}).tasks == []
+
+    progress: list[BackfillProgress] = []
+    n = job.run(
+        plan,
+        tmp_path / "results.csv",
+        workers=4,
+        progress=progress.append,
+        interval=timedelta(milliseconds=1),
+    )
+    assert n == 250
+    assert len(progress) > 0
+    assert all(p.total == plan.requests for p in progress)
+
+    # nothing is left to load when resuming
+    assert job.run(plan, tmp_path / "results.csv", resume=True) == 0
+
+
+def test_backfill_plan_skips_failed_events(
+    monkeypatch: pytest.MonkeyPatch, fake_fetcher: Callable[[Sequence[int]], Fetcher]
+) -> None:
+    """An event whose divisions fail to load is skipped, without failing the plan."""
+
+    fetcher = fake_fetcher(range(1, 251))
+    serve = fetcher._serve  # type: ignore[attr-defined]
+
+    def failing(url: str) -> bytes:
+        if url.endswith("/event/test"):
+            raise requests.ConnectionError(f"connection refused: {url}")
+        return serve(url)
+
+    monkeypatch.setattr(fetcher, "_serve", failing)
+    job = BackfillJob(Hyrox(logging.getLogger(__name__), fetcher=fetcher))
+    assert job.plan({DivisionName.ELITE_MEN}).tasks == []
@@ -0,0 +1,66 @@
+"""
+Unit tests for results loading jobs.
+"""
+
+import logging
+from pathlib import Path
+from typing import Callable, Sequence
+
+import pytest
+
+import pyrox.models as models
+from pyrox.client import Hyrox
+from pyrox.client.fetch import Fetcher
+from pyrox.io.reader import ResultsReader
+from pyrox.io.writer import COLUMNS
+from pyrox.models import DivisionName
+
+from .loader import MultiEventLoader, ResultsLoader
+
+
+class _Crash(Exception):
+    """Stands in for the process dying mid-division."""
+
+
+def test_resume_reloads_interrupted_division(
+    tmp_path: Path, fake_fetcher: Callable[[Sequence[int]], Fetcher]
+) -> None:
+    """A division interrupted part way is loaded again in full when resuming."""
+
+    path = tmp_path / "results.csv"
+    loader = MultiEventLoader(
+        Hyrox(logging.getLogger(__name__), fetcher=fake_fetcher(range(1, 251)))
+    )
+
+    def crash(result: models.Result) -> bool:
+        if result.position > 150:
+            raise _Crash()
+        return False
+
+    with pytest.raises(_Crash):
+        loader.load(
+            {"test_2025"}, {DivisionName.ELITE_MEN}, path, splits=True, select=crash
+        )
+    assert 0 < len(list(ResultsReader(path).read())) < 250
+
+    assert (
+        loader.load({"test_2025"}, {DivisionName.ELITE_MEN}, path, resume=True) == 250
+    )
+    positions = [r.result.position for r in ResultsReader(path).read()]
+    assert positions == list(range(1, 251))
+
+    # a complete division is skipped
+    assert loader.load({"test_2025"}, {DivisionName.ELITE_MEN}, path, resume=True) == 0
+
+
+def test_load_writes_header_without_results(
+    tmp_path: Path, fake_fetcher: Callable[[Sequence[int]], Fetcher]
+) -> None:
+    """A division without results is written as a file holding only the header."""
+
+    path = tmp_path / "results.csv"
+    client = Hyrox(logging.getLogger(__name__), fetcher=fake_fetcher([]))
+    assert ResultsLoader(client).load("test_2025", DivisionName.ELITE_MEN, path) == 0
+
+    assert path.read_text().splitlines() == [",".join(COLUMNS)]
+    assert list(ResultsReader(path).read()) == []
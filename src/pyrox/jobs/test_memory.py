@@ -0,0 +1,71 @@
+"""
+Memory regression tests for loading results.
+"""
+
+import logging
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Sequence
+
+import pytest
+
+from pyrox.client import Hyrox
+from pyrox.client.fetch import Fetcher
+from pyrox.models import DivisionName
+
+from .loader import ResultsLoader
+
+
+def _peak(
+    fake_fetcher: Callable[[Sequence[int]], Fetcher],
+    n: int,
+    path: Path,
+    splits: bool,
+) -> int:
+    """Load a division of `n` results, and get the peak traced memory."""
+    logger = logging.getLogger(__name__)
+    client = Hyrox(logger, fetcher=fake_fetcher(range(1, n + 1)))
+
+    tracemalloc.start()
+    try:
+        written = ResultsLoader(client).load(
+            "test_2025", DivisionName.ELITE_MEN, path, splits=splits, workers=4
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert written == n
+    return peak
+
+
+def test_load_memory_is_flat_in_division_size(
+    tmp_path: Path, fake_fetcher: Callable[[Sequence[int]], Fetcher]
+) -> None:
+    """Peak memory does not grow with the number of results loaded, at a small scale."""
+
+    # import the lazily imported modules before measuring
+    _peak(fake_fetcher, 100, tmp_path / "warmup.csv", splits=False)
+
+    small = _peak(fake_fetcher, 200, tmp_path / "small.csv", splits=False)
+    large = _peak(fake_fetcher, 2000, tmp_path / "large.csv", splits=False)
+
+    # holding every result, or every parsed page, would at least double the peak
+    assert large < 1.5 * small, f"peak grew from {small} to {large} bytes"
+
+
+@pytest.mark.slow
+def test_load_memory_is_flat_with_splits(
+    tmp_path: Path, fake_fetcher: Callable[[Sequence[int]], Fetcher]
+) -> None:
+    """Peak memory does not grow with the number of results loaded with splits."""
+
+    # import the lazily imported modules before measuring
+    _peak(fake_fetcher, 100, tmp_path / "warmup.csv", splits=True)
+
+    small = _peak(fake_fetcher, 100, tmp_path / "small.csv", splits=True)
+    large = _peak(fake_fetcher, 10_000, tmp_path / "large.csv", splits=True)
+
+    # the bounded queues fill as the division grows, then the peak levels off;
+    # holding every result would grow it by an order of magnitude
+    assert large < 3 * small, f"peak grew from {small} to {large} bytes"
@@ -0,0 +1,82 @@
+"""
+Unit tests for the staged pipeline.
+"""
+
+import threading
+from typing import Iterator
+
+import pytest
+
+from .pipeline import Pipeline, Retry, Stage
+
+
+def test_pipeline_runs_items_through_every_stage() -> None:
+    """Every item reaches the last stage, fanned out by earlier stages."""
+
+    out: list[int] = []
+    lock = threading.Lock()
+
+    def expand(n: int) -> Iterator[int]:
+        yield from range(n)
+
+    def square(n: int) -> Iterator[int]:
+        yield n * n
+
+    def collect(n: int) -> Iterator[int]:
+        with lock:
+            out.append(n)
+        return iter(())
+
+    stats = Pipeline(
+        [
+            Stage("expand", expand),
+            Stage("square", square, workers=4, capacity=2),
+            Stage("collect", collect),
+        ]
+    ).run([10, 20])
+
+    assert sorted(out) == sorted(
+        [i * i for i in range(10)] + [i * i for i in range(20)]
+    )
+    assert [s.items_in for s in stats.stages] == [2, 30, 30]
+    assert [s.items_out for s in stats.stages] == [30, 30, 0]
+    assert stats.bottleneck is not None
+
+
+def test_pipeline_retries_then_falls_back() -> None:
+    """An item raising `Retry` is retried, then its fallback outputs are forwarded."""
+
+    attempts: dict[str, int] = {}
+    out: list[str] = []
+
+    def flaky(s: str) -> Iterator[str]:
+        attempts[s] = attempts.get(s, 0) + 1
+        if s == "never" or attempts[s] < 2:
+            raise Retry("not yet", [f"{s}-fallback"])
+        yield s
+
+    def collect(s: str) -> Iterator[str]:
+        out.append(s)
+        return iter(())
+
+    stats = Pipeline(
+        [Stage("flaky", flaky, attempts=3), Stage("collect", collect)]
+    ).run(["once", "never"])
+
+    assert sorted(out) == ["never-fallback", "once"]
+    assert attempts == {"once": 2, "never": 3}
+    assert stats.stages[0].retries == 3
+
+
+def test_pipeline_raises_first_error() -> None:
+    """An exception in a stage stops the pipeline and is raised by `run`."""
+
+    def fail(n: int) -> Iterator[int]:
+        if n == 3:
+            raise ValueError("boom")
+        yield n
+
+    with pytest.raises(ValueError):
+        Pipeline([Stage("fail", fail, capacity=1), Stage("sink", lambda n: ())]).run(
+            range(1000)
+        )
@@ -0,0 +1,171 @@
+"""
+Unit tests for the task queue and its workers.
+"""
+
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Sequence
+
+from pydantic import HttpUrl
+
+from pyrox.client import Hyrox
+from pyrox.client.fetch import Fetcher
+from pyrox.io.reader import ResultsReader
+from pyrox.io.writer import ResultsSink
+from pyrox.models import DivisionName, Result
+
+from .queue import Task, TaskQueue, TaskState
+from .worker import QueueWorker, merge_parts, part_path, parts_dir
+
+# a lease short enough for tests to outlive
+_LEASE = timedelta(milliseconds=200)
+
+
+def test_queue_leases(tmp_path: Path) -> None:
+    """Tasks are leased, renewed, released and reclaimed."""
+
+    queue = TaskQueue(tmp_path / "queue.db", lease=_LEASE, attempts=2)
+    assert (
+        queue.extend([("a", DivisionName.ELITE_MEN), ("b", DivisionName.PRO_MEN)]) == 2
+    )
+    # tasks already queued are skipped
+    assert not queue.put("a", DivisionName.ELITE_MEN)
+
+    a = queue.claim("w1")
+    b = queue.claim("w2")
+    assert a == Task(1, "a", DivisionName.ELITE_MEN, 0, 1)
+    assert b is not None and b.event == "b"
+    assert queue.claim("w3") is None
+
+    # only the leaseholder may renew or complete a task
+    assert queue.heartbeat(a, "w1")
+    assert not queue.complete(a, "w2", 10)
+    assert queue.complete(a, "w1", 10)
+
+    # a failed task is claimed again, until out of attempts
+    assert queue.fail(b, "w2", "boom")
+    b = queue.claim("w3")
+    assert b is not None and b.attempts == 2
+    assert queue.fail(b, "w3", "boom")
+    assert queue.claim("w3") is None
+    assert queue.counts()[TaskState.FAILED] == 1
+
+    # an expired lease is reclaimed by another worker, and lost by its holder
+    assert queue.put("c", DivisionName.ELITE_MEN)
+    c = queue.claim("w1")
+    assert c is not None
+    time.sleep(2 * _LEASE.total_seconds())
+    assert queue.claim("w2") == c._replace(attempts=2)
+    assert not queue.heartbeat(c, "w1")
+
+    queue.close()
+
+
+def _drain(path: Path, worker: str, crash: bool) -> list[int]:
+    """Claim and complete tasks until none are left, in a worker process."""
+    done: list[int] = []
+    with TaskQueue(path, lease=_LEASE) as queue:
+        while (task := queue.claim(worker)) is not None:
+            # a crashed worker never completes, nor renews, its task
+            if crash:
+                return done
+            if queue.complete(task, worker, 1):
+                done.append(task.id)
+    return done
+
+
+def test_queue_across_processes(tmp_path: Path) -> None:
+    """Every task is completed exactly once by concurrent worker processes."""
+
+    path = tmp_path / "queue.db"
+    with TaskQueue(path) as queue:
+        queue.extend((f"event_{i}", DivisionName.ELITE_MEN) for i in range(200))
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(4, mp_context=context) as pool:
+        crashed = pool.submit(_drain, path, "crash", True)
+        crashed.result()
+        futures = [pool.submit(_drain, path, f"w{i}", False) for i in range(4)]
+        done = [id for f in futures for id in f.result()]
+
+    # the crashed worker's task is reclaimed once its lease expires
+    time.sleep(2 * _LEASE.total_seconds())
+    done += _drain(path, "last", False)
+
+    assert sorted(done) == list(range(1, 201))
+    with TaskQueue(path) as queue:
+        assert queue.counts()[TaskState.DONE] == 200
+
+
+def _work(
+    queue_path: Path,
+    output: Path,
+    fake_fetcher: Callable[[Sequence[int]], Fetcher],
+    n: int,
+) -> int:
+    """Load queued chunks of a division of `n` results, in a worker process."""
+    client = Hyrox(logging.getLogger(__name__), fetcher=fake_fetcher(range(1, n + 1)))
+    with TaskQueue(queue_path, lease=timedelta(seconds=5)) as queue:
+        return QueueWorker(client, queue, parts_dir(output), chunk=100).run()
+
+
+def test_queue_workers_merge(
+    tmp_path: Path, fake_fetcher: Callable[[Sequence[int]], Fetcher]
+) -> None:
+    """Chunks loaded by worker processes merge into one results file."""
+
+    queue_path = tmp_path / "queue.db"
+    output = tmp_path / "results.csv"
+    with TaskQueue(queue_path) as queue:
+        queue.put("test_2025", DivisionName.ELITE_MEN)
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(3, mp_context=context) as pool:
+        futures = [
+            pool.submit(_work, queue_path, output, fake_fetcher, 350) for _ in range(3)
+        ]
+        assert sum(f.result() for f in futures) == 350
+
+    with TaskQueue(queue_path) as queue:
+        assert [t.chunk for t in queue.tasks(TaskState.DONE)] == [0, 1, 2, 3]
+        assert merge_parts(queue, parts_dir(output), output) == 350
+
+    table = ResultsReader(output).read_table(["position"])
+    assert list(table["position"]) == list(range(1, 351))
+
+
+def test_merge_parts_counts_rows(tmp_path: Path) -> None:
+    """Merged results are counted by row, however many lines their fields span."""
+
+    parts = tmp_path / "parts"
+    parts.mkdir()
+    output = tmp_path / "results.csv"
+    results = [
+        Result(
+            position=i + 1,
+            name=name,
+            time=timedelta(hours=1),
+            url=HttpUrl(f"https://www.hyresult.com/result/R{i}"),
+        )
+        for i, name in enumerate(["Line\nBreak", "Athlete"])
+    ]
+
+    with TaskQueue(tmp_path / "queue.db") as queue:
+        queue.put("test_2025", DivisionName.ELITE_MEN)
+        task = queue.claim("w1")
+        assert task is not None
+        with ResultsSink(part_path(parts, task)) as sink:
+            sink.write(task.event, task.division, results)
+        assert queue.complete(task, "w1", 2)
+
+        assert merge_parts(queue, parts, output) == 2
+
+    assert output.read_bytes() == part_path(parts, task).read_bytes()
+    assert [r.result.name for r in ResultsReader(output).read()] == [
+        "Line\nBreak",
+        "Athlete",
+    ]
@@ -0,0 +1,239 @@
+"""
+Queue workers, and merging their output.
+"""
+
+import csv
+import os
+import socket
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Iterator, TextIO
+
+import pyrox.models as models
+from pyrox.analytics.cube import ResultCube
+from pyrox.client import Hyrox
+from pyrox.io.writer import COLUMNS
+from pyrox.jobs.loader import done_path, load_tasks
+from pyrox.jobs.queue import Task, TaskQueue, TaskState
+
+# the longest wait for leased tasks to finish or expire, when none can be claimed
+_POLL_INTERVAL = timedelta(seconds=5)
+
+
+class QueueWorker:
+    """
+    A worker that claims tasks from a queue and loads each to its own part
+    file, renewing its lease while loading. Any number of workers, in any
+    number of processes, may share a queue and a parts directory.
+    """
+
+    def __init__(
+        self,
+        client: Hyrox,
+        queue: TaskQueue,
+        parts: Path,
+        splits: bool = False,
+        profile: bool = False,
+        workers: int = 1,
+        select: Callable[[models.Result], bool] | None = None,
+        top: int | None = None,
+        chunk: int | None = None,
+        name: str | None = None,
+    ) -> None:
+        """
+        Create a worker.
+        :param client: The client
+        :param queue: The queue from which tasks are claimed
+        :param parts: The directory to which the results of each task are written
+        :param splits: Load with splits
+        :param profile: Load with profile
+        :param workers: The number of results enriched concurrently
+        :param select: Enrich only the results for which this returns True
+        :param top: Enrich only the first `top` results in each division
+        :param chunk: Split divisions into tasks of this many results, or load each in one task
+        :param name: A name identifying the worker, unique across hosts; defaults to host and process id
+        """
+        # the client
+        self.client = client
+        # inherit the client's logger
+        self.logger = self.client.logger
+        # the queue from which tasks are claimed
+        self.queue = queue
+        # the directory to which the results of each task are written
+        self.parts = parts
+        # the name identifying the worker
+        self.name = (
+            name if name is not None else f"{socket.gethostname()}:{os.getpid()}"
+        )
+
+        self._splits = splits
+        self._profile = profile
+        self._workers = workers
+        self._select = select
+        self._top = top
+        self._chunk = chunk
+
+    def run(self) -> int:
+        """
+        Load tasks until none are left to claim and none are leased to other workers,
+        which may fail or add further chunks.
+        :return: The number of results written
+        """
+        self.parts.mkdir(parents=True, exist_ok=True)
+        poll = min(_POLL_INTERVAL, self.queue.lease / 2).total_seconds()
+
+        n = 0
+        while True:
+            task = self.queue.claim(self.name)
+            if task is not None:
+                n += self._run(task)
+            elif self.queue.counts()[TaskState.LEASED] > 0:
+                time.sleep(poll)
+            else:
+                return n
+
+    def _run(self, task: Task) -> int:
+        """Load a task to its part file while renewing its lease."""
+        self.logger.info(
+            f"loading chunk {task.chunk} of division '{task.division}' at event '{task.event}'"
+        )
+        # written under a name unique to this attempt, and renamed when complete
+        partial = self.parts / f"{task.id}.{task.attempts}.partial.csv"
+        window = (
+            range(task.chunk * self._chunk, (task.chunk + 1) * self._chunk)
+            if self._chunk is not None
+            else None
+        )
+
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(task, stop), daemon=True
+        )
+        heartbeat.start()
+        try:
+            n = load_tasks(
+                self.client,
+                [(task.event, task.division)],
+                partial,
+                self._splits,
+                self._profile,
+                self._workers,
+                False,
+                self._select,
+                self._top,
+                None,
+                window,
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"failed to load division '{task.division}' at event '{task.event}': {e}"
+            )
+            self.queue.fail(task, self.name, str(e))
+            for path in [partial, ResultCube.path_for(partial), done_path(partial)]:
+                path.unlink(missing_ok=True)
+            return 0
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        # a full chunk may be followed by more results; queued before completing,
+        # so other workers do not stop while this one holds the lease
+        if self._chunk is not None and n == self._chunk:
+            self.queue.put(task.event, task.division, task.chunk + 1)
+
+        part = part_path(self.parts, task)
+        partial.replace(part)
+        ResultCube.path_for(partial).replace(ResultCube.path_for(part))
+        # parts are merged whole, so need no record of completion
+        done_path(partial).unlink(missing_ok=True)
+
+        if not self.queue.complete(task, self.name, n):
+            self.logger.warning(
+                f"lost the lease on division '{task.division}' at event '{task.event}'"
+            )
+        return n
+
+    def _heartbeat(self, task: Task, stop: threading.Event) -> None:
+        """Renew the lease on a task until stopped."""
+        interval = self.queue.lease.total_seconds() / 3
+        while not stop.wait(interval):
+            if not self.queue.heartbeat(task, self.name):
+                self.logger.warning(
+                    f"lost the lease on division '{task.division}' at event '{task.event}'"
+                )
+                return
+
+
+def merge_parts(queue: TaskQueue, parts: Path, path: Path, force: bool = False) -> int:
+    """
+    Merge the part files of the finished tasks in a queue into one results
+    file, ordered by event, division and chunk, with its aggregates.
+    :param queue: The queue
+    :param parts: The directory to which the results of each task were written
+    :param path: The path to which results are written
+    :param force: Overwrite an existing file
+    :raises: RuntimeError if tasks are still pending or leased, or the file exists
+    :return: The number of results written
+    """
+    counts = queue.counts()
+    if counts[TaskState.PENDING] > 0 or counts[TaskState.LEASED] > 0:
+        raise RuntimeError(
+            f"queue has {counts[TaskState.PENDING]} pending and "
+            f"{counts[TaskState.LEASED]} leased tasks"
+        )
+    if path.exists() and not force:
+        raise RuntimeError(f"file at path {path} already exists")
+
+    tasks = sorted(
+        queue.tasks(TaskState.DONE), key=lambda t: (t.event, t.division, t.chunk)
+    )
+    cube = ResultCube()
+    n = 0
+    with path.open("w", newline="") as out:
+        csv.writer(out).writerow(COLUMNS)
+        for task in tasks:
+            part = part_path(parts, task)
+            if not part.exists():
+                continue
+            with part.open(newline="") as f:
+                # skip the part's own header
+                f.readline()
+                n += _copy_rows(f, out)
+            cube.merge(ResultCube.open(part))
+    cube.save(ResultCube.path_for(path))
+    return n
+
+
+def parts_dir(results: Path) -> Path:
+    """
+    Get the directory to which workers write the parts of a results file.
+    :param results: The path to the results file
+    :return: The path to the parts directory
+    """
+    return results.with_name(f"{results.name}.parts")
+
+
+def part_path(parts: Path, task: Task) -> Path:
+    """
+    Get the path to which the results of a finished task are written.
+    :param parts: The directory to which the results of each task are written
+    :param task: The task
+    :return: The path to the part file
+    """
+    return parts / f"{task.id}.csv"
+
+
+def _copy_rows(src: TextIO, dst: TextIO) -> int:
+    """
+    Copy CSV rows between files unchanged, counting them as they are copied;
+    a quoted field may hold line breaks, so rows are counted by the parser.
+    """
+
+    def copied() -> Iterator[str]:
+        for line in src:
+            dst.write(line)
+            yield line
+
+    return sum(1 for _ in csv.reader(copied()))
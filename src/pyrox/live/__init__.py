@@ -0,0 +1,3 @@
+from .server import LiveServer
+
+__all__ = ["LiveServer"]
@@ -0,0 +1,110 @@
+"""
+Websocket server for live event tracking.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pyrox.models as models
+from pyrox.client.live import LiveTracker, LiveUpdate
+
+if TYPE_CHECKING:
+    from websockets.asyncio.server import ServerConnection
+
+
+class LiveServer:
+    """Poll a live tracker and broadcast its updates to websocket subscribers."""
+
+    def __init__(
+        self,
+        tracker: LiveTracker,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        interval: timedelta = timedelta(seconds=30),
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        # the tracker polled for updates
+        self.tracker = tracker
+        # the address on which the server listens
+        self.host = host
+        # the port on which the server listens
+        self.port = port
+        # the interval between polls
+        self.interval = interval
+        # logger instance
+        self.logger = logger
+
+        # the snapshot message sent to new subscribers, refreshed after each poll
+        self._snapshot: list[str] = []
+
+    def run(self) -> None:
+        """Run the server until interrupted."""
+        asyncio.run(self.serve())
+
+    async def serve(self) -> None:
+        """Serve subscribers and broadcast updates, forever."""
+        # imported on first use; only live tracking needs websockets
+        from websockets.asyncio.server import broadcast, serve
+
+        async with serve(self._subscribe, self.host, self.port) as server:
+            self.logger.info(f"serving live updates on ws://{self.host}:{self.port}")
+            while True:
+                try:
+                    updates = await asyncio.to_thread(self._poll)
+                except Exception as e:
+                    self.logger.warning(f"failed to poll for live updates: {e}")
+                    updates = []
+
+                for update in updates:
+                    broadcast(server.connections, _encode_update(update))
+                if len(updates) > 0:
+                    self.logger.info(
+                        f"broadcast {len(updates)} updates to {len(server.connections)} subscribers"
+                    )
+
+                await asyncio.sleep(self.interval.total_seconds())
+
+    def _poll(self) -> list[LiveUpdate]:
+        """Poll the tracker and refresh the snapshot, off the event loop."""
+        updates = self.tracker.poll()
+        event = self.tracker.event.model.canonical_name
+        self._snapshot = [
+            json.dumps(
+                {
+                    "type": "snapshot",
+                    "event": event,
+                    "division": str(division),
+                    "results": [_encode_result(r) for r in results],
+                }
+            )
+            for division, results in self.tracker.snapshot().items()
+        ]
+        return updates
+
+    async def _subscribe(self, connection: ServerConnection) -> None:
+        """Send the current snapshot to a new subscriber, then hold the connection."""
+        for message in self._snapshot:
+            await connection.send(message)
+        await connection.wait_closed()
+
+
+def _encode_update(update: LiveUpdate) -> str:
+    """Encode an update as a JSON message."""
+    return json.dumps(
+        {
+            "type": update.kind,
+            "event": update.event,
+            "division": str(update.division),
+            "result": _encode_result(update.result),
+        }
+    )
+
+
+def _encode_result(result: models.Result) -> dict[str, Any]:
+    """Encode a result as JSON-compatible data."""
+    return result.model_dump(mode="json")
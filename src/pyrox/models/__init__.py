@@ -1,8 +1,11 @@
+from .athlete import Athlete, AthleteRace
 from .division import Division, DivisionName
 from .event import Event
 from .result import AgeGroup, Result, Splits, Station
 
 __all__ = [
+    "Athlete",
+    "AthleteRace",
     "Event",
     "Division",
     "DivisionName",
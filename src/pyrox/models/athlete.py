@@ -0,0 +1,31 @@
+"""
+Object model.
+"""
+
+from datetime import timedelta
+
+from pydantic import BaseModel, HttpUrl
+
+
+class AthleteRace(BaseModel):
+    """A race listed on an athlete profile."""
+
+    # the name of the event, as it appears on the profile
+    event_name: str
+    # the division, as it appears on the profile; not always reported
+    division: str | None = None
+    # the finish time; not always reported
+    time: timedelta | None = None
+    # the link to the race analysis for the athlete
+    url: HttpUrl
+
+
+class Athlete(BaseModel):
+    """A Hyrox athlete, as described by their profile page."""
+
+    # the athlete name
+    name: str
+    # the link to the athlete profile
+    url: HttpUrl
+    # the races listed on the profile
+    races: list[AthleteRace] = []
@@ -7,7 +7,6 @@ from datetime import timedelta
 from enum import StrEnum
 from typing import Annotated
 
-import humanize
 from annotated_types import Len
 from pydantic import BaseModel, HttpUrl
 
@@ -77,6 +76,8 @@ class Splits(BaseModel):
 
     def pretty(self) -> str:
         """Return a pretty JSON-string representation."""
+        # imported on first use; humanize is slow to import
+        import humanize
 
         data = {
             "total": humanize.precisedelta(self.total_time),
@@ -0,0 +1,18 @@
+"""
+Athlete name normalization.
+"""
+
+import unicodedata
+
+
+def fold_name(name: str) -> str:
+    """
+    Fold an athlete name for matching: drop accents, case and punctuation.
+    :param name: The name
+    :return: The folded name
+    """
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    kept = (
+        c if c.isalnum() else " " for c in decomposed if not unicodedata.combining(c)
+    )
+    return " ".join("".join(kept).split())
@@ -0,0 +1,14 @@
+"""
+Unit tests for name normalization.
+"""
+
+from .name import fold_name
+
+
+def test_fold_name() -> None:
+    """Names fold case, accents and punctuation."""
+
+    assert fold_name("  José  GARCÍA-López ") == "jose garcia lopez"
+    assert fold_name("Hunter McIntyre") == fold_name("hunter mcintyre")
+    assert fold_name("Ægir Ørsted") == "ægir ørsted"
+    assert fold_name("--") == ""
@@ -0,0 +1,87 @@
+"""
+Scrape athlete information from an athlete profile page.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from pydantic import HttpUrl, ValidationError
+
+from pyrox.config import BASE_URL
+from pyrox.models import Athlete, AthleteRace
+
+from .base import BaseScraper
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
+# a finish time, e.g. 58:12 or 1:02:33
+_TIME = re.compile(r"^(\d+:)?\d{1,2}:\d{2}$")
+
+
+class AthleteScraper(BaseScraper):
+    """A class for scraping an athlete profile."""
+
+    def __init__(self, logger: logging.Logger) -> None:
+        super().__init__(logger)
+
+    def scrape(self, soup: BeautifulSoup, url: HttpUrl) -> Athlete:
+        """
+        Scrape and parse an athlete profile.
+        :param soup: The parsed profile page
+        :param url: The URL of the profile page
+        :raises: ValueError if the athlete name cannot be found
+        :return: The athlete
+        """
+        heading = soup.find("h1")
+        if heading is None:
+            raise ValueError("cannot parse athlete; missing name")
+
+        races: list[AthleteRace] = []
+        for row in soup.find_all("tr"):
+            # only rows that link to a race analysis describe a race
+            if row.find("a", href=re.compile("/result/")) is None:
+                continue
+            try:
+                races.append(_parse_row(row))
+            except (ValueError, ValidationError):
+                self.logger.warning("failed to parse race from row")
+                continue
+
+        return Athlete(name=heading.text.strip(), url=url, races=races)
+
+
+def _parse_row(tag: Tag) -> AthleteRace:
+    """
+    Parse a race from a row of the profile page.
+    :param tag: The input tag
+    :return: The parsed race
+    """
+    data = [td.text.strip() for td in tag.find_all("td")]
+    if len(data) < 1:
+        raise ValueError("cannot parse race from row; missing data")
+
+    a = tag.find("a", href=re.compile("/result/"))
+    if a is None:
+        raise ValueError("failed to find anchor tag")
+
+    times = [_parse_time(text) for text in data if _TIME.match(text)]
+    divisions = [text for text in data if text.upper().startswith("HYROX")]
+
+    return AthleteRace(
+        event_name=data[0],
+        division=divisions[-1] if len(divisions) > 0 else None,
+        time=times[0] if len(times) > 0 else None,
+        url=HttpUrl(f"{BASE_URL}{a['href']}"),
+    )
+
+
+def _parse_time(text: str) -> timedelta:
+    """Parse a finish time from its text."""
+    parts: list[str] = text.split(":")
+    parts = ["0"] + parts if len(parts) < 3 else parts
+    return timedelta(hours=int(parts[0]), minutes=int(parts[1]), seconds=int(parts[2]))
@@ -2,9 +2,58 @@
 The base scraper implementation.
 """
 
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+T = TypeVar("T")
 
 
 class BaseScraper:
     def __init__(self, logger: logging.Logger) -> None:
         self.logger = logger
+
+
+def make_soup(content: bytes) -> BeautifulSoup:
+    """
+    Parse raw page content for scraping.
+    :param content: The raw page content
+    :return: The parsed page
+    """
+    # imported on first use; bs4 is slow to import
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(content, "html.parser")
+
+
+def scrape_page(content: bytes, fn: Callable[[BeautifulSoup], T]) -> T:
+    """
+    Parse raw page content, scrape it, and release the parsed page.
+    Parsed pages are large and full of reference cycles, so the tree is
+    decomposed rather than left for the garbage collector; `fn` must return
+    only values copied out of the tree (str, int, models), never tags.
+    :param content: The raw page content
+    :param fn: Scrapes the parsed page
+    :return: The scraped value
+    """
+    soup = make_soup(content)
+    try:
+        return fn(soup)
+    finally:
+        release_soup(soup)
+
+
+def release_soup(soup: BeautifulSoup) -> None:
+    """
+    Decompose a parsed page, breaking its reference cycles.
+    :param soup: The parsed page; unusable afterwards
+    """
+    # the root is not linked to its first element, so decomposing the root alone
+    # leaves the elements beneath it to the garbage collector
+    for element in list(soup.contents):
+        element.decompose()
+    soup.decompose()
@@ -2,9 +2,11 @@
 Scrape division information from an event page.
 """
 
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup, Tag
 from pydantic import HttpUrl, ValidationError
 
 from pyrox.config import BASE_URL
@@ -12,6 +14,9 @@ from pyrox.models import Division, DivisionName
 
 from .base import BaseScraper
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
 
 class DivisionScraper(BaseScraper):
     """A class for scraping divisions."""
@@ -2,18 +2,22 @@
 Scrape events from the events page.
 """
 
+from __future__ import annotations
+
 import logging
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup, Tag
 from pydantic import HttpUrl
 
 from pyrox.config import BASE_URL
 from pyrox.models import Event
-from pyrox.parsers.date import DateParser
 
 from .base import BaseScraper
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
 
 class EventScraper(BaseScraper):
     """A class for scraping events."""
@@ -62,6 +66,9 @@ def _parse_date(tag: Tag | None) -> datetime | None:
     if tag is None:
         return None
 
+    # imported on first use; dateutil is slow to import
+    from pyrox.parsers.date import DateParser
+
     parser = DateParser()
     try:
         return parser.parse(tag.text)
@@ -0,0 +1,142 @@
+"""
+A process pool for scraping raw pages off the main interpreter.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from typing import Iterable, Iterator
+
+import pyrox.models as models
+from pyrox.io.writer import flatten_splits, unflatten_splits
+
+from .base import scrape_page
+from .result import ResultScraper
+from .splits import SplitsScraper
+
+# a compact result: (position, position_ag, name, age_group, time, url)
+ResultRow = tuple[int, int | None, str, str | None, int, str]
+
+# compact splits: 8 run seconds followed by 8 station seconds
+SplitsRow = tuple[int, ...]
+
+
+class ScrapePool:
+    """A pool of worker processes that run the scrapers on raw page content."""
+
+    def __init__(self, workers: int | None = None, chunksize: int = 8) -> None:
+        # the number of worker processes
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        # the number of pages sent to a worker at once by the batch methods
+        self.chunksize = chunksize
+        # the underlying executor, created on first use
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "ScrapePool":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def scrape_results(self, content: bytes) -> list[models.Result]:
+        """
+        Scrape the rankings from a single ranking page.
+        :param content: The raw page content
+        :return: The rankings on the page
+        """
+        rows = self._pool().submit(_scrape_results, content).result()
+        return [_result_from_row(row) for row in rows]
+
+    def scrape_splits(self, content: bytes) -> models.Splits:
+        """
+        Scrape the splits from a single analysis page.
+        :param content: The raw page content
+        :raises: ValueError if the splits are not available
+        :return: The splits
+        """
+        row = self._pool().submit(_scrape_splits, content).result()
+        if row is None:
+            raise ValueError("failed to scrape splits")
+        return _splits_from_row(row)
+
+    def map_results(self, pages: Iterable[bytes]) -> Iterator[list[models.Result]]:
+        """
+        Scrape the rankings from many ranking pages, in order.
+        :param pages: The raw page content
+        :return: An iterator over the rankings on each page
+        """
+        for rows in self._pool().map(_scrape_results, pages, chunksize=self.chunksize):
+            yield [_result_from_row(row) for row in rows]
+
+    def map_splits(self, pages: Iterable[bytes]) -> Iterator[models.Splits | None]:
+        """
+        Scrape the splits from many analysis pages, in order.
+        :param pages: The raw page content
+        :return: An iterator over the splits on each page, `None` if unavailable
+        """
+        for row in self._pool().map(_scrape_splits, pages, chunksize=self.chunksize):
+            yield _splits_from_row(row) if row is not None else None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """Get the underlying executor, starting it if necessary."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+
+# -----------------------------------------------------------------------------
+# Worker Functions
+# -----------------------------------------------------------------------------
+
+
+def _scrape_results(content: bytes) -> list[ResultRow]:
+    """Scrape a ranking page to compact rows, in a worker process."""
+    scraper = ResultScraper(logging.getLogger(__name__))
+    return [
+        (
+            r.position,
+            r.position_ag,
+            r.name,
+            str(r.age_group) if r.age_group is not None else None,
+            int(r.time.total_seconds()),
+            str(r.url),
+        )
+        for r in scrape_page(content, scraper.scrape)
+    ]
+
+
+def _scrape_splits(content: bytes) -> SplitsRow | None:
+    """Scrape an analysis page to a compact row, in a worker process."""
+    scraper = SplitsScraper(logging.getLogger(__name__))
+    try:
+        splits = scrape_page(content, scraper.scrape)
+    except ValueError:
+        return None
+    return tuple(flatten_splits(splits))
+
+
+def _result_from_row(row: ResultRow) -> models.Result:
+    """Rebuild a result from its compact row."""
+    position, position_ag, name, age_group, time, url = row
+    return models.Result.model_validate(
+        {
+            "position": position,
+            "position_ag": position_ag,
+            "name": name,
+            "age_group": age_group,
+            "time": timedelta(seconds=time),
+            "url": url,
+        }
+    )
+
+
+def _splits_from_row(row: SplitsRow) -> models.Splits:
+    """Rebuild splits from their compact row."""
+    return unflatten_splits(row)
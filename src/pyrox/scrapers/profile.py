@@ -0,0 +1,36 @@
+"""
+Scrape the athlete profile URL from a result overview page.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from pydantic import HttpUrl
+
+from pyrox.config import BASE_URL
+
+from .base import BaseScraper
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+
+class ProfileScraper(BaseScraper):
+    """A class for scraping the athlete profile URL from a result."""
+
+    def __init__(self, logger: logging.Logger) -> None:
+        super().__init__(logger)
+
+    def scrape(self, soup: BeautifulSoup) -> HttpUrl:
+        """
+        Scrape and parse the athlete profile URL.
+        :raises: ValueError if the profile URL cannot be found
+        :return: The profile URL
+        """
+        matches = [a["href"] for a in soup.find_all("a") if "/athlete/" in a["href"]]
+        if len(matches) == 0:
+            raise ValueError("could not locate athlete profile URL")
+
+        return HttpUrl(f"{BASE_URL}{matches[0]}")
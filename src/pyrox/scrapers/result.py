@@ -2,10 +2,12 @@
 Scrape ranking information from the ranking page.
 """
 
+from __future__ import annotations
+
 import logging
 from datetime import timedelta
+from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup, Tag
 from pydantic import HttpUrl, ValidationError
 
 from pyrox.config import BASE_URL
@@ -13,6 +15,9 @@ from pyrox.models import AgeGroup, Result
 
 from .base import BaseScraper
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
 
 class ResultScraper(BaseScraper):
     """A class for scraping results from an individual race."""
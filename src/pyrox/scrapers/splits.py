@@ -2,15 +2,19 @@
 Result scraper.
 """
 
+from __future__ import annotations
+
 import logging
 from datetime import timedelta
-
-from bs4 import BeautifulSoup, Tag
+from typing import TYPE_CHECKING
 
 from pyrox.models import Splits, Station
 
 from .base import BaseScraper
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
 
 class SplitsScraper(BaseScraper):
     """A class for scraping splits from an individual analysis page."""
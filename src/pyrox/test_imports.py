@@ -0,0 +1,58 @@
+"""
+Unit tests for import-time dependencies.
+"""
+
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+# dependencies that must only be imported on first use
+HEAVY = ["requests", "bs4", "dateutil", "humanize"]
+
+# the package entry points
+ENTRY_POINTS = ["pyrox.client", "pyrox.models", "pyrox.cli"]
+
+# the budget for the median import time of each entry point, in milliseconds;
+# about twice the time on a laptop, so only a real regression exceeds it
+BUDGET_MS = 500
+
+# the number of fresh interpreters in which import time is measured
+_RUNS = 3
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_import_is_lazy(module: str) -> None:
+    """Importing the package does not import heavy dependencies."""
+
+    code = f"import sys, {module}; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_import_is_within_budget(module: str) -> None:
+    """Importing the package takes less than the budget; timing-dependent, so slow."""
+
+    median = statistics.median(_import_time(module) for _ in range(_RUNS))
+    assert median / 1000 < BUDGET_MS, f"import {module} took {median / 1000:.1f}ms"
+
+
+def _import_time(module: str) -> int:
+    """Measure the cumulative import time of `module` in a fresh interpreter, in us."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines are: "import time: <self> | <cumulative> | <module>"
+    for line in out.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise RuntimeError(f"no import time reported for {module}")
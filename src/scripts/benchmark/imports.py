@@ -0,0 +1,46 @@
+"""
+Benchmark import time of the package entry points, via `python -X importtime`.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+def import_time(module: str) -> int:
+    """Measure the cumulative import time of `module` in a fresh interpreter, in us."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines are: "import time: <self> | <cumulative> | <module>"
+    for line in out.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10, help="runs per module")
+    parser.add_argument(
+        "--budget-ms", type=float, default=None, help="fail above this median"
+    )
+    args = parser.parse_args()
+
+    ok = True
+    for module in ["pyrox.client", "pyrox.models", "pyrox.cli"]:
+        median = statistics.median(import_time(module) for _ in range(args.runs))
+        print(f"{module}: {median / 1000:.1f}ms")
+        if args.budget_ms is not None and median / 1000 > args.budget_ms:
+            ok = False
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
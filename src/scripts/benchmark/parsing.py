@@ -0,0 +1,77 @@
+"""
+Benchmark scraping of ranking and splits pages, serially and with a process pool.
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from pyrox.scrapers.pool import ScrapePool
+from pyrox.scrapers.result import ResultScraper
+from pyrox.scrapers.splits import SplitsScraper
+
+
+def ranking_page(page: int, size: int = 50) -> bytes:
+    """Generate a synthetic ranking page."""
+    rows = [
+        '<tr class="border-t"><td></td>'
+        f"<td>{i}</td><td>{i}</td><td>Athlete {i}</td><td>30-34</td>"
+        f'<td>1:{i % 60:02d}:{i % 60:02d}</td><td><a href="/result/R{i}">R</a></td></tr>'
+        for i in range((page - 1) * size + 1, page * size + 1)
+    ]
+    return f"<html><body><table>{''.join(rows)}</table></body></html>".encode()
+
+
+def splits_page() -> bytes:
+    """Generate a synthetic analysis page with a full splits table."""
+    roxzone = '<tr class="border-b"><td>Roxzone</td><td>0:30</td></tr>'
+    rows = ['<tr class="border-b"><td>Roxzone In</td><td>0:30</td></tr>']
+    for i in range(8):
+        rows.append(f'<tr class="border-b"><td>Run {i + 1}</td><td>4:0{i}</td></tr>')
+        rows.append(roxzone)
+        rows.append(f'<tr class="border-b"><td>Station {i}</td><td>3:0{i}</td></tr>')
+        if i < 6:
+            rows.append(roxzone)
+    return f"<html><body><table>{''.join(rows)}</table></body></html>".encode()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200, help="number of pages")
+    parser.add_argument("--workers", type=int, default=None, help="pool workers")
+    parser.add_argument("--chunksize", type=int, default=8, help="pages per task")
+    args = parser.parse_args()
+
+    logger = logging.getLogger(__name__)
+    rankings = [ranking_page(p + 1) for p in range(args.pages)]
+    splits = [splits_page()] * args.pages
+
+    start = time.perf_counter()
+    rs = ResultScraper(logger)
+    ss = SplitsScraper(logger)
+    for content in rankings:
+        rs.scrape(BeautifulSoup(content, "html.parser"))
+    for content in splits:
+        ss.scrape(BeautifulSoup(content, "html.parser"))
+    serial = time.perf_counter() - start
+    print(f"serial:   {serial:.3f}s ({2 * args.pages / serial:.1f} pages/s)")
+
+    with ScrapePool(args.workers, args.chunksize) as pool:
+        start = time.perf_counter()
+        for _ in pool.map_results(rankings):
+            pass
+        for _ in pool.map_splits(splits):
+            pass
+        pooled = time.perf_counter() - start
+    print(
+        f"pool({pool.workers}): {pooled:.3f}s ({2 * args.pages / pooled:.1f} pages/s)"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
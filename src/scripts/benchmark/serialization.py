@@ -0,0 +1,137 @@
+"""
+Benchmark writing results to CSV, against a reference row-by-row serializer.
+"""
+
+import argparse
+import csv
+import hashlib
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterable
+
+from pydantic import HttpUrl
+
+import pyrox.models as models
+from pyrox.io.writer import COLUMNS, ResultsSink
+
+
+def synthetic_results(n: int, distinct: int = 1000) -> list[models.Result]:
+    """Generate `n` synthetic results, cycling through `distinct` varied ones."""
+    pool = []
+    for i in range(distinct):
+        splits = (
+            models.Splits.model_construct(
+                runs=[timedelta(seconds=240 + (i + k) % 60) for k in range(8)],
+                stations={
+                    name: timedelta(seconds=180 + (i * k) % 90)
+                    for k, name in enumerate(models.Station)
+                },
+            )
+            if i % 4 != 0
+            else None
+        )
+        pool.append(
+            models.Result.model_construct(
+                position=i + 1,
+                position_ag=i // 3 + 1 if i % 5 != 0 else None,
+                # some names need quoting
+                name=f'Athlete "{i}", Jr' if i % 50 == 0 else f"Athlete {i}",
+                age_group=models.AgeGroup.AG_30_34 if i % 7 != 0 else None,
+                time=timedelta(seconds=3600 + i),
+                url=HttpUrl(f"https://www.hyresult.com/result/R{i}"),
+                splits=splits,
+                profile=(
+                    HttpUrl(f"https://www.hyresult.com/athlete/A{i}")
+                    if i % 3 == 0
+                    else None
+                ),
+            )
+        )
+    return [pool[i % distinct] for i in range(n)]
+
+
+def reference_write(
+    path: Path,
+    event: str,
+    division: models.DivisionName,
+    results: Iterable[models.Result],
+) -> None:
+    """Write results the way the writer did before its serialization was optimized."""
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows([reference_row(event, division, r) for r in results])
+
+
+def reference_row(
+    event: str, division: models.DivisionName, r: models.Result
+) -> list[str]:
+    """Serialize a row by building, concatenating and stringifying per-field lists."""
+    run_splits = (
+        [str(split.seconds) for split in r.splits.runs]
+        if r.splits is not None
+        else [str(0)] * 8
+    )
+    station_splits = (
+        [str(r.splits.stations[name].seconds) for name in models.Station]
+        if r.splits is not None
+        else [str(0)] * 8
+    )
+    return (
+        [event, str(division)]
+        + [
+            r.name,
+            str(r.age_group) if r.age_group is not None else "unknown",
+            str(r.position),
+            str(r.position_ag) if r.position_ag is not None else "unknown",
+            str(r.time.seconds),
+            str(r.url),
+            "true" if r.splits is not None else "false",
+        ]
+        + run_splits
+        + station_splits
+        + [
+            "true" if r.profile is not None else "false",
+            str(r.profile) if r.profile is not None else "n/a",
+        ]
+    )
+
+
+def digest(path: Path) -> str:
+    """Hash a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows written")
+    args = parser.parse_args()
+
+    results = synthetic_results(args.rows)
+    event, division = "chicago_2025", models.DivisionName.PRO_MEN
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reference = Path(tmp) / "reference.csv"
+        start = time.perf_counter()
+        reference_write(reference, event, division, results)
+        before = time.perf_counter() - start
+
+        optimized = Path(tmp) / "optimized.csv"
+        start = time.perf_counter()
+        with ResultsSink(optimized) as sink:
+            sink.write(event, division, results)
+        after = time.perf_counter() - start
+
+        identical = digest(reference) == digest(optimized)
+
+    print(f"reference: {before:.2f}s ({args.rows / before:,.0f} rows/s)")
+    print(f"writer:    {after:.2f}s ({args.rows / after:,.0f} rows/s)")
+    print(f"speedup: {before / after:.2f}x, byte-identical: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())